@@ -0,0 +1,16 @@
+from senzing import SzError
+
+from senzing_grpc import SzAbstractFactoryGrpc, SzAbstractFactoryParametersGrpc
+
+factory_parameters: SzAbstractFactoryParametersGrpc = {
+    "grpc_targets": [("sz-grpc-server-1:8261", 2), ("sz-grpc-server-2:8261", 1)],
+    "health_check_interval": 5.0,
+    "ejection_seconds": 30.0,
+}
+
+try:
+    with SzAbstractFactoryGrpc(**factory_parameters) as sz_abstract_factory:
+        sz_engine = sz_abstract_factory.create_engine()
+        print(sz_engine.get_active_config_id())
+except SzError as err:
+    print(f"\nERROR: {err}\n")
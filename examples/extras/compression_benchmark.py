@@ -0,0 +1,110 @@
+import json
+import time
+import zlib
+from collections import defaultdict
+from typing import Any, Callable, Dict, List
+
+import grpc
+from senzing import SZ_WITHOUT_INFO, SzEngineFlags, SzError
+
+from senzing_grpc import SzAbstractFactoryGrpc, SzCompressionPolicy
+
+RECORDS = 20
+GZIP_WBITS = 31
+DEFLATE_WBITS = 15
+
+# The request messages and the serialized requests and responses of every call, by method.
+
+requests: Dict[str, List[Any]] = defaultdict(list)
+messages: Dict[str, List[bytes]] = defaultdict(list)
+
+
+class Recorder(grpc.UnaryUnaryClientInterceptor, grpc.UnaryStreamClientInterceptor):  # type: ignore[misc]
+    """Keeps the requests and responses of every call."""
+
+    def intercept_unary_unary(self, continuation: Callable[..., Any], client_call_details: Any, request: Any) -> Any:
+        outcome = continuation(client_call_details, request)
+        self.record(client_call_details.method, request, [outcome.result()])
+        return outcome
+
+    def intercept_unary_stream(self, continuation: Callable[..., Any], client_call_details: Any, request: Any) -> Any:
+        responses = list(continuation(client_call_details, request))
+        self.record(client_call_details.method, request, responses)
+        return iter(responses)
+
+    def record(self, method: str, request: Any, responses: List[Any]) -> None:
+        requests[method].append(request)
+        messages[method].extend(message.SerializeToString() for message in [request, *responses])
+
+
+def workload(sz_abstract_factory: SzAbstractFactoryGrpc) -> None:
+    sz_configmanager = sz_abstract_factory.create_configmanager()
+    sz_engine = sz_abstract_factory.create_engine()
+    sz_configmanager.get_config(sz_configmanager.get_default_config_id())
+    sz_configmanager.get_template_config()
+    for i in range(RECORDS):
+        record = {"NAME_FULL": f"Robert Smith {i % 5}", "ADDR_FULL": f"{i} Main Street, Las Vegas NV 89132"}
+        sz_engine.add_record("TEST", f"COMPRESSION-{i}", json.dumps(record), SZ_WITHOUT_INFO)
+    entity_ids = [
+        json.loads(sz_engine.get_entity_by_record_id("TEST", f"COMPRESSION-{i}"))["RESOLVED_ENTITY"]["ENTITY_ID"]
+        for i in range(RECORDS)
+    ]
+    sz_engine.find_network_by_entity_id(entity_ids[:2], 2, 1, 10, SzEngineFlags.SZ_FIND_NETWORK_DEFAULT_FLAGS)
+    sz_engine.why_entities(entity_ids[0], entity_ids[1])
+    list(sz_engine.export_json_entity_report_iterator())
+    for i in range(RECORDS):
+        sz_engine.delete_record("TEST", f"COMPRESSION-{i}", SZ_WITHOUT_INFO)
+
+
+def compress(message: bytes, wbits: int) -> bytes:
+    """Compress as gRPC does: gzip is wbits 31, deflate is a zlib stream, wbits 15."""
+    compressor = zlib.compressobj(wbits=wbits)
+    return compressor.compress(message) + compressor.flush()
+
+
+def cpu_microseconds(method_messages: List[bytes], wbits: int) -> float:
+    """Microseconds per call to compress and decompress its messages."""
+    start = time.perf_counter()
+    for message in method_messages:
+        zlib.decompress(compress(message, wbits), wbits)
+    return (time.perf_counter() - start) * 1_000_000
+
+
+def seconds(sz_abstract_factory: SzAbstractFactoryGrpc) -> float:
+    start = time.perf_counter()
+    workload(sz_abstract_factory)
+    return time.perf_counter() - start
+
+
+try:
+    grpc_channel = grpc.insecure_channel("localhost:8261")
+
+    # Bytes on the wire and CPU cost per call of each method, uncompressed, gzip and deflate.
+
+    workload(SzAbstractFactoryGrpc(grpc.intercept_channel(grpc_channel, Recorder())))
+    policy = SzCompressionPolicy()
+    print(
+        f"\n{'Method':<52} {'Calls':>5} {'Policy':>14}"
+        f" {'Bytes':>9} {'Gzip':>9} {'Deflate':>9} {'Gzip µs':>9} {'Deflate µs':>10}"
+    )
+    for method_name in sorted(messages):
+        calls = len(requests[method_name])
+        chosen = policy.compression_for(method_name, requests[method_name][0]).name
+        raw = sum(len(message) for message in messages[method_name]) // calls
+        gzip = sum(len(compress(message, GZIP_WBITS)) for message in messages[method_name]) // calls
+        deflate = sum(len(compress(message, DEFLATE_WBITS)) for message in messages[method_name]) // calls
+        gzip_cpu = cpu_microseconds(messages[method_name], GZIP_WBITS) / calls
+        deflate_cpu = cpu_microseconds(messages[method_name], DEFLATE_WBITS) / calls
+        print(
+            f"{method_name:<52} {calls:>5} {chosen:>14}"
+            f" {raw:>9} {gzip:>9} {deflate:>9} {gzip_cpu:>9.1f} {deflate_cpu:>10.1f}"
+        )
+
+    # Wall time of the whole workload without and with the default policy.
+
+    without_policy = seconds(SzAbstractFactoryGrpc(grpc_channel))
+    with_policy = seconds(SzAbstractFactoryGrpc(grpc_channel, compression=policy))
+    print(f"\nWithout compression: {without_policy:.3f}s, with SzCompressionPolicy(): {with_policy:.3f}s")
+    print(f"Calls compressed: {policy.stats()}\n")
+except SzError as err:
+    print(f"\nERROR: {err}\n")
@@ -18,13 +18,13 @@ try:
     grpc_channel = grpc.insecure_channel("localhost:8261")
     sz_abstract_factory = SzAbstractFactoryGrpc(grpc_channel)
     sz_engine = sz_abstract_factory.create_engine()
-    for record_set in record_sets:
-        for record in record_set.values():
-            sz_engine.add_record(
-                record.get("DataSource"),
-                record.get("Id"),
-                record.get("Json"),
-                SZ_WITHOUT_INFO,
-            )
+    records = (
+        (record.get("DataSource"), record.get("Id"), record.get("Json"))
+        for record_set in record_sets
+        for record in record_set.values()
+    )
+    for add_result in sz_engine.add_records(records, SZ_WITHOUT_INFO, max_in_flight=64):
+        if add_result.error:
+            print(f"\nERROR: {add_result.data_source_code} {add_result.record_id}: {add_result.error}\n")
 except SzError as err:
     print(f"\nERROR: {err}\n")
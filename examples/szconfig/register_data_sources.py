@@ -0,0 +1,18 @@
+import grpc
+from senzing import SzError
+
+from senzing_grpc import SzConfigManagerGrpc
+
+data_source_codes = [f"DATASOURCE_{i}" for i in range(300)]
+
+try:
+    grpc_channel = grpc.insecure_channel("localhost:8261")
+    sz_configmanager = SzConfigManagerGrpc(grpc_channel)
+    sz_config = sz_configmanager.create_config_from_template()
+    results = sz_config.register_data_sources(data_source_codes)
+    stats = sz_config.stats()
+    print(f"\nRegistered {len(results)} data sources")
+    print(f"Sent {stats['bytes_sent']} bytes in {stats['round_trips']} calls")
+    print(f"One by one: {stats['bytes_sent_one_by_one']} bytes in {stats['round_trips_one_by_one']} calls\n")
+except SzError as err:
+    print(f"\nERROR: {err}\n")
@@ -1,16 +1,67 @@
+from .channelpool import (
+    HEDGEABLE_METHODS,
+    LEAST_OUTSTANDING,
+    ROUND_ROBIN,
+    ChannelPool,
+)
 from .szabstractfactory import SzAbstractFactoryGrpc, SzAbstractFactoryParametersGrpc
+from .szabstractfactoryasync import (
+    SzAbstractFactoryGrpcAsync,
+    SzAbstractFactoryParametersGrpcAsync,
+)
+from .szcompression import LARGE_RESPONSE_METHODS, SzCompressionPolicy
 from .szconfig import SzConfigGrpc
+from .szconfigasync import SzConfigGrpcAsync
+from .szconfigcache import SzConfigCache
 from .szconfigmanager import SzConfigManagerGrpc
+from .szconfigmanagerasync import SzConfigManagerGrpcAsync
+from .szdeadline import SzDeadlines, deadline
 from .szdiagnostic import SzDiagnosticGrpc
+from .szdiagnosticasync import SzDiagnosticGrpcAsync
 from .szengine import SzEngineGrpc
+from .szengineasync import SzEngineGrpcAsync
+from .szentitycache import SzEntityCache
+from .szerror import SzDeadlineExceededError
+from .szexport import SzExportIterator, SzExportResult
+from .szload import SzInputRecord, SzLoadStats
 from .szproduct import SzProductGrpc
+from .szproductasync import SzProductGrpcAsync
+from .szredo import SzRedoProcessor
+from .szretry import SzRetryPolicy
+from .szsingleflight import COALESCED_METHODS, SzSingleFlight
 
 __all__ = [
+    "COALESCED_METHODS",
+    "ChannelPool",
+    "HEDGEABLE_METHODS",
+    "LARGE_RESPONSE_METHODS",
+    "LEAST_OUTSTANDING",
+    "ROUND_ROBIN",
     "SzAbstractFactoryGrpc",
+    "SzAbstractFactoryGrpcAsync",
     "SzAbstractFactoryParametersGrpc",
+    "SzAbstractFactoryParametersGrpcAsync",
+    "SzCompressionPolicy",
+    "SzConfigCache",
     "SzConfigGrpc",
+    "SzConfigGrpcAsync",
     "SzConfigManagerGrpc",
+    "SzConfigManagerGrpcAsync",
+    "SzDeadlineExceededError",
+    "SzDeadlines",
     "SzDiagnosticGrpc",
+    "SzDiagnosticGrpcAsync",
     "SzEngineGrpc",
+    "SzEngineGrpcAsync",
+    "SzEntityCache",
+    "SzExportIterator",
+    "SzExportResult",
+    "SzInputRecord",
+    "SzLoadStats",
     "SzProductGrpc",
+    "SzProductGrpcAsync",
+    "SzRedoProcessor",
+    "SzRetryPolicy",
+    "SzSingleFlight",
+    "deadline",
 ]
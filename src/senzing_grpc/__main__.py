@@ -0,0 +1,11 @@
+#! /usr/bin/env python3
+
+"""
+``python -m senzing_grpc load``: see ``senzing_grpc.szload``.
+"""
+
+import sys
+
+from .szload import main
+
+sys.exit(main())
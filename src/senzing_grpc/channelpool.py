@@ -0,0 +1,848 @@
+#! /usr/bin/env python3
+
+"""
+``senzing_grpc.channelpool.ChannelPool`` is a `gRPC`_ channel that spreads calls
+over several underlying channels.
+
+A single ``grpc.Channel`` is one HTTP/2 connection, so it is limited by the server's
+maximum concurrent streams and by one TCP window.
+A ``ChannelPool`` opens ``size`` separate connections and routes each call to one of them.
+Given several servers, it also balances calls across them by weight and skips servers that are unavailable.
+It is a ``grpc.Channel``, so it can be passed wherever a channel is accepted,
+for example ``SzAbstractFactoryGrpc(grpc_channel=ChannelPool("localhost:8261", size=8))``.
+
+.. _gRPC: https://grpc.io
+"""
+
+# pylint: disable=R0902,R0903,W0221
+
+import bisect
+import hashlib
+import heapq
+import itertools
+import threading
+import time
+from collections import deque
+from types import TracebackType
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+)
+
+import grpc
+
+from .szhelpers import CompositeCall
+
+# Metadata
+
+__all__ = ["HEDGEABLE_METHODS", "LEAST_OUTSTANDING", "ROUND_ROBIN", "ChannelPool"]
+__version__ = "0.0.1"  # See https://www.python.org/dev/peps/pep-0396/
+__date__ = "2026-10-18"
+__updated__ = "2026-10-18"
+
+ROUND_ROBIN = "round_robin"
+"""Send each call to the next subchannel in turn."""
+
+LEAST_OUTSTANDING = "least_outstanding"
+"""Send each call to the subchannel with the fewest calls in progress."""
+
+POLICIES = (ROUND_ROBIN, LEAST_OUTSTANDING)
+
+EJECTION_SECONDS = 30.0
+"""How long a server that returned ``UNAVAILABLE`` is skipped, unless set otherwise."""
+
+RECORD_METHODS = frozenset(
+    [
+        "/szengine.SzEngine/AddRecord",
+        "/szengine.SzEngine/DeleteRecord",
+        "/szengine.SzEngine/ReevaluateRecord",
+    ]
+)
+"""Methods routed by record key when record_affinity is enabled."""
+
+RING_POINTS_PER_WEIGHT = 100
+
+HEDGEABLE_METHODS = frozenset(
+    [
+        "/szengine.SzEngine/FindInterestingEntitiesByEntityId",
+        "/szengine.SzEngine/FindInterestingEntitiesByRecordId",
+        "/szengine.SzEngine/FindNetworkByEntityId",
+        "/szengine.SzEngine/FindNetworkByRecordId",
+        "/szengine.SzEngine/FindPathByEntityId",
+        "/szengine.SzEngine/FindPathByRecordId",
+        "/szengine.SzEngine/GetEntityByEntityId",
+        "/szengine.SzEngine/GetEntityByRecordId",
+        "/szengine.SzEngine/GetRecord",
+        "/szengine.SzEngine/GetRecordPreview",
+        "/szengine.SzEngine/GetVirtualEntityByRecordId",
+        "/szengine.SzEngine/HowEntityByEntityId",
+        "/szengine.SzEngine/SearchByAttributes",
+        "/szengine.SzEngine/WhyEntities",
+        "/szengine.SzEngine/WhyRecordInEntity",
+        "/szengine.SzEngine/WhyRecords",
+        "/szengine.SzEngine/WhySearch",
+    ]
+)
+"""Read-only methods that may be hedged. Methods that change the repository are never hedged."""
+
+HEDGE_MIN_SAMPLES = 20
+HEDGE_REFRESH_SAMPLES = 50
+HEDGE_WINDOW = 1000
+
+# -----------------------------------------------------------------------------
+# Target and Subchannel classes
+# -----------------------------------------------------------------------------
+
+
+class Target:
+    """
+    One server in a ChannelPool, its weight and its ejection state.
+
+    :meta private:
+    """
+
+    def __init__(self, address: str, weight: int) -> None:
+        self.address = address
+        self.weight = weight
+        self.ejected_until = 0.0
+        self.ejections = 0
+
+    def is_ejected(self, now: float) -> bool:
+        return now < self.ejected_until
+
+
+class Subchannel:
+    """
+    One connection in a ChannelPool and its bookkeeping.
+
+    :meta private:
+    """
+
+    def __init__(self, target: Target, channel: grpc.Channel) -> None:
+        self.target = target
+        self.channel = channel
+        self.outstanding = 0
+        self.calls = 0
+
+
+# -----------------------------------------------------------------------------
+# ChannelPool class
+# -----------------------------------------------------------------------------
+
+
+class ChannelPool(grpc.Channel):  # type: ignore[misc]
+    """
+    A ``grpc.Channel`` backed by ``size`` independent connections to each of one or more servers.
+
+    With several servers, e.g. replicas of the gRPC server in front of the same Senzing repository,
+    each call goes to a server chosen in proportion to its weight.
+    A server whose call fails with ``UNAVAILABLE`` is ejected for ``ejection_seconds``
+    and receives no calls until then, unless every server is ejected.
+    If ``health_check_interval`` is set, a background thread probes each server at that interval,
+    ejecting servers that fail the probe and readmitting ejected servers that pass it.
+
+    Args:
+        target (Union[str, Sequence[Union[str, Tuple[str, int]]]]): A server address, e.g. "localhost:8261",
+            or a list of addresses or (address, weight) tuples. The default weight is 1.
+        size (int, optional): Number of connections to open to each server. Defaults to 4.
+        policy (str, optional): ROUND_ROBIN or LEAST_OUTSTANDING. Defaults to ROUND_ROBIN.
+        credentials (grpc.ChannelCredentials, optional): If given, secure channels are opened. Defaults to None.
+        options (Sequence[Tuple[str, Any]], optional): gRPC channel arguments for every connection. Defaults to None.
+        ejection_seconds (float, optional): How long a server that returned ``UNAVAILABLE`` is skipped. Defaults to 30.0.
+        health_check_interval (float, optional): Seconds between health probes. Defaults to None, no probing.
+        health_check (Callable[[grpc.Channel], bool], optional): Returns True if the server behind the channel is healthy.
+            Defaults to waiting up to one second for the channel to be ready.
+        record_affinity (bool, optional): If True, ``AddRecord``, ``DeleteRecord`` and ``ReevaluateRecord``
+            calls are sent to a server chosen by consistent hashing of the (data source code, record id),
+            so all changes to a record go to the same server. Other calls are balanced as usual. Defaults to False.
+        hedged_methods (Iterable[str], optional): Full method names to hedge, a subset of HEDGEABLE_METHODS.
+            If a call to one of them has not completed after the ``hedge_percentile`` latency of its recent calls,
+            a second attempt is sent to another server, or another connection if there is one server.
+            The first response is used and the other attempt is cancelled. Defaults to None, no hedging.
+        hedge_percentile (float, optional): Percentile of recent latencies to wait before hedging. Defaults to 95.0.
+        hedge_min_delay (float, optional): Shortest wait in seconds before hedging. Defaults to 0.005.
+    """
+
+    # -------------------------------------------------------------------------
+    # Python dunder/magic methods
+    # -------------------------------------------------------------------------
+
+    def __init__(
+        self,
+        target: Union[str, Sequence[Union[str, Tuple[str, int]]]],
+        size: int = 4,
+        policy: str = ROUND_ROBIN,
+        credentials: Optional[grpc.ChannelCredentials] = None,
+        options: Optional[Sequence[Tuple[str, Any]]] = None,
+        ejection_seconds: float = EJECTION_SECONDS,
+        health_check_interval: Optional[float] = None,
+        health_check: Optional[Callable[[grpc.Channel], bool]] = None,
+        record_affinity: bool = False,
+        hedged_methods: Optional[Iterable[str]] = None,
+        hedge_percentile: float = 95.0,
+        hedge_min_delay: float = 0.005,
+    ) -> None:
+        """
+        Constructor
+
+        For return value of -> None, see https://peps.python.org/pep-0484/#the-meaning-of-annotations
+        """
+        if size < 1:
+            raise ValueError(f"size must be at least 1, not {size}")
+        if policy not in POLICIES:
+            raise ValueError(f"policy must be one of {POLICIES}, not {policy}")
+
+        hedged_methods = frozenset(hedged_methods or [])
+        if not hedged_methods <= HEDGEABLE_METHODS:
+            raise ValueError(f"methods cannot be hedged: {sorted(hedged_methods - HEDGEABLE_METHODS)}")
+        if not 0 < hedge_percentile < 100:
+            raise ValueError(f"hedge_percentile must be between 0 and 100, not {hedge_percentile}")
+
+        self.policy = policy
+        self.ejection_seconds = ejection_seconds
+        self.health_check = health_check or is_channel_ready
+        self.lock = threading.Lock()
+        self.round_robin = itertools.count()
+        self.targets = new_targets(target)
+
+        # A local subchannel pool stops gRPC from sharing one connection between identical channels.
+
+        channel_options = list(options or []) + [("grpc.use_local_subchannel_pool", 1)]
+        self.subchannels = [
+            Subchannel(each_target, new_channel(each_target.address, credentials, channel_options))
+            for each_target in self.targets
+            for _ in range(size)
+        ]
+        self.schedule = new_schedule(self.subchannels)
+        self.record_affinity = record_affinity
+        self.ring = new_ring(self.targets)
+        self.ring_hashes = [point for point, _ in self.ring]
+        self.hedge_min_delay = hedge_min_delay
+        self.latencies = {method: LatencyTracker(hedge_percentile) for method in hedged_methods}
+        self.hedge_counters = {"hedged_calls": 0, "hedges": 0, "hedges_won": 0}
+        self.scheduler = Scheduler()
+
+        self.closed = threading.Event()
+        self.health_checker: Optional[threading.Thread] = None
+        if health_check_interval:
+            self.health_checker = threading.Thread(
+                target=self.check_health_forever, args=(health_check_interval,), daemon=True
+            )
+            self.health_checker.start()
+
+    def __enter__(
+        self,
+    ) -> Any:  # TODO: Replace "Any" with "Self" once python 3.11 is lowest supported python version.
+        """Context Manager method."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Union[Type[BaseException], None],
+        exc_val: Union[BaseException, None],
+        exc_tb: Union[TracebackType, None],
+    ) -> None:
+        """Context Manager method."""
+        self.close()
+
+    # -------------------------------------------------------------------------
+    # grpc.Channel methods
+    # -------------------------------------------------------------------------
+
+    def close(self) -> None:
+        self.closed.set()
+        self.scheduler.close()
+        if self.health_checker and self.health_checker is not threading.current_thread():
+            self.health_checker.join()
+        for subchannel in self.subchannels:
+            subchannel.channel.close()
+
+    def stream_stream(
+        self,
+        method: str,
+        request_serializer: Optional[Callable[..., Any]] = None,
+        response_deserializer: Optional[Callable[..., Any]] = None,
+        _registered_method: bool = False,
+    ) -> grpc.StreamStreamMultiCallable:
+        return PooledStreamCallable(self, "stream_stream", method, request_serializer, response_deserializer)
+
+    def stream_unary(
+        self,
+        method: str,
+        request_serializer: Optional[Callable[..., Any]] = None,
+        response_deserializer: Optional[Callable[..., Any]] = None,
+        _registered_method: bool = False,
+    ) -> grpc.StreamUnaryMultiCallable:
+        return PooledUnaryCallable(self, "stream_unary", method, request_serializer, response_deserializer)
+
+    def subscribe(self, callback: Callable[[grpc.ChannelConnectivity], None], try_to_connect: bool = False) -> None:
+        for subchannel in self.subchannels:
+            subchannel.channel.subscribe(callback, try_to_connect=try_to_connect)
+
+    def unary_stream(
+        self,
+        method: str,
+        request_serializer: Optional[Callable[..., Any]] = None,
+        response_deserializer: Optional[Callable[..., Any]] = None,
+        _registered_method: bool = False,
+    ) -> grpc.UnaryStreamMultiCallable:
+        return PooledStreamCallable(self, "unary_stream", method, request_serializer, response_deserializer)
+
+    def unary_unary(
+        self,
+        method: str,
+        request_serializer: Optional[Callable[..., Any]] = None,
+        response_deserializer: Optional[Callable[..., Any]] = None,
+        _registered_method: bool = False,
+    ) -> grpc.UnaryUnaryMultiCallable:
+        return PooledUnaryCallable(self, "unary_unary", method, request_serializer, response_deserializer)
+
+    def unsubscribe(self, callback: Callable[[grpc.ChannelConnectivity], None]) -> None:
+        for subchannel in self.subchannels:
+            subchannel.channel.unsubscribe(callback)
+
+    # -------------------------------------------------------------------------
+    # ChannelPool methods
+    # -------------------------------------------------------------------------
+
+    def check_health(self) -> None:
+        """
+        Probe every server once, ejecting those that fail and readmitting those that pass.
+        """
+        for each_target, channel in zip(self.targets, self.server_channels()):
+            try:
+                healthy = self.health_check(channel)
+            except Exception:  # pylint: disable=W0718
+                healthy = False
+            with self.lock:
+                if healthy:
+                    each_target.ejected_until = 0.0
+                else:
+                    self.eject(each_target)
+
+    def hedging_stats(self) -> Dict[str, Any]:
+        """
+        Report how many calls could be hedged, how many hedges were sent and won, and the current delay per method.
+
+        Returns:
+            Dict[str, Any]: The counters and a "delays" dictionary of seconds, None until enough calls are seen.
+        """
+        with self.lock:
+            result: Dict[str, Any] = dict(self.hedge_counters)
+            result["delays"] = {method: tracker.delay for method, tracker in self.latencies.items()}
+            return result
+
+    def server_channels(self) -> List[grpc.Channel]:
+        """
+        Return one channel to each server, for calls every server must receive, such as ``reinitialize``.
+
+        Returns:
+            List[grpc.Channel]: A channel per server, in the order the servers were given.
+        """
+        return [
+            next(subchannel.channel for subchannel in self.subchannels if subchannel.target is each_target)
+            for each_target in self.targets
+        ]
+
+    def stats(self) -> List[Dict[str, Any]]:
+        """
+        Report the server, weight, ejection state, calls in progress and total calls of each connection.
+
+        Returns:
+            List[Dict[str, Any]]: One dictionary per connection.
+        """
+        now = time.monotonic()
+        with self.lock:
+            return [
+                {
+                    "target": subchannel.target.address,
+                    "weight": subchannel.target.weight,
+                    "ejected": subchannel.target.is_ejected(now),
+                    "ejections": subchannel.target.ejections,
+                    "outstanding": subchannel.outstanding,
+                    "calls": subchannel.calls,
+                }
+                for subchannel in self.subchannels
+            ]
+
+    # -------------------------------------------------------------------------
+    # Non-public ChannelPool methods
+    # -------------------------------------------------------------------------
+
+    def acquire(self, method: str, request: Any = None, avoid: Optional[Subchannel] = None) -> Subchannel:
+        """
+        Choose the connection for the next call and count the call as outstanding.
+        A hedge avoids the server, or failing that the connection, of the first attempt.
+
+        :meta private:
+        """
+        key = record_key(method, request) if self.record_affinity else None
+        now = time.monotonic()
+        with self.lock:
+            start = next(self.round_robin)
+            count = len(self.schedule)
+            candidates = [self.schedule[(start + offset) % count] for offset in range(count)]
+            available = [subchannel for subchannel in candidates if not subchannel.target.is_ejected(now)]
+            candidates = available or candidates
+            if key is not None:
+                owner = self.record_owner(key, now)
+                candidates = [subchannel for subchannel in candidates if subchannel.target is owner] or candidates
+            if avoid is not None:
+                candidates = (
+                    [subchannel for subchannel in candidates if subchannel.target is not avoid.target]
+                    or [subchannel for subchannel in candidates if subchannel is not avoid]
+                    or candidates
+                )
+            if self.policy == LEAST_OUTSTANDING:
+                result = min(candidates, key=lambda subchannel: subchannel.outstanding / subchannel.target.weight)
+            else:
+                result = candidates[0]
+            result.outstanding += 1
+            result.calls += 1
+            return result
+
+    def hedge_delay(self, method: str) -> Optional[float]:
+        """
+        Return the seconds to wait before hedging a call, or None if the method is not hedged yet.
+
+        :meta private:
+        """
+        tracker = self.latencies.get(method)
+        if tracker is None:
+            return None
+        with self.lock:
+            self.hedge_counters["hedged_calls"] += 1
+            if tracker.delay is None:
+                return None
+            return max(self.hedge_min_delay, tracker.delay)
+
+    def record_hedge(self, won: bool = False) -> None:
+        """
+        Count a hedge sent, or a hedge that answered first.
+
+        :meta private:
+        """
+        with self.lock:
+            self.hedge_counters["hedges_won" if won else "hedges"] += 1
+
+    def record_latency(self, method: str, seconds: float) -> None:
+        """
+        Add the latency of a successful attempt to the method's recent latencies.
+
+        :meta private:
+        """
+        with self.lock:
+            self.latencies[method].record(seconds)
+
+    def check_health_forever(self, interval: float) -> None:
+        """
+        Body of the health check thread.
+
+        :meta private:
+        """
+        while not self.closed.wait(interval):
+            self.check_health()
+
+    def eject(self, target: Target) -> None:
+        """
+        Stop routing calls to the server for ejection_seconds. The caller holds the lock.
+
+        :meta private:
+        """
+        now = time.monotonic()
+        if not target.is_ejected(now):
+            target.ejections += 1
+        target.ejected_until = now + self.ejection_seconds
+
+    def record_owner(self, key: int, now: float) -> Target:
+        """
+        Find the server owning the record key on the hash ring, skipping ejected servers.
+        The caller holds the lock.
+
+        :meta private:
+        """
+        start = bisect.bisect(self.ring_hashes, key)
+        count = len(self.ring)
+        for offset in range(count):
+            _, target = self.ring[(start + offset) % count]
+            if not target.is_ejected(now):
+                return target
+        return self.ring[start % count][1]
+
+    def release(self, subchannel: Subchannel, error: Optional[BaseException] = None) -> None:
+        """
+        Record that a call on the connection has finished, ejecting its server if it was unavailable.
+
+        :meta private:
+        """
+        with self.lock:
+            subchannel.outstanding -= 1
+            if isinstance(error, grpc.RpcError) and error.code() == grpc.StatusCode.UNAVAILABLE:
+                self.eject(subchannel.target)
+
+
+# -----------------------------------------------------------------------------
+# Multi-callable classes
+# -----------------------------------------------------------------------------
+
+
+class PooledCallable:
+    """
+    Creates the underlying multi-callable of one method on every connection of a ChannelPool.
+
+    :meta private:
+    """
+
+    def __init__(
+        self,
+        pool: ChannelPool,
+        kind: str,
+        method: str,
+        request_serializer: Optional[Callable[..., Any]],
+        response_deserializer: Optional[Callable[..., Any]],
+    ) -> None:
+        self.pool = pool
+        self.method = method
+        self.callables = {
+            id(subchannel): getattr(subchannel.channel, kind)(
+                method, request_serializer, response_deserializer, _registered_method=True
+            )
+            for subchannel in pool.subchannels
+        }
+
+    def callable_for(self, subchannel: Subchannel) -> Any:
+        return self.callables[id(subchannel)]
+
+
+class PooledUnaryCallable(PooledCallable, grpc.UnaryUnaryMultiCallable, grpc.StreamUnaryMultiCallable):  # type: ignore[misc]
+    """
+    Routes calls that have a single response.
+
+    :meta private:
+    """
+
+    def __call__(self, request: Any, **kwargs: Any) -> Any:
+        response, _ = self.with_call(request, **kwargs)
+        return response
+
+    def with_call(self, request: Any, **kwargs: Any) -> Tuple[Any, grpc.Call]:
+        if self.method in self.pool.latencies:
+            call = HedgedCall(self, request, kwargs)
+            return call.result(), call
+        subchannel = self.pool.acquire(self.method, request)
+        error: Optional[BaseException] = None
+        try:
+            return self.callable_for(subchannel).with_call(request, **kwargs)  # type: ignore[no-any-return]
+        except grpc.RpcError as err:
+            error = err
+            raise
+        finally:
+            self.pool.release(subchannel, error)
+
+    def future(self, request: Any, **kwargs: Any) -> grpc.Future:
+        if self.method in self.pool.latencies:
+            return HedgedCall(self, request, kwargs)
+        subchannel = self.pool.acquire(self.method, request)
+        try:
+            result = self.callable_for(subchannel).future(request, **kwargs)
+        except BaseException as err:
+            self.pool.release(subchannel, err)
+            raise
+        result.add_done_callback(lambda done: self.pool.release(subchannel, call_error(done)))
+        return result
+
+
+class PooledStreamCallable(PooledCallable, grpc.UnaryStreamMultiCallable, grpc.StreamStreamMultiCallable):  # type: ignore[misc]
+    """
+    Routes calls that stream responses. The call stays outstanding until the stream terminates.
+
+    :meta private:
+    """
+
+    def __call__(self, request: Any, **kwargs: Any) -> Any:
+        subchannel = self.pool.acquire(self.method, request)
+        try:
+            result = self.callable_for(subchannel)(request, **kwargs)
+        except BaseException as err:
+            self.pool.release(subchannel, err)
+            raise
+        result.add_callback(lambda: self.pool.release(subchannel, call_error(result)))
+        return result
+
+
+# -----------------------------------------------------------------------------
+# Hedging classes
+# -----------------------------------------------------------------------------
+
+
+class HedgedCall(CompositeCall):
+    """
+    A call that sends a second attempt if the first is slow, and reports whichever answers first.
+    An attempt failing with ``UNAVAILABLE`` does not win while the other is still running.
+
+    :meta private:
+    """
+
+    def __init__(self, pooled: PooledUnaryCallable, request: Any, kwargs: Dict[str, Any]) -> None:
+        super().__init__()
+        self.pooled = pooled
+        self.pool = pooled.pool
+        self.request = request
+        self.kwargs = kwargs
+        self.started = time.monotonic()
+        self.attempts: List[Any] = []
+        self.pending = 0
+        first = self.launch()
+        delay = self.pool.hedge_delay(pooled.method)
+        if delay is not None:
+            self.pool.scheduler.call_later(delay, lambda: self.hedge(first))
+
+    def launch(self, avoid: Optional[Subchannel] = None) -> Subchannel:
+        subchannel = self.pool.acquire(self.pooled.method, self.request, avoid)
+        kwargs = dict(self.kwargs)
+        if kwargs.get("timeout") is not None:
+            kwargs["timeout"] = max(0.0, kwargs["timeout"] - (time.monotonic() - self.started))
+        started = time.monotonic()
+        try:
+            call = self.pooled.callable_for(subchannel).future(self.request, **kwargs)
+        except BaseException as err:
+            self.pool.release(subchannel, err)
+            raise
+        with self.condition:
+            finished = self.final is not None or self.was_cancelled
+            if not finished:
+                self.attempts.append(call)
+                self.pending += 1
+                self.current = call
+        if finished:
+            call.add_done_callback(lambda done: self.pool.release(subchannel, call_error(done)))
+            call.cancel()
+            return subchannel
+        call.add_done_callback(lambda done: self.on_attempt_done(done, subchannel, started))
+        return subchannel
+
+    def hedge(self, first: Subchannel) -> None:
+        with self.condition:
+            if self.final is not None or self.was_cancelled:
+                return
+        self.pool.record_hedge()
+        self.launch(avoid=first)
+
+    def on_attempt_done(self, call: Any, subchannel: Subchannel, started: float) -> None:
+        self.pool.release(subchannel, call_error(call))
+        code = call.code()
+        with self.condition:
+            self.pending -= 1
+            if self.final is not None:
+                return
+            if code == grpc.StatusCode.UNAVAILABLE and self.pending > 0 and not self.was_cancelled:
+                return
+            is_hedge = call is not self.attempts[0]
+        if code == grpc.StatusCode.OK:
+            self.pool.record_latency(self.pooled.method, time.monotonic() - started)
+            if is_hedge:
+                self.pool.record_hedge(won=True)
+        self.finish(call)
+        for attempt in self.attempts:
+            if attempt is not call:
+                attempt.cancel()
+
+    def cancel_attempts(self) -> None:
+        with self.condition:
+            attempts = list(self.attempts)
+        if not any(attempt.cancel() for attempt in attempts):
+            self.finish(attempts[-1])
+
+
+class LatencyTracker:
+    """
+    Recent latencies of a method and the percentile used as its hedging delay. The pool's lock guards it.
+
+    :meta private:
+    """
+
+    def __init__(self, percentile: float) -> None:
+        self.percentile = percentile
+        self.samples: Deque[float] = deque(maxlen=HEDGE_WINDOW)
+        self.delay: Optional[float] = None
+        self.since_refresh = 0
+
+    def record(self, seconds: float) -> None:
+        self.samples.append(seconds)
+        self.since_refresh += 1
+        if len(self.samples) < HEDGE_MIN_SAMPLES:
+            return
+        if self.delay is None or self.since_refresh >= HEDGE_REFRESH_SAMPLES:
+            ordered = sorted(self.samples)
+            self.delay = ordered[min(len(ordered) - 1, int(len(ordered) * self.percentile / 100))]
+            self.since_refresh = 0
+
+
+class Scheduler:
+    """
+    Runs functions after a delay on one background thread, started when first needed.
+
+    :meta private:
+    """
+
+    def __init__(self) -> None:
+        self.condition = threading.Condition()
+        self.queue: List[Tuple[float, int, Callable[[], None]]] = []
+        self.sequence = itertools.count()
+        self.thread: Optional[threading.Thread] = None
+        self.closed = False
+
+    def call_later(self, delay: float, function: Callable[[], None]) -> None:
+        with self.condition:
+            if self.closed:
+                return
+            heapq.heappush(self.queue, (time.monotonic() + delay, next(self.sequence), function))
+            if self.thread is None:
+                self.thread = threading.Thread(target=self.run, daemon=True)
+                self.thread.start()
+            self.condition.notify()
+
+    def close(self) -> None:
+        with self.condition:
+            self.closed = True
+            self.condition.notify()
+
+    def run(self) -> None:
+        while True:
+            with self.condition:
+                while not self.closed and (not self.queue or self.queue[0][0] > time.monotonic()):
+                    self.condition.wait(self.queue[0][0] - time.monotonic() if self.queue else None)
+                if self.closed:
+                    return
+                _, _, function = heapq.heappop(self.queue)
+            # A hedge that fails to start leaves the first attempt to answer.
+
+            try:
+                function()
+            except Exception:  # pylint: disable=W0718
+                pass
+
+
+# -----------------------------------------------------------------------------
+# Helper functions
+# -----------------------------------------------------------------------------
+
+
+def new_targets(target: Union[str, Sequence[Union[str, Tuple[str, int]]]]) -> List[Target]:
+    """
+    Normalize the target argument of ChannelPool into Target objects.
+
+    :meta private:
+    """
+    if isinstance(target, str):
+        target = [target]
+    result = []
+    for each_target in target:
+        address, weight = (each_target, 1) if isinstance(each_target, str) else each_target
+        if weight < 1:
+            raise ValueError(f"weight of {address} must be at least 1, not {weight}")
+        result.append(Target(address, weight))
+    if not result:
+        raise ValueError("at least one target is required")
+    return result
+
+
+def new_schedule(subchannels: List[Subchannel]) -> List[Subchannel]:
+    """
+    List each connection as many times as its server's weight, spread evenly,
+    so walking the list in order is a weighted round-robin.
+
+    :meta private:
+    """
+    slots = [
+        (repeat / subchannel.target.weight, position, subchannel)
+        for position, subchannel in enumerate(subchannels)
+        for repeat in range(subchannel.target.weight)
+    ]
+    return [subchannel for _, _, subchannel in sorted(slots, key=lambda slot: slot[:2])]
+
+
+def new_ring(targets: List[Target]) -> List[Tuple[int, Target]]:
+    """
+    Place each server on a consistent hash ring at a number of points proportional to its weight.
+
+    :meta private:
+    """
+    return sorted(
+        (
+            (hash_key(f"{position}|{target.address}|{point}"), target)
+            for position, target in enumerate(targets)
+            for point in range(RING_POINTS_PER_WEIGHT * target.weight)
+        ),
+        key=lambda ring_point: ring_point[0],
+    )
+
+
+def hash_key(key: str) -> int:
+    """
+    A hash that is stable across processes, unlike ``hash()``.
+
+    :meta private:
+    """
+    return int.from_bytes(hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+def record_key(method: str, request: Any) -> Optional[int]:
+    """
+    Return the hashed (data source code, record id) of a record method's request, otherwise None.
+
+    :meta private:
+    """
+    if method not in RECORD_METHODS:
+        return None
+    return hash_key(f"{request.data_source_code.upper()}|{request.record_id}")
+
+
+def is_channel_ready(channel: grpc.Channel) -> bool:
+    """
+    The default health check: wait up to one second for the channel to connect.
+
+    :meta private:
+    """
+    ready = grpc.channel_ready_future(channel)
+    try:
+        ready.result(timeout=1.0)
+    except grpc.FutureTimeoutError:
+        ready.cancel()
+        return False
+    return True
+
+
+def new_channel(
+    target: str,
+    credentials: Optional[grpc.ChannelCredentials],
+    options: Sequence[Tuple[str, Any]],
+) -> grpc.Channel:
+    """
+    Open a secure channel if credentials are given, otherwise an insecure one.
+
+    :meta private:
+    """
+    if credentials:
+        return grpc.secure_channel(target, credentials, options=options)
+    return grpc.insecure_channel(target, options=options)
+
+
+def call_error(call: Any) -> Optional[BaseException]:
+    """
+    Return the RpcError a finished call ended with, or None if it succeeded.
+
+    :meta private:
+    """
+    if call.code() in (None, grpc.StatusCode.OK):
+        return None
+    return call if isinstance(call, grpc.RpcError) else None
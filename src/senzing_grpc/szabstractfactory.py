@@ -8,31 +8,46 @@ of the `senzing.szabstractfactory.SzAbstractFactory`_ interface.
 .. _senzing.szabstractfactory.SzAbstractFactory: https://garage.senzing.com/sz-sdk-python/senzing.html#module-senzing.szabstractfactory
 """
 
-# pylint: disable=E1101
+# pylint: disable=E1101,R0902
 
 from types import TracebackType
-from typing import Any, Type, TypedDict, Union
+from typing import (
+    Any,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypedDict,
+    Union,
+)
 
 import grpc
 from senzing import (
     SzAbstractFactory,
-    SzConfigManager,
     SzDiagnostic,
-    SzEngine,
     SzProduct,
 )
 
+from .channelpool import EJECTION_SECONDS, ChannelPool
+from .szcompression import SzCompressionPolicy, with_compression_policy
+from .szconfigcache import SzConfigCache
 from .szconfigmanager import SzConfigManagerGrpc
+from .szdeadline import SzDeadlines, with_deadlines
 from .szdiagnostic import SzDiagnosticGrpc
 from .szengine import SzEngineGrpc
+from .szentitycache import SzEntityCache, with_entity_cache
 from .szproduct import SzProductGrpc
+from .szretry import SzRetryPolicy, with_retry_policy
+from .szsingleflight import SzSingleFlight, with_single_flight
 
 # Metadata
 
 __all__ = ["SzAbstractFactoryGrpc", "SzAbstractFactoryParametersGrpc"]
 __version__ = "0.0.1"  # See https://www.python.org/dev/peps/pep-0396/
 __date__ = "2025-01-10"
-__updated__ = "2025-01-16"
+__updated__ = "2026-10-18"
 
 
 # -----------------------------------------------------------------------------
@@ -46,6 +61,18 @@ class SzAbstractFactoryParametersGrpc(TypedDict, total=False):
     """
 
     grpc_channel: grpc.Channel
+    grpc_targets: Sequence[Union[str, Tuple[str, int]]]
+    grpc_credentials: grpc.ChannelCredentials
+    health_check_interval: float
+    ejection_seconds: float
+    record_affinity: bool
+    hedged_methods: Iterable[str]
+    retry_policy: SzRetryPolicy
+    deadlines: SzDeadlines
+    entity_cache: SzEntityCache
+    single_flight: SzSingleFlight
+    config_cache: SzConfigCache
+    compression: SzCompressionPolicy
 
 
 # -----------------------------------------------------------------------------
@@ -56,6 +83,37 @@ class SzAbstractFactoryParametersGrpc(TypedDict, total=False):
 class SzAbstractFactoryGrpc(SzAbstractFactory):
     """
     SzAbstractFactory module is a factory pattern for accessing Senzing over gRPC.
+
+    Either pass a ``grpc_channel`` or a list of ``grpc_targets``.
+    Given ``grpc_targets``, such as several gRPC servers in front of the same Senzing repository,
+    the factory opens a ``ChannelPool`` that balances calls across them by weight,
+    ejects servers returning ``UNAVAILABLE`` for ``ejection_seconds``
+    and, if ``health_check_interval`` is set, probes them in the background.
+    With ``record_affinity``, every add, delete and reevaluate of a record goes to the same server,
+    so concurrent changes to one record do not contend across servers.
+    Reads in ``hedged_methods`` that are slower than usual are also sent to a second server.
+    The factory closes that pool in ``destroy``.
+    Giving any of these pool options with ``grpc_channel`` instead raises ``ValueError``.
+    A ``retry_policy`` and ``deadlines`` apply to every object the factory creates,
+    and every engine it creates shares the ``entity_cache`` and ``single_flight``.
+    Unless given other ``deadlines``, or None, calls get the default timeouts of ``SzDeadlines``.
+    Every config manager it creates shares the ``config_cache``.
+    The ``compression`` policy chooses, per method or by request size, how calls and their responses are compressed.
+
+    Args:
+        grpc_channel (grpc.Channel, optional): The channel used by every object created. Defaults to None.
+        grpc_targets (Sequence[Union[str, Tuple[str, int]]], optional): Server addresses or (address, weight) tuples. Defaults to None.
+        grpc_credentials (grpc.ChannelCredentials, optional): Credentials for connecting to grpc_targets. Defaults to None, insecure.
+        health_check_interval (float, optional): Seconds between health probes of grpc_targets. Defaults to None, no probing.
+        ejection_seconds (float, optional): How long an unavailable server in grpc_targets is skipped. Defaults to 30.0.
+        record_affinity (bool, optional): Route record changes to grpc_targets by consistent hashing of the record key. Defaults to False.
+        hedged_methods (Iterable[str], optional): Read methods to hedge across grpc_targets, e.g. ``HEDGEABLE_METHODS``. Defaults to None.
+        retry_policy (SzRetryPolicy, optional): Retries failed calls. Defaults to None, no retries.
+        deadlines (SzDeadlines, optional): Default timeouts by class of method. Defaults to SzDeadlines(). None sets no deadlines.
+        entity_cache (SzEntityCache, optional): Caches entity reads. Defaults to None, no caching.
+        single_flight (SzSingleFlight, optional): Shares one call among identical concurrent reads. Defaults to None, no sharing.
+        config_cache (SzConfigCache, optional): Caches configuration documents. Defaults to None, no caching.
+        compression (SzCompressionPolicy, optional): Compresses calls by method or request size. Defaults to None, no compression.
     """
 
     # -------------------------------------------------------------------------
@@ -64,14 +122,55 @@ class SzAbstractFactoryGrpc(SzAbstractFactory):
 
     def __init__(
         self,
-        grpc_channel: grpc.Channel,
+        grpc_channel: Optional[grpc.Channel] = None,
+        grpc_targets: Optional[Sequence[Union[str, Tuple[str, int]]]] = None,
+        grpc_credentials: Optional[grpc.ChannelCredentials] = None,
+        health_check_interval: Optional[float] = None,
+        ejection_seconds: Optional[float] = None,
+        record_affinity: bool = False,
+        hedged_methods: Optional[Iterable[str]] = None,
+        retry_policy: Optional[SzRetryPolicy] = None,
+        deadlines: Optional[SzDeadlines] = SzDeadlines(),
+        entity_cache: Optional[SzEntityCache] = None,
+        single_flight: Optional[SzSingleFlight] = None,
+        config_cache: Optional[SzConfigCache] = None,
+        compression: Optional[SzCompressionPolicy] = None,
     ) -> None:
         """
         Constructor
 
         For return value of -> None, see https://peps.python.org/pep-0484/#the-meaning-of-annotations
         """
-        self.channel = grpc_channel
+        if (grpc_channel is None) == (grpc_targets is None):
+            raise ValueError("exactly one of grpc_channel and grpc_targets is required")
+        if grpc_targets is None:
+            check_without_targets(
+                grpc_credentials=grpc_credentials,
+                health_check_interval=health_check_interval,
+                ejection_seconds=ejection_seconds,
+                record_affinity=record_affinity,
+                hedged_methods=hedged_methods,
+            )
+
+        self.owned_channel: Optional[ChannelPool] = None
+        if grpc_targets is not None:
+            self.owned_channel = ChannelPool(
+                grpc_targets,
+                credentials=grpc_credentials,
+                ejection_seconds=EJECTION_SECONDS if ejection_seconds is None else ejection_seconds,
+                health_check_interval=health_check_interval,
+                record_affinity=record_affinity,
+                hedged_methods=hedged_methods,
+            )
+            grpc_channel = self.owned_channel
+        self.base_channel: grpc.Channel = grpc_channel
+        self.retry_policy = retry_policy
+        self.deadlines = deadlines
+        self.entity_cache = entity_cache
+        self.single_flight = single_flight
+        self.config_cache = config_cache
+        self.compression = compression
+        self.channel = self.intercept(self.base_channel)
 
     def __enter__(
         self,
@@ -86,29 +185,80 @@ class SzAbstractFactoryGrpc(SzAbstractFactory):
         exc_tb: Union[TracebackType, None],
     ) -> None:
         """Context Manager method."""
+        self.destroy()
 
     # -------------------------------------------------------------------------
     # SzAbstractFactory methods
     # -------------------------------------------------------------------------
 
-    def create_configmanager(self) -> SzConfigManager:
-        return SzConfigManagerGrpc(grpc_channel=self.channel)
+    def create_configmanager(self) -> SzConfigManagerGrpc:
+        return SzConfigManagerGrpc(grpc_channel=self.channel, config_cache=self.config_cache)
 
     def create_diagnostic(self) -> SzDiagnostic:
         return SzDiagnosticGrpc(grpc_channel=self.channel)
 
-    def create_engine(self) -> SzEngine:
+    def create_engine(self) -> SzEngineGrpc:
         return SzEngineGrpc(grpc_channel=self.channel)
 
     def create_product(self) -> SzProduct:
         return SzProductGrpc(grpc_channel=self.channel)
 
     def destroy(self) -> None:
-        pass
+        if self.owned_channel:
+            self.owned_channel.close()
+            self.owned_channel = None
 
     def reinitialize(self, config_id: int) -> None:
-        sz_diagnostic = SzDiagnosticGrpc(grpc_channel=self.channel)
-        sz_diagnostic.reinitialize(config_id=config_id)  # pylint: disable=W0212
 
-        sz_engine = SzEngineGrpc(grpc_channel=self.channel)
-        sz_engine.reinitialize(config_id=config_id)  # pylint: disable=W0212
+        # Every server behind a ChannelPool must be reinitialized, not just the one a call is routed to.
+
+        for server_channel in server_channels(self.base_channel):
+            grpc_channel = self.intercept(server_channel)
+            sz_diagnostic = SzDiagnosticGrpc(grpc_channel=grpc_channel)
+            sz_diagnostic.reinitialize(config_id=config_id)  # pylint: disable=W0212
+
+            sz_engine = SzEngineGrpc(grpc_channel=grpc_channel)
+            sz_engine.reinitialize(config_id=config_id)  # pylint: disable=W0212
+
+    # -------------------------------------------------------------------------
+    # Non-public SzAbstractFactoryGrpc methods
+    # -------------------------------------------------------------------------
+
+    def intercept(self, grpc_channel: grpc.Channel) -> grpc.Channel:
+        """
+        Apply the entity cache, single flight, deadlines, retry policy and compression. The cache goes outside, so a hit makes no call,
+        deadlines go outside retries, so a deadline bounds all retries of a call,
+        and compression goes inside, so every retry is compressed alike.
+
+        :meta private:
+        """
+        grpc_channel = with_retry_policy(with_compression_policy(grpc_channel, self.compression), self.retry_policy)
+        grpc_channel = with_deadlines(grpc_channel, self.deadlines)
+        return with_entity_cache(with_single_flight(grpc_channel, self.single_flight), self.entity_cache)
+
+
+# -----------------------------------------------------------------------------
+# Helper functions
+# -----------------------------------------------------------------------------
+
+
+def check_without_targets(**options: Any) -> None:
+    """
+    Raise ValueError if any option of grpc_targets is given, as it would be ignored.
+
+    :meta private:
+    """
+    given = [name for name, value in options.items() if value is not None and value is not False]
+    if given:
+        raise ValueError(f"{', '.join(given)} can only be used with grpc_targets")
+
+
+def server_channels(grpc_channel: grpc.Channel) -> List[grpc.Channel]:
+    """
+    Return a channel to each distinct server behind grpc_channel.
+
+    :meta private:
+    """
+    if isinstance(grpc_channel, ChannelPool):
+        return grpc_channel.server_channels()
+    return [grpc_channel]
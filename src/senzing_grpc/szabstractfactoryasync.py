@@ -0,0 +1,116 @@
+#! /usr/bin/env python3
+
+"""
+``senzing_grpc.szabstractfactoryasync.SzAbstractFactoryGrpcAsync`` is an `asyncio`_ `gRPC`_ implementation
+of the `senzing.szabstractfactory.SzAbstractFactory`_ methods.
+
+All of the objects it creates share one ``grpc.aio.Channel``.
+
+.. _asyncio: https://docs.python.org/3/library/asyncio.html
+.. _gRPC: https://grpc.io
+.. _senzing.szabstractfactory.SzAbstractFactory: https://garage.senzing.com/sz-sdk-python/senzing.html#module-senzing.szabstractfactory
+"""
+
+# pylint: disable=E1101
+
+import asyncio
+from types import TracebackType
+from typing import Type, TypedDict, Union
+
+import grpc
+
+from .szconfigmanagerasync import SzConfigManagerGrpcAsync
+from .szdiagnosticasync import SzDiagnosticGrpcAsync
+from .szengineasync import SzEngineGrpcAsync
+from .szproductasync import SzProductGrpcAsync
+
+# Metadata
+
+__all__ = ["SzAbstractFactoryGrpcAsync", "SzAbstractFactoryParametersGrpcAsync"]
+__version__ = "0.0.1"  # See https://www.python.org/dev/peps/pep-0396/
+__date__ = "2026-10-18"
+__updated__ = "2026-10-18"
+
+
+# -----------------------------------------------------------------------------
+# SzAbstractFactoryParametersGrpcAsync class
+# -----------------------------------------------------------------------------
+
+
+class SzAbstractFactoryParametersGrpcAsync(TypedDict, total=False):
+    """
+    SzAbstractFactoryParametersGrpcAsync is used to create a dictionary that can be unpacked when creating an SzAbstractFactoryGrpcAsync.
+    """
+
+    grpc_channel: grpc.aio.Channel
+
+
+# -----------------------------------------------------------------------------
+# SzAbstractFactoryGrpcAsync class
+# -----------------------------------------------------------------------------
+
+
+class SzAbstractFactoryGrpcAsync:
+    """
+    SzAbstractFactoryGrpcAsync module is a factory pattern for accessing Senzing over asyncio gRPC.
+
+    The ``create_*`` methods do not call the server, so they are not coroutines.
+    ``destroy`` and ``reinitialize`` must be awaited.
+    """
+
+    # -------------------------------------------------------------------------
+    # Python dunder/magic methods
+    # -------------------------------------------------------------------------
+
+    def __init__(
+        self,
+        grpc_channel: grpc.aio.Channel,
+    ) -> None:
+        """
+        Constructor
+
+        For return value of -> None, see https://peps.python.org/pep-0484/#the-meaning-of-annotations
+        """
+        self.channel = grpc_channel
+
+    async def __aenter__(
+        self,
+    ) -> "SzAbstractFactoryGrpcAsync":
+        """Asynchronous Context Manager method."""
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Union[Type[BaseException], None],
+        exc_val: Union[BaseException, None],
+        exc_tb: Union[TracebackType, None],
+    ) -> None:
+        """Asynchronous Context Manager method."""
+        await self.destroy()
+
+    # -------------------------------------------------------------------------
+    # SzAbstractFactory methods
+    # -------------------------------------------------------------------------
+
+    def create_configmanager(self) -> SzConfigManagerGrpcAsync:
+        return SzConfigManagerGrpcAsync(grpc_channel=self.channel)
+
+    def create_diagnostic(self) -> SzDiagnosticGrpcAsync:
+        return SzDiagnosticGrpcAsync(grpc_channel=self.channel)
+
+    def create_engine(self) -> SzEngineGrpcAsync:
+        return SzEngineGrpcAsync(grpc_channel=self.channel)
+
+    def create_product(self) -> SzProductGrpcAsync:
+        return SzProductGrpcAsync(grpc_channel=self.channel)
+
+    async def destroy(self) -> None:
+        """Null function in the sz-sdk-python-grpc implementation. The caller owns the channel."""
+
+    async def reinitialize(self, config_id: int) -> None:
+        sz_diagnostic = SzDiagnosticGrpcAsync(grpc_channel=self.channel)
+        sz_engine = SzEngineGrpcAsync(grpc_channel=self.channel)
+        await asyncio.gather(
+            sz_diagnostic.reinitialize(config_id=config_id),
+            sz_engine.reinitialize(config_id=config_id),
+        )
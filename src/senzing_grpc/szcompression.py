@@ -0,0 +1,208 @@
+#! /usr/bin/env python3
+
+"""
+``senzing_grpc.szcompression.SzCompressionPolicy`` chooses the compression of each `gRPC`_ call by its method
+and the size of its request.
+
+Large JSON responses, such as networks, exports and configurations, shrink several times under gzip,
+while compressing small acknowledgements only costs CPU.
+The policy sets the compression of the request; the Senzing gRPC server, like other grpc-go servers,
+compresses its response with the algorithm the request used.
+
+.. code-block:: python
+
+    compression = SzCompressionPolicy(min_request_bytes=64 * 1024)
+    sz_abstract_factory = SzAbstractFactoryGrpc(grpc_channel, compression=compression)
+
+.. _gRPC: https://grpc.io
+"""
+
+import threading
+from typing import Any, Callable, Dict, Mapping, Optional
+
+import grpc
+
+from .szhelpers import with_compression
+
+# Metadata
+
+__all__ = ["LARGE_RESPONSE_METHODS", "SzCompressionPolicy"]
+__version__ = "0.0.1"  # See https://www.python.org/dev/peps/pep-0396/
+__date__ = "2026-10-18"
+__updated__ = "2026-10-18"
+
+LARGE_RESPONSE_METHODS = frozenset(
+    [
+        "/szconfigmanager.SzConfigManager/GetConfig",
+        "/szconfigmanager.SzConfigManager/GetTemplateConfig",
+        "/szengine.SzEngine/FetchNext",
+        "/szengine.SzEngine/FindInterestingEntitiesByEntityId",
+        "/szengine.SzEngine/FindInterestingEntitiesByRecordId",
+        "/szengine.SzEngine/FindNetworkByEntityId",
+        "/szengine.SzEngine/FindNetworkByRecordId",
+        "/szengine.SzEngine/FindPathByEntityId",
+        "/szengine.SzEngine/FindPathByRecordId",
+        "/szengine.SzEngine/HowEntityByEntityId",
+        "/szengine.SzEngine/StreamExportCsvEntityReport",
+        "/szengine.SzEngine/StreamExportJsonEntityReport",
+        "/szengine.SzEngine/WhyEntities",
+        "/szengine.SzEngine/WhyRecordInEntity",
+        "/szengine.SzEngine/WhyRecords",
+        "/szengine.SzEngine/WhySearch",
+    ]
+)
+"""Methods whose responses are usually large enough to be worth compressing."""
+
+# -----------------------------------------------------------------------------
+# SzCompressionPolicy class
+# -----------------------------------------------------------------------------
+
+
+class SzCompressionPolicy(grpc.UnaryUnaryClientInterceptor, grpc.UnaryStreamClientInterceptor):  # type: ignore[misc]
+    """
+    Sets the compression of each call, unless the caller set one.
+
+    A method in ``methods`` uses the algorithm given for it.
+    Any other call uses ``algorithm`` if its request is at least ``min_request_bytes``,
+    e.g. the configuration sent by ``register_config``, and no compression otherwise.
+
+    Args:
+        methods (Mapping[str, grpc.Compression], optional): Algorithm by full method name. Defaults to gzip for ``LARGE_RESPONSE_METHODS``.
+        algorithm (grpc.Compression, optional): Algorithm for large requests. Defaults to grpc.Compression.Gzip.
+        min_request_bytes (int, optional): Smallest request compressed with ``algorithm``. Defaults to 64 KiB. None compresses by method only.
+    """
+
+    # -------------------------------------------------------------------------
+    # Python dunder/magic methods
+    # -------------------------------------------------------------------------
+
+    def __init__(
+        self,
+        methods: Optional[Mapping[str, grpc.Compression]] = None,
+        algorithm: grpc.Compression = grpc.Compression.Gzip,
+        min_request_bytes: Optional[int] = 64 * 1024,
+    ) -> None:
+        """
+        Constructor
+
+        For return value of -> None, see https://peps.python.org/pep-0484/#the-meaning-of-annotations
+        """
+        if min_request_bytes is not None and min_request_bytes < 0:
+            raise ValueError(f"min_request_bytes must not be negative, not {min_request_bytes}")
+
+        if methods is None:
+            methods = {method: grpc.Compression.Gzip for method in LARGE_RESPONSE_METHODS}
+        self.methods = dict(methods)
+        self.algorithm = algorithm
+        self.min_request_bytes = min_request_bytes
+
+        self.lock = threading.Lock()
+        self.counters: Dict[str, int] = {}
+        self.reset_stats()
+
+    # -------------------------------------------------------------------------
+    # SzCompressionPolicy methods
+    # -------------------------------------------------------------------------
+
+    def compression_for(self, method: str, request: Any) -> grpc.Compression:
+        """
+        Return the compression a call gets.
+
+        Args:
+            method (str): The full method name, e.g. "/szengine.SzEngine/FindNetworkByEntityId".
+            request (Any): The request message.
+
+        Returns:
+            grpc.Compression: The algorithm, or grpc.Compression.NoCompression.
+        """
+        compression = self.methods.get(method)
+        if compression is not None:
+            return compression
+        if self.min_request_bytes is not None and request.ByteSize() >= self.min_request_bytes:
+            return self.algorithm
+        return grpc.Compression.NoCompression
+
+    def intercept(self, grpc_channel: grpc.Channel) -> grpc.Channel:
+        """
+        Return a channel whose calls are compressed according to this policy.
+
+        Args:
+            grpc_channel (grpc.Channel): The channel to wrap.
+
+        Returns:
+            grpc.Channel: The wrapped channel.
+        """
+        return grpc.intercept_channel(grpc_channel, self)
+
+    def reset_stats(self) -> None:
+        """
+        Set all counters to zero.
+        """
+        with self.lock:
+            self.counters = {
+                "compressed": 0,
+                "uncompressed": 0,
+            }
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Report how many calls were compressed and how many were not.
+
+        Returns:
+            Dict[str, int]: A copy of the counters.
+        """
+        with self.lock:
+            return dict(self.counters)
+
+    # -------------------------------------------------------------------------
+    # grpc.UnaryUnaryClientInterceptor and grpc.UnaryStreamClientInterceptor methods
+    # -------------------------------------------------------------------------
+
+    def intercept_unary_stream(
+        self,
+        continuation: Callable[[grpc.ClientCallDetails, Any], Any],
+        client_call_details: grpc.ClientCallDetails,
+        request: Any,
+    ) -> Any:
+        return continuation(self.with_compression(client_call_details, request), request)
+
+    def intercept_unary_unary(
+        self,
+        continuation: Callable[[grpc.ClientCallDetails, Any], Any],
+        client_call_details: grpc.ClientCallDetails,
+        request: Any,
+    ) -> Any:
+        return continuation(self.with_compression(client_call_details, request), request)
+
+    # -------------------------------------------------------------------------
+    # Non-public SzCompressionPolicy methods
+    # -------------------------------------------------------------------------
+
+    def with_compression(self, client_call_details: grpc.ClientCallDetails, request: Any) -> grpc.ClientCallDetails:
+        """
+        Add the compression chosen for the call to call details that have none.
+
+        :meta private:
+        """
+        if client_call_details.compression is not None:
+            return client_call_details
+        compression = self.compression_for(client_call_details.method, request)
+        with self.lock:
+            self.counters["uncompressed" if compression == grpc.Compression.NoCompression else "compressed"] += 1
+        return with_compression(client_call_details, compression)
+
+
+# -----------------------------------------------------------------------------
+# Helper functions
+# -----------------------------------------------------------------------------
+
+
+def with_compression_policy(grpc_channel: grpc.Channel, compression: Optional[SzCompressionPolicy]) -> grpc.Channel:
+    """
+    Wrap the channel with the compression policy, if there is one.
+
+    :meta private:
+    """
+    if compression is None:
+        return grpc_channel
+    return compression.intercept(grpc_channel)
@@ -10,14 +10,17 @@ of the `senzing.szconfig.SzConfig`_ interface.
 
 # pylint: disable=E1101
 
+import gzip
+from contextlib import contextmanager
 from types import TracebackType
-from typing import Any, Dict, Type, Union
+from typing import Any, Dict, Iterable, Iterator, Optional, Type, Union
 
 import grpc
-from senzing import SzConfig
+from senzing import SzConfig, SzSdkError
 from senzing_grpc_protobuf import szconfig_pb2, szconfig_pb2_grpc
 
 from .szhelpers import catch_sdk_exceptions, new_exception
+from .szretry import SzRetryPolicy, with_retry_policy
 
 # Metadata
 
@@ -38,6 +41,10 @@ SENZING_PRODUCT_ID = (
 class SzConfigGrpc(SzConfig):
     """
     SzConfig module access library over gRPC.
+
+    Each ``register_data_source`` and ``unregister_data_source`` call sends the whole configuration document
+    to the server and receives it back. Inside ``edit``, or with ``register_data_sources``
+    and ``unregister_data_sources``, those calls are gzip-compressed and the changes are kept only if all succeed.
     """
 
     # -------------------------------------------------------------------------
@@ -47,6 +54,7 @@ class SzConfigGrpc(SzConfig):
     def __init__(
         self,
         grpc_channel: grpc.Channel,
+        retry_policy: Optional[SzRetryPolicy] = None,
     ) -> None:
         """
         Constructor
@@ -54,9 +62,12 @@ class SzConfigGrpc(SzConfig):
         For return value of -> None, see https://peps.python.org/pep-0484/#the-meaning-of-annotations
         """
 
-        self.channel = grpc_channel
+        self.channel = with_retry_policy(grpc_channel, retry_policy)
         self.stub = szconfig_pb2_grpc.SzConfigStub(self.channel)
         self.config_definition = ""
+        self.editing = False
+        self.counters: Dict[str, int] = {}
+        self.reset_stats()
 
     def __enter__(
         self,
@@ -85,7 +96,8 @@ class SzConfigGrpc(SzConfig):
             request = szconfig_pb2.RegisterDataSourceRequest(  # type: ignore[unused-ignore]
                 config_definition=self.config_definition, data_source_code=data_source_code
             )
-            response = self.stub.RegisterDataSource(request)
+            response = self.stub.RegisterDataSource(request, compression=self.edit_compression())
+            self.count_call(request, response)
             config_definition = response.config_definition
             if len(config_definition) > 0:
                 self.config_definition = config_definition
@@ -97,7 +109,8 @@ class SzConfigGrpc(SzConfig):
     def unregister_data_source(self, data_source_code: str) -> str:
         try:
             request = szconfig_pb2.UnregisterDataSourceRequest(config_definition=self.config_definition, data_source_code=data_source_code)  # type: ignore[unused-ignore]
-            response = self.stub.UnregisterDataSource(request)
+            response = self.stub.UnregisterDataSource(request, compression=self.edit_compression())
+            self.count_call(request, response)
             config_definition = response.config_definition
             if len(config_definition) > 0:
                 self.config_definition = config_definition
@@ -113,10 +126,85 @@ class SzConfigGrpc(SzConfig):
         try:
             request = szconfig_pb2.GetDataSourceRegistryRequest(config_definition=self.config_definition)  # type: ignore[unused-ignore]
             response = self.stub.GetDataSourceRegistry(request)
+            self.count_call(request, response)
             return str(response.result)
         except Exception as err:
             raise new_exception(err) from err
 
+    # -------------------------------------------------------------------------
+    # SzConfigGrpc methods
+    # -------------------------------------------------------------------------
+
+    @contextmanager
+    def edit(self) -> Iterator[None]:
+        """
+        Make the data source changes of the ``with`` block as one edit of the configuration.
+
+        Each change still goes to the server, which applies it as ``register_data_source``
+        or ``unregister_data_source`` always does, but the configuration sent and returned is gzip-compressed.
+        If the block raises, the configuration is left as it was.
+        """
+        if self.editing:
+            raise SzSdkError("edit() cannot be nested")
+        original = self.config_definition
+        self.editing = True
+        try:
+            yield
+        except BaseException:
+            self.config_definition = original
+            raise
+        finally:
+            self.editing = False
+
+    def register_data_sources(self, data_source_codes: Iterable[str]) -> Dict[str, str]:
+        """
+        Register several data sources in one ``edit``, compressing the configuration sent for each.
+
+        Args:
+            data_source_codes (Iterable[str]): Data source codes.
+
+        Returns:
+            Dict[str, str]: The ``register_data_source`` result of each data source code.
+        """
+        with self.edit():
+            return {code: self.register_data_source(code) for code in data_source_codes}
+
+    def reset_stats(self) -> None:
+        """
+        Set all counters to zero.
+        """
+        self.counters = {
+            "round_trips": 0,
+            "bytes_sent": 0,
+            "bytes_received": 0,
+            "round_trips_one_by_one": 0,
+            "bytes_sent_one_by_one": 0,
+            "bytes_received_one_by_one": 0,
+        }
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Report the calls made and bytes sent and received, and the bytes the same calls would have taken
+        outside ``edit``, uncompressed. Compressed sizes are estimated with ``gzip``.
+
+        Returns:
+            Dict[str, int]: A copy of the counters.
+        """
+        return dict(self.counters)
+
+    def unregister_data_sources(self, data_source_codes: Iterable[str]) -> Dict[str, str]:
+        """
+        Unregister several data sources in one ``edit``, compressing the configuration sent for each.
+
+        Args:
+            data_source_codes (Iterable[str]): Data source codes.
+
+        Returns:
+            Dict[str, str]: The ``unregister_data_source`` result of each data source code.
+        """
+        with self.edit():
+            return {code: self.unregister_data_source(code) for code in data_source_codes}
+
     # -------------------------------------------------------------------------
     # Non-public SzConfigCore methods
     # -------------------------------------------------------------------------
@@ -124,6 +212,28 @@ class SzConfigGrpc(SzConfig):
     def _destroy(self) -> None:
         """Null function in the sz-sdk-python-grpc implementation."""
 
+    def count_call(self, request: Any, response: Any) -> None:
+        """
+        Count a round trip and its bytes, as sent and as they would be sent outside ``edit``.
+
+        :meta private:
+        """
+        sent, received = request.SerializeToString(), response.SerializeToString()
+        self.counters["round_trips"] += 1
+        self.counters["bytes_sent"] += wire_size(sent, self.editing)
+        self.counters["bytes_received"] += wire_size(received, self.editing)
+        self.counters["round_trips_one_by_one"] += 1
+        self.counters["bytes_sent_one_by_one"] += len(sent)
+        self.counters["bytes_received_one_by_one"] += len(received)
+
+    def edit_compression(self) -> Optional[grpc.Compression]:
+        """
+        The compression of a data source change: gzip inside ``edit``, otherwise as the channel decides.
+
+        :meta private:
+        """
+        return grpc.Compression.Gzip if self.editing else None
+
     def import_config_definition(self, config_definition: str) -> None:
         """
         Set the internal JSON document.
@@ -162,4 +272,19 @@ class SzConfigGrpc(SzConfig):
         """
         request = szconfig_pb2.VerifyConfigRequest(config_definition=config_definition)  # type: ignore[unused-ignore]
         response = self.stub.VerifyConfig(request)
+        self.count_call(request, response)
         return bool(response.result)
+
+
+# -----------------------------------------------------------------------------
+# Helper functions
+# -----------------------------------------------------------------------------
+
+
+def wire_size(message: bytes, compressed: bool) -> int:
+    """
+    The size of a serialized message on the wire, estimated with gzip if it is compressed.
+
+    :meta private:
+    """
+    return len(gzip.compress(message, compresslevel=6)) if compressed else len(message)
@@ -0,0 +1,168 @@
+#! /usr/bin/env python3
+
+"""
+``senzing_grpc.szconfigasync.SzConfigGrpcAsync`` is an `asyncio`_ `gRPC`_ implementation
+of the `senzing.szconfig.SzConfig`_ methods.
+
+.. _asyncio: https://docs.python.org/3/library/asyncio.html
+
+.. _gRPC: https://grpc.io
+.. _senzing.szconfig.SzConfig: https://garage.senzing.com/sz-sdk-python/senzing.html#module-senzing.szconfig
+"""
+
+# pylint: disable=E1101
+
+from types import TracebackType
+from typing import Any, Dict, Type, Union
+
+import grpc
+from senzing_grpc_protobuf import szconfig_pb2, szconfig_pb2_grpc
+
+from .szhelpers import catch_sdk_exceptions_async, new_exception
+
+# Metadata
+
+__all__ = ["SzConfigGrpcAsync"]
+__version__ = "0.0.1"  # See https://www.python.org/dev/peps/pep-0396/
+__date__ = "2026-10-18"
+__updated__ = "2026-10-18"
+
+SENZING_PRODUCT_ID = (
+    "5050"  # See https://github.com/senzing-garage/knowledge-base/blob/main/lists/senzing-component-ids.md
+)
+
+# -----------------------------------------------------------------------------
+# SzConfigGrpcAsync class
+# -----------------------------------------------------------------------------
+
+
+class SzConfigGrpcAsync:
+    """
+    SzConfig module access library over asyncio gRPC.
+
+    Method names, parameters and return values match ``SzConfigGrpc``, but methods that call the server must be awaited.
+    """
+
+    # -------------------------------------------------------------------------
+    # Python dunder/magic methods
+    # -------------------------------------------------------------------------
+
+    def __init__(
+        self,
+        grpc_channel: grpc.aio.Channel,
+    ) -> None:
+        """
+        Constructor
+
+        For return value of -> None, see https://peps.python.org/pep-0484/#the-meaning-of-annotations
+        """
+
+        self.channel = grpc_channel
+        self.stub = szconfig_pb2_grpc.SzConfigStub(self.channel)
+        self.config_definition = ""
+
+    async def __aenter__(
+        self,
+    ) -> "SzConfigGrpcAsync":
+        """Asynchronous Context Manager method."""
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Union[Type[BaseException], None],
+        exc_val: Union[BaseException, None],
+        exc_tb: Union[TracebackType, None],
+    ) -> None:
+        """Asynchronous Context Manager method."""
+
+    # -------------------------------------------------------------------------
+    # SzConfig interface methods
+    # -------------------------------------------------------------------------
+
+    @catch_sdk_exceptions_async
+    async def register_data_source(
+        self,
+        data_source_code: str,
+    ) -> str:
+        try:
+            request = szconfig_pb2.RegisterDataSourceRequest(  # type: ignore[unused-ignore]
+                config_definition=self.config_definition, data_source_code=data_source_code
+            )
+            response = await self.stub.RegisterDataSource(request)
+            config_definition = response.config_definition
+            if len(config_definition) > 0:
+                self.config_definition = config_definition
+            return str(response.result)
+        except Exception as err:
+            raise new_exception(err) from err
+
+    @catch_sdk_exceptions_async
+    async def unregister_data_source(self, data_source_code: str) -> str:
+        try:
+            request = szconfig_pb2.UnregisterDataSourceRequest(config_definition=self.config_definition, data_source_code=data_source_code)  # type: ignore[unused-ignore]
+            response = await self.stub.UnregisterDataSource(request)
+            config_definition = response.config_definition
+            if len(config_definition) > 0:
+                self.config_definition = config_definition
+            return str(response.result)
+        except Exception as err:
+            raise new_exception(err) from err
+
+    def export(self) -> str:
+        return self.config_definition
+
+    @catch_sdk_exceptions_async
+    async def get_data_source_registry(self) -> str:
+        try:
+            request = szconfig_pb2.GetDataSourceRegistryRequest(config_definition=self.config_definition)  # type: ignore[unused-ignore]
+            response = await self.stub.GetDataSourceRegistry(request)
+            return str(response.result)
+        except Exception as err:
+            raise new_exception(err) from err
+
+    # -------------------------------------------------------------------------
+    # Non-public SzConfigCore methods
+    # -------------------------------------------------------------------------
+
+    async def _destroy(self) -> None:
+        """Null function in the sz-sdk-python-grpc implementation."""
+
+    def import_config_definition(self, config_definition: str) -> None:
+        """
+        Set the internal JSON document.
+
+        Args:
+            config_definition (str): A Senzing configuration JSON document.
+        """
+        self.config_definition = config_definition
+
+    def import_template(
+        self,
+    ) -> None:
+        """
+        Retrieves a Senzing configuration from the default template.
+        The default template is the Senzing configuration JSON document file,
+        g2config.json, located in the PIPELINE.RESOURCEPATH path.
+        """
+
+    async def initialize(
+        self,
+        instance_name: str,
+        settings: Union[str, Dict[Any, Any]],
+        verbose_logging: int = 0,
+    ) -> None:
+        """Null function in the sz-sdk-python-grpc implementation."""
+        _ = instance_name
+        _ = settings
+        _ = verbose_logging
+
+    async def verify_config_definition(self, config_definition: str) -> bool:
+        """
+        Determine if configuration definition is valid.
+
+        Args:
+            config_definition (str): A Senzing configuration JSON document.
+        """
+        request = szconfig_pb2.VerifyConfigRequest(config_definition=config_definition)  # type: ignore[unused-ignore]
+        response = await self.stub.VerifyConfig(request)
+        return bool(response.result)
@@ -0,0 +1,229 @@
+#! /usr/bin/env python3
+
+"""
+``senzing_grpc.szconfigcache.SzConfigCache`` keeps Senzing configuration documents,
+so ``create_config_from_config_id`` and ``create_config_from_template`` do not download them from the `gRPC`_ server every time.
+
+A registered configuration never changes, so the document of a config id can be kept for good.
+The template is kept per server version and build.
+Documents are kept in memory and, given a ``directory``, on disk, where they survive restarts
+and are shared by the processes using the directory.
+Each file on disk has a SHA-256 digest beside it; a file that does not match its digest is discarded.
+
+.. code-block:: python
+
+    config_cache = SzConfigCache(directory="/var/cache/senzing-grpc")
+    sz_abstract_factory = SzAbstractFactoryGrpc(grpc_channel, config_cache=config_cache)
+    sz_config = sz_abstract_factory.create_configmanager().create_config_from_config_id(config_id)
+
+.. _gRPC: https://grpc.io
+"""
+
+import hashlib
+import os
+import re
+import threading
+from collections import OrderedDict
+from contextlib import suppress
+from typing import Callable, Dict, Optional
+
+from .szhelpers import replace_file
+
+# Metadata
+
+__all__ = ["SzConfigCache"]
+__version__ = "0.0.1"  # See https://www.python.org/dev/peps/pep-0396/
+__date__ = "2026-10-18"
+__updated__ = "2026-10-18"
+
+# -----------------------------------------------------------------------------
+# SzConfigCache class
+# -----------------------------------------------------------------------------
+
+
+class SzConfigCache:
+    """
+    A least-recently-used cache of configuration documents in memory, optionally backed by a directory.
+
+    Args:
+        max_entries (int, optional): Documents kept in memory. Defaults to 8.
+        directory (str, optional): Directory for documents on disk, created if missing. Defaults to None, memory only.
+    """
+
+    # -------------------------------------------------------------------------
+    # Python dunder/magic methods
+    # -------------------------------------------------------------------------
+
+    def __init__(self, max_entries: int = 8, directory: Optional[str] = None) -> None:
+        """
+        Constructor
+
+        For return value of -> None, see https://peps.python.org/pep-0484/#the-meaning-of-annotations
+        """
+        if max_entries < 1:
+            raise ValueError(f"max_entries must be at least 1, not {max_entries}")
+
+        self.max_entries = max_entries
+        self.directory = directory
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+        self.lock = threading.Lock()
+        self.entries: "OrderedDict[str, str]" = OrderedDict()
+        self.counters: Dict[str, int] = {}
+        self.reset_stats()
+
+    # -------------------------------------------------------------------------
+    # SzConfigCache methods
+    # -------------------------------------------------------------------------
+
+    def clear(self) -> None:
+        """
+        Drop every document kept in memory. Files on disk are kept.
+        """
+        with self.lock:
+            self.entries.clear()
+
+    def config(self, config_id: int, fetch: Callable[[], str]) -> str:
+        """
+        Return the document of a registered configuration, calling fetch only if it is not cached.
+
+        Args:
+            config_id (int): The configuration identifier.
+            fetch (Callable[[], str]): Downloads the document.
+
+        Returns:
+            str: The configuration document.
+        """
+        return self.get(f"config-{int(config_id)}", fetch)
+
+    def reset_stats(self) -> None:
+        """
+        Set all counters to zero.
+        """
+        with self.lock:
+            self.counters = {
+                "memory_hits": 0,
+                "disk_hits": 0,
+                "misses": 0,
+                "evictions": 0,
+                "corrupt_files": 0,
+                "disk_errors": 0,
+            }
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Report where documents were found, how many were downloaded,
+        evicted from memory or discarded from disk for failing their digest, and failed disk writes.
+
+        Returns:
+            Dict[str, int]: A copy of the counters with the number of ``entries`` in memory.
+        """
+        with self.lock:
+            result = dict(self.counters)
+            result["entries"] = len(self.entries)
+            return result
+
+    def template(self, server_version: str, fetch: Callable[[], str]) -> str:
+        """
+        Return the template configuration of a server version, calling fetch only if it is not cached.
+
+        Args:
+            server_version (str): Identifies the server, e.g. its version and build number.
+            fetch (Callable[[], str]): Downloads the template.
+
+        Returns:
+            str: The template configuration document.
+        """
+        return self.get(f"template-{server_version}", fetch)
+
+    # -------------------------------------------------------------------------
+    # Non-public SzConfigCache methods
+    # -------------------------------------------------------------------------
+
+    def count(self, counter: str) -> None:
+        """
+        Add one to a counter.
+
+        :meta private:
+        """
+        with self.lock:
+            self.counters[counter] += 1
+
+    def get(self, key: str, fetch: Callable[[], str]) -> str:
+        """
+        Return a document from memory, disk or fetch, keeping it in the places it was missing from.
+
+        :meta private:
+        """
+        with self.lock:
+            document = self.entries.get(key)
+            if document is not None:
+                self.entries.move_to_end(key)
+                self.counters["memory_hits"] += 1
+                return document
+
+        document = self.read_file(key)
+        if document is None:
+            document = fetch()
+            self.count("misses")
+            self.write_file(key, document)
+        else:
+            self.count("disk_hits")
+
+        with self.lock:
+            self.entries[key] = document
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+                self.counters["evictions"] += 1
+        return document
+
+    def path(self, key: str) -> str:
+        """
+        Return the path of a document on disk.
+
+        :meta private:
+        """
+        assert self.directory is not None
+        return os.path.join(self.directory, re.sub(r"[^A-Za-z0-9._-]", "_", key) + ".json")
+
+    def read_file(self, key: str) -> Optional[str]:
+        """
+        Return a document from disk if it is there and matches its digest. A mismatched file is removed.
+
+        :meta private:
+        """
+        if self.directory is None:
+            return None
+        path = self.path(key)
+        try:
+            with open(path, "rb") as document_file:
+                data = document_file.read()
+            with open(path + ".sha256", "r", encoding="utf-8") as digest_file:
+                digest = digest_file.read().strip()
+        except OSError:
+            return None
+        if hashlib.sha256(data).hexdigest() != digest:
+            self.count("corrupt_files")
+            for corrupt_path in (path, path + ".sha256"):
+                with suppress(OSError):
+                    os.remove(corrupt_path)
+            return None
+        return data.decode("utf-8")
+
+    def write_file(self, key: str, document: str) -> None:
+        """
+        Write a document and its digest to disk, each atomically. Failures only count as disk errors.
+
+        :meta private:
+        """
+        if self.directory is None:
+            return
+        path = self.path(key)
+        data = document.encode("utf-8")
+        try:
+            replace_file(path, data)
+            replace_file(path + ".sha256", hashlib.sha256(data).hexdigest().encode("ascii"))
+        except OSError:
+            self.count("disk_errors")
@@ -10,15 +10,23 @@ of the `senzing.szconfigmanager.SzConfigManager`_ interface.
 
 # pylint: disable=E1101
 
+import json
 from types import TracebackType
-from typing import Any, Dict, Type, Union
+from typing import Any, Dict, Optional, Type, Union
 
 import grpc
-from senzing import SzConfig, SzConfigManager
-from senzing_grpc_protobuf import szconfigmanager_pb2, szconfigmanager_pb2_grpc
+from senzing import SzConfigManager
+from senzing_grpc_protobuf import (
+    szconfigmanager_pb2,
+    szconfigmanager_pb2_grpc,
+    szproduct_pb2,
+    szproduct_pb2_grpc,
+)
 
 from .szconfig import SzConfigGrpc
+from .szconfigcache import SzConfigCache
 from .szhelpers import as_str, catch_sdk_exceptions, new_exception
+from .szretry import SzRetryPolicy, with_retry_policy
 
 # Metadata
 
@@ -39,6 +47,8 @@ SENZING_PRODUCT_ID = (
 class SzConfigManagerGrpc(SzConfigManager):
     """
     SzConfigManager module access library over gRPC.
+
+    Given a ``config_cache``, configuration documents and templates are downloaded once and then read from it.
     """
 
     # -------------------------------------------------------------------------
@@ -48,6 +58,8 @@ class SzConfigManagerGrpc(SzConfigManager):
     def __init__(
         self,
         grpc_channel: grpc.Channel,
+        retry_policy: Optional[SzRetryPolicy] = None,
+        config_cache: Optional[SzConfigCache] = None,
     ) -> None:
         """
         Constructor
@@ -55,8 +67,9 @@ class SzConfigManagerGrpc(SzConfigManager):
         For return value of -> None, see https://peps.python.org/pep-0484/#the-meaning-of-annotations
         """
 
-        self.channel = grpc_channel
+        self.channel = with_retry_policy(grpc_channel, retry_policy)
         self.stub = szconfigmanager_pb2_grpc.SzConfigManagerStub(self.channel)
+        self.config_cache = config_cache
 
     def __enter__(
         self,
@@ -77,11 +90,12 @@ class SzConfigManagerGrpc(SzConfigManager):
     # -------------------------------------------------------------------------
 
     @catch_sdk_exceptions
-    def create_config_from_config_id(self, config_id: int) -> SzConfig:
+    def create_config_from_config_id(self, config_id: int) -> SzConfigGrpc:
         try:
-            request = szconfigmanager_pb2.GetConfigRequest(config_id=config_id)  # type: ignore[unused-ignore]
-            response = self.stub.GetConfig(request)
-            config_definition = str(response.result)
+            if self.config_cache is None:
+                config_definition = self.get_config(config_id)
+            else:
+                config_definition = self.config_cache.config(config_id, lambda: self.get_config(config_id))
             result = SzConfigGrpc(self.channel)
             result.import_config_definition(config_definition)
             return result
@@ -89,7 +103,7 @@ class SzConfigManagerGrpc(SzConfigManager):
             raise new_exception(err) from err
 
     @catch_sdk_exceptions
-    def create_config_from_string(self, config_definition: str) -> SzConfig:
+    def create_config_from_string(self, config_definition: str) -> SzConfigGrpc:
         try:
             result = SzConfigGrpc(self.channel)
             result.import_config_definition(config_definition)
@@ -99,11 +113,12 @@ class SzConfigManagerGrpc(SzConfigManager):
             raise new_exception(err) from err
 
     @catch_sdk_exceptions
-    def create_config_from_template(self) -> SzConfig:
+    def create_config_from_template(self) -> SzConfigGrpc:
         try:
-            request = szconfigmanager_pb2.GetTemplateConfigRequest()  # type: ignore[unused-ignore]
-            response = self.stub.GetTemplateConfig(request)
-            config_definition = str(response.result)
+            if self.config_cache is None:
+                config_definition = self.get_template_config()
+            else:
+                config_definition = self.config_cache.template(self.get_server_version(), self.get_template_config)
             result = SzConfigGrpc(self.channel)
             result.import_config_definition(config_definition)
             return result
@@ -181,6 +196,37 @@ class SzConfigManagerGrpc(SzConfigManager):
     # Non-public SzConfigManagerCore methods
     # -------------------------------------------------------------------------
 
+    def get_config(self, config_id: int) -> str:
+        """
+        Download the document of a registered configuration.
+
+        :meta private:
+        """
+        request = szconfigmanager_pb2.GetConfigRequest(config_id=config_id)  # type: ignore[unused-ignore]
+        response = self.stub.GetConfig(request)
+        return str(response.result)
+
+    def get_server_version(self) -> str:
+        """
+        Return the VERSION and BUILD_NUMBER of the server, which identify its template.
+
+        :meta private:
+        """
+        request = szproduct_pb2.GetVersionRequest()  # type: ignore[unused-ignore]
+        response = szproduct_pb2_grpc.SzProductStub(self.channel).GetVersion(request)
+        version = json.loads(response.result)
+        return f"{version.get('VERSION', '')}-{version.get('BUILD_NUMBER', '')}"
+
+    def get_template_config(self) -> str:
+        """
+        Download the template configuration.
+
+        :meta private:
+        """
+        request = szconfigmanager_pb2.GetTemplateConfigRequest()  # type: ignore[unused-ignore]
+        response = self.stub.GetTemplateConfig(request)
+        return str(response.result)
+
     def _destroy(self) -> None:
         """Null function in the sz-sdk-python-grpc implementation."""
 
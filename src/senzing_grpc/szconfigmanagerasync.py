@@ -0,0 +1,199 @@
+#! /usr/bin/env python3
+
+"""
+``senzing_grpc.szconfigmanagerasync.SzConfigManagerGrpcAsync`` is an `asyncio`_ `gRPC`_ implementation
+of the `senzing.szconfigmanager.SzConfigManager`_ methods.
+
+.. _asyncio: https://docs.python.org/3/library/asyncio.html
+
+.. _gRPC: https://grpc.io
+.. _senzing.szconfigmanager.SzConfigManager: https://garage.senzing.com/sz-sdk-python/senzing.html#module-senzing.szconfigmanager
+"""
+
+# pylint: disable=E1101
+
+from types import TracebackType
+from typing import Any, Dict, Type, Union
+
+import grpc
+from senzing_grpc_protobuf import szconfigmanager_pb2, szconfigmanager_pb2_grpc
+
+from .szconfigasync import SzConfigGrpcAsync
+from .szhelpers import as_str, catch_sdk_exceptions_async, new_exception
+
+# Metadata
+
+__all__ = ["SzConfigManagerGrpcAsync"]
+__version__ = "0.0.1"  # See https://www.python.org/dev/peps/pep-0396/
+__date__ = "2026-10-18"
+__updated__ = "2026-10-18"
+
+SENZING_PRODUCT_ID = (
+    "5051"  # See https://github.com/senzing-garage/knowledge-base/blob/main/lists/senzing-component-ids.md
+)
+
+# -----------------------------------------------------------------------------
+# SzConfigManagerGrpcAsync class
+# -----------------------------------------------------------------------------
+
+
+class SzConfigManagerGrpcAsync:
+    """
+    SzConfigManager module access library over asyncio gRPC.
+
+    Method names, parameters and return values match ``SzConfigManagerGrpc``, but methods that call the server must be awaited.
+    """
+
+    # -------------------------------------------------------------------------
+    # Python dunder/magic methods
+    # -------------------------------------------------------------------------
+
+    def __init__(
+        self,
+        grpc_channel: grpc.aio.Channel,
+    ) -> None:
+        """
+        Constructor
+
+        For return value of -> None, see https://peps.python.org/pep-0484/#the-meaning-of-annotations
+        """
+
+        self.channel = grpc_channel
+        self.stub = szconfigmanager_pb2_grpc.SzConfigManagerStub(self.channel)
+
+    async def __aenter__(
+        self,
+    ) -> "SzConfigManagerGrpcAsync":
+        """Asynchronous Context Manager method."""
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Union[Type[BaseException], None],
+        exc_val: Union[BaseException, None],
+        exc_tb: Union[TracebackType, None],
+    ) -> None:
+        """Asynchronous Context Manager method."""
+
+    # -------------------------------------------------------------------------
+    # SzConfigManager methods as coroutines
+    # -------------------------------------------------------------------------
+
+    @catch_sdk_exceptions_async
+    async def create_config_from_config_id(self, config_id: int) -> SzConfigGrpcAsync:
+        try:
+            request = szconfigmanager_pb2.GetConfigRequest(config_id=config_id)  # type: ignore[unused-ignore]
+            response = await self.stub.GetConfig(request)
+            config_definition = str(response.result)
+            result = SzConfigGrpcAsync(self.channel)
+            result.import_config_definition(config_definition)
+            return result
+        except Exception as err:
+            raise new_exception(err) from err
+
+    @catch_sdk_exceptions_async
+    async def create_config_from_string(self, config_definition: str) -> SzConfigGrpcAsync:
+        try:
+            result = SzConfigGrpcAsync(self.channel)
+            result.import_config_definition(config_definition)
+            await result.verify_config_definition(config_definition)
+            return result
+        except Exception as err:
+            raise new_exception(err) from err
+
+    @catch_sdk_exceptions_async
+    async def create_config_from_template(self) -> SzConfigGrpcAsync:
+        try:
+            request = szconfigmanager_pb2.GetTemplateConfigRequest()  # type: ignore[unused-ignore]
+            response = await self.stub.GetTemplateConfig(request)
+            config_definition = str(response.result)
+            result = SzConfigGrpcAsync(self.channel)
+            result.import_config_definition(config_definition)
+            return result
+        except Exception as err:
+            raise new_exception(err) from err
+
+    @catch_sdk_exceptions_async
+    async def get_config_registry(self) -> str:
+        try:
+            request = szconfigmanager_pb2.GetConfigRegistryRequest()  # type: ignore[unused-ignore]
+            response = await self.stub.GetConfigRegistry(request)
+            return str(response.result)
+        except Exception as err:
+            raise new_exception(err) from err
+
+    @catch_sdk_exceptions_async
+    async def get_default_config_id(self) -> int:
+        try:
+            request = szconfigmanager_pb2.GetDefaultConfigIdRequest()  # type: ignore[unused-ignore]
+            response = await self.stub.GetDefaultConfigId(request)
+            return int(response.result)
+        except Exception as err:
+            raise new_exception(err) from err
+
+    @catch_sdk_exceptions_async
+    async def register_config(
+        self,
+        config_definition: str,
+        config_comment: str,
+    ) -> int:
+        try:
+            request = szconfigmanager_pb2.RegisterConfigRequest(  # type: ignore[unused-ignore]
+                config_definition=as_str(config_definition),
+                config_comment=as_str(config_comment),
+            )
+            response = await self.stub.RegisterConfig(request)
+            return int(response.result)
+        except Exception as err:
+            raise new_exception(err) from err
+
+    @catch_sdk_exceptions_async
+    async def replace_default_config_id(self, current_default_config_id: int, new_default_config_id: int) -> None:
+        try:
+            request = szconfigmanager_pb2.ReplaceDefaultConfigIdRequest(  # type: ignore[unused-ignore]
+                current_default_config_id=current_default_config_id,
+                new_default_config_id=new_default_config_id,
+            )
+            await self.stub.ReplaceDefaultConfigId(request)
+        except Exception as err:
+            raise new_exception(err) from err
+
+    @catch_sdk_exceptions_async
+    async def set_default_config(self, config_definition: str, config_comment: str) -> int:
+        try:
+            request = szconfigmanager_pb2.SetDefaultConfigRequest(  # type: ignore[unused-ignore]
+                config_definition=as_str(config_definition),
+                config_comment=as_str(config_comment),
+            )
+            response = await self.stub.SetDefaultConfig(request)
+            return int(response.result)
+        except Exception as err:
+            raise new_exception(err) from err
+
+    @catch_sdk_exceptions_async
+    async def set_default_config_id(self, config_id: int) -> None:
+        try:
+            request = szconfigmanager_pb2.SetDefaultConfigIdRequest(  # type: ignore[unused-ignore]
+                config_id=config_id,
+            )
+            await self.stub.SetDefaultConfigId(request)
+        except Exception as err:
+            raise new_exception(err) from err
+
+    # -------------------------------------------------------------------------
+    # Non-public SzConfigManagerCore methods
+    # -------------------------------------------------------------------------
+
+    async def _destroy(self) -> None:
+        """Null function in the sz-sdk-python-grpc implementation."""
+
+    async def initialize(
+        self,
+        instance_name: str,
+        settings: Union[str, Dict[Any, Any]],
+        verbose_logging: int = 0,
+    ) -> None:
+        """Null function in the sz-sdk-python-grpc implementation."""
+        _ = instance_name
+        _ = settings
+        _ = verbose_logging
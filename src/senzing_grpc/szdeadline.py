@@ -0,0 +1,223 @@
+#! /usr/bin/env python3
+
+"""
+``senzing_grpc.szdeadline.SzDeadlines`` gives every `gRPC`_ call a deadline according to its class of method.
+
+Without a deadline, a call to a stuck server waits forever.
+``SzDeadlines`` sets a default timeout for reads, writes, exports and diagnostics,
+leaves export streams, which may run for hours, without one unless asked, and ``deadline`` overrides it for the calls made inside a ``with`` block.
+``SzAbstractFactoryGrpc`` applies ``SzDeadlines()`` unless given other deadlines, or None.
+A call that runs out of time raises ``SzDeadlineExceededError``.
+
+.. code-block:: python
+
+    sz_abstract_factory = SzAbstractFactoryGrpc(grpc_channel, deadlines=SzDeadlines(reads=5.0))
+    sz_engine = sz_abstract_factory.create_engine()
+    with deadline(0.5):
+        sz_engine.get_entity_by_entity_id(1)
+
+.. _gRPC: https://grpc.io
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, Optional
+
+import grpc
+
+from .szhelpers import with_timeout
+
+# Metadata
+
+__all__ = ["DIAGNOSTICS", "EXPORTS", "READS", "STREAMS", "WRITES", "SzDeadlines", "deadline"]
+__version__ = "0.0.1"  # See https://www.python.org/dev/peps/pep-0396/
+__date__ = "2026-10-18"
+__updated__ = "2026-10-18"
+
+READS = "reads"
+WRITES = "writes"
+EXPORTS = "exports"
+STREAMS = "streams"
+DIAGNOSTICS = "diagnostics"
+
+METHOD_CLASSES = {
+    "/szconfigmanager.SzConfigManager/RegisterConfig": WRITES,
+    "/szconfigmanager.SzConfigManager/ReplaceDefaultConfigId": WRITES,
+    "/szconfigmanager.SzConfigManager/SetDefaultConfig": WRITES,
+    "/szconfigmanager.SzConfigManager/SetDefaultConfigId": WRITES,
+    "/szengine.SzEngine/AddRecord": WRITES,
+    "/szengine.SzEngine/CloseExportReport": EXPORTS,
+    "/szengine.SzEngine/DeleteRecord": WRITES,
+    "/szengine.SzEngine/ExportCsvEntityReport": EXPORTS,
+    "/szengine.SzEngine/ExportJsonEntityReport": EXPORTS,
+    "/szengine.SzEngine/FetchNext": EXPORTS,
+    "/szengine.SzEngine/GetRedoRecord": WRITES,
+    "/szengine.SzEngine/GetStats": DIAGNOSTICS,
+    "/szengine.SzEngine/PrimeEngine": DIAGNOSTICS,
+    "/szengine.SzEngine/ProcessRedoRecord": WRITES,
+    "/szengine.SzEngine/ReevaluateEntity": WRITES,
+    "/szengine.SzEngine/ReevaluateRecord": WRITES,
+    "/szengine.SzEngine/Reinitialize": DIAGNOSTICS,
+    "/szengine.SzEngine/StreamExportCsvEntityReport": STREAMS,
+    "/szengine.SzEngine/StreamExportJsonEntityReport": STREAMS,
+}
+"""The class of each method that is not a read. Every method of ``SzDiagnostic`` is a diagnostic."""
+
+UNSET = object()
+
+DEADLINE_OVERRIDE: ContextVar[Any] = ContextVar("DEADLINE_OVERRIDE", default=UNSET)
+
+# -----------------------------------------------------------------------------
+# SzDeadlines class
+# -----------------------------------------------------------------------------
+
+
+class SzDeadlines(grpc.UnaryUnaryClientInterceptor, grpc.UnaryStreamClientInterceptor):  # type: ignore[misc]
+    """
+    Sets the timeout of each call from the class of its method, unless the caller set one.
+
+    The exports deadline bounds each ``fetch_next`` call.
+    The streams deadline bounds the whole stream of an ``export_*_iterator`` or ``export_*_to_file``,
+    so it has none by default.
+    A class given None has no deadline.
+
+    Args:
+        reads (float, optional): Seconds allowed for a read, e.g. ``get_entity_by_entity_id``. Defaults to 30.0.
+        writes (float, optional): Seconds allowed for a change, e.g. ``add_record``. Defaults to 60.0.
+        exports (float, optional): Seconds allowed for an export call. Defaults to 600.0.
+        streams (float, optional): Seconds allowed for a whole export stream. Defaults to None.
+        diagnostics (float, optional): Seconds allowed for ``SzDiagnostic`` and engine maintenance calls. Defaults to 300.0.
+    """
+
+    # -------------------------------------------------------------------------
+    # Python dunder/magic methods
+    # -------------------------------------------------------------------------
+
+    def __init__(
+        self,
+        reads: Optional[float] = 30.0,
+        writes: Optional[float] = 60.0,
+        exports: Optional[float] = 600.0,
+        diagnostics: Optional[float] = 300.0,
+        streams: Optional[float] = None,
+    ) -> None:
+        """
+        Constructor
+
+        For return value of -> None, see https://peps.python.org/pep-0484/#the-meaning-of-annotations
+        """
+        self.timeouts: Dict[str, Optional[float]] = {
+            READS: reads,
+            WRITES: writes,
+            EXPORTS: exports,
+            DIAGNOSTICS: diagnostics,
+            STREAMS: streams,
+        }
+
+    # -------------------------------------------------------------------------
+    # SzDeadlines methods
+    # -------------------------------------------------------------------------
+
+    def intercept(self, grpc_channel: grpc.Channel) -> grpc.Channel:
+        """
+        Return a channel whose calls get deadlines from this object.
+
+        Args:
+            grpc_channel (grpc.Channel): The channel to wrap.
+
+        Returns:
+            grpc.Channel: The wrapped channel.
+        """
+        return grpc.intercept_channel(grpc_channel, self)
+
+    def timeout_for(self, method: str) -> Optional[float]:
+        """
+        Return the timeout a call to the method gets, taking any ``deadline`` override into account.
+
+        Args:
+            method (str): The full method name, e.g. "/szengine.SzEngine/AddRecord".
+
+        Returns:
+            Optional[float]: Seconds, or None for no deadline.
+        """
+        override = DEADLINE_OVERRIDE.get()
+        if override is not UNSET:
+            return override  # type: ignore[no-any-return]
+        return self.timeouts[method_class(method)]
+
+    # -------------------------------------------------------------------------
+    # grpc.UnaryUnaryClientInterceptor and grpc.UnaryStreamClientInterceptor methods
+    # -------------------------------------------------------------------------
+
+    def intercept_unary_stream(
+        self,
+        continuation: Callable[[grpc.ClientCallDetails, Any], Any],
+        client_call_details: grpc.ClientCallDetails,
+        request: Any,
+    ) -> Any:
+        return continuation(self.with_deadline(client_call_details), request)
+
+    def intercept_unary_unary(
+        self,
+        continuation: Callable[[grpc.ClientCallDetails, Any], Any],
+        client_call_details: grpc.ClientCallDetails,
+        request: Any,
+    ) -> Any:
+        return continuation(self.with_deadline(client_call_details), request)
+
+    # -------------------------------------------------------------------------
+    # Non-public SzDeadlines methods
+    # -------------------------------------------------------------------------
+
+    def with_deadline(self, client_call_details: grpc.ClientCallDetails) -> grpc.ClientCallDetails:
+        """
+        Add the method's timeout to call details that have none.
+
+        :meta private:
+        """
+        if client_call_details.timeout is not None:
+            return client_call_details
+        return with_timeout(client_call_details, self.timeout_for(client_call_details.method))
+
+
+# -----------------------------------------------------------------------------
+# Helper functions
+# -----------------------------------------------------------------------------
+
+
+@contextmanager
+def deadline(seconds: Optional[float]) -> Iterator[None]:
+    """
+    Use this timeout, instead of the ``SzDeadlines`` default, for calls started in the ``with`` block.
+    None removes the deadline.
+
+    Args:
+        seconds (Optional[float]): Seconds allowed for each call.
+    """
+    token = DEADLINE_OVERRIDE.set(seconds)
+    try:
+        yield
+    finally:
+        DEADLINE_OVERRIDE.reset(token)
+
+
+def method_class(method: str) -> str:
+    """
+    Return READS, WRITES, EXPORTS, STREAMS or DIAGNOSTICS for a full method name.
+
+    :meta private:
+    """
+    if method.startswith("/szdiagnostic."):
+        return DIAGNOSTICS
+    return METHOD_CLASSES.get(method, READS)
+
+
+def with_deadlines(grpc_channel: grpc.Channel, deadlines: Optional[SzDeadlines]) -> grpc.Channel:
+    """
+    Wrap the channel with the deadlines, if there are any.
+
+    :meta private:
+    """
+    if deadlines is None:
+        return grpc_channel
+    return deadlines.intercept(grpc_channel)
@@ -18,6 +18,7 @@ from senzing import SzDiagnostic
 from senzing_grpc_protobuf import szdiagnostic_pb2, szdiagnostic_pb2_grpc
 
 from .szhelpers import catch_sdk_exceptions, new_exception
+from .szretry import SzRetryPolicy, with_retry_policy
 
 # Metadata
 
@@ -47,6 +48,7 @@ class SzDiagnosticGrpc(SzDiagnostic):
     def __init__(
         self,
         grpc_channel: grpc.Channel,
+        retry_policy: Optional[SzRetryPolicy] = None,
     ) -> None:
         """
         Constructor
@@ -56,7 +58,7 @@ class SzDiagnosticGrpc(SzDiagnostic):
 
         # pylint: disable=W0613
 
-        self.channel = grpc_channel
+        self.channel = with_retry_policy(grpc_channel, retry_policy)
         self.stub = szdiagnostic_pb2_grpc.SzDiagnosticStub(self.channel)
 
     def __enter__(
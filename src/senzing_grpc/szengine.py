@@ -11,26 +11,78 @@ of the `senzing.szengine.SzEngine`_ interface.
 # pylint: disable=E1101,C0302
 
 import json
+import multiprocessing
+import os
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
 from types import TracebackType
-from typing import Any, Dict, Iterable, List, Optional, Tuple, Type, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
 
 import grpc
-from senzing import SzEngine, SzEngineFlags
+from senzing import SzEngine, SzEngineFlags, SzSdkError
 from senzing_grpc_protobuf import szengine_pb2, szengine_pb2_grpc
 
-from .szhelpers import as_str, catch_sdk_exceptions, new_exception
+from .szentitycache import SzEntityCache, with_entity_cache
+from .szexport import (
+    SzExportIterator,
+    SzExportResult,
+    parse_export,
+    write_export,
+    write_resumable_export,
+)
+from .szhelpers import (
+    as_future,
+    as_str,
+    catch_sdk_exceptions,
+    failed_future,
+    new_exception,
+    pipelined,
+)
+from .szretry import SzRetryPolicy, with_retry_policy
+from .szsingleflight import SzSingleFlight, with_single_flight
 
 # Metadata
 
-__all__ = ["SzEngineGrpc"]
+__all__ = ["SzAddRecordResult", "SzEngineGrpc", "SzEngineGrpcFutures"]
 __version__ = "0.0.1"  # See https://www.python.org/dev/peps/pep-0396/
 __date__ = "2025-01-10"
-__updated__ = "2025-01-16"
+__updated__ = "2026-10-18"
 
 SENZING_PRODUCT_ID = (
     "5053"  # See https://github.com/senzing-garage/knowledge-base/blob/main/lists/senzing-component-ids.md
 )
 
+# -----------------------------------------------------------------------------
+# SzAddRecordResult class
+# -----------------------------------------------------------------------------
+
+
+class SzAddRecordResult(NamedTuple):
+    """
+    The outcome of one record submitted to ``SzEngineGrpc.add_records``.
+    """
+
+    position: int
+    """Zero-based position of the record in the input."""
+    data_source_code: str
+    record_id: str
+    result: str
+    """The ``add_record`` response. Empty if ``error`` is set or flags did not request WITH_INFO."""
+    error: Optional[Exception]
+    """The mapped Senzing exception, or None if the record was added."""
+
+
 # -----------------------------------------------------------------------------
 # SzEngineGrpc class
 # -----------------------------------------------------------------------------
@@ -48,6 +100,9 @@ class SzEngineGrpc(SzEngine):
     def __init__(
         self,
         grpc_channel: grpc.Channel,
+        retry_policy: Optional[SzRetryPolicy] = None,
+        entity_cache: Optional[SzEntityCache] = None,
+        single_flight: Optional[SzSingleFlight] = None,
     ) -> None:
         """
         Constructor
@@ -55,8 +110,11 @@ class SzEngineGrpc(SzEngine):
         For return value of -> None, see https://peps.python.org/pep-0484/#the-meaning-of-annotations
         """
 
-        self.channel = grpc_channel
+        self.channel = with_entity_cache(
+            with_single_flight(with_retry_policy(grpc_channel, retry_policy), single_flight), entity_cache
+        )
         self.stub = szengine_pb2_grpc.SzEngineStub(self.channel)
+        self.futures = SzEngineGrpcFutures(self.channel)
         self.noop = ""
 
     def __enter__(
@@ -97,6 +155,46 @@ class SzEngineGrpc(SzEngine):
         except Exception as err:
             raise new_exception(err) from err
 
+    def add_records(
+        self,
+        records: Iterable[Tuple[str, str, str]],
+        flags: int = SzEngineFlags.SZ_ADD_RECORD_DEFAULT_FLAGS,
+        max_in_flight: int = 64,
+        ordered: bool = False,
+    ) -> Iterator[SzAddRecordResult]:
+        """
+        The `add_records` method loads many records, keeping up to `max_in_flight` AddRecord RPCs outstanding.
+
+        Records are read from `records` lazily, so the input may be larger than memory.
+        Each record is sent with ``futures.add_record``.
+        A failing record does not stop the load; its error is reported in the result.
+        Leaving the iterator early cancels the requests still in flight.
+
+        Args:
+            records (Iterable[Tuple[str, str, str]]): (data_source_code, record_id, record_definition) tuples.
+            flags (int, optional): Flags used to control information returned. Defaults to SzEngineFlags.SZ_ADD_RECORD_DEFAULT_FLAGS.
+            max_in_flight (int, optional): Maximum number of outstanding requests. Defaults to 64.
+            ordered (bool, optional): If True, results are yielded in input order instead of completion order. Defaults to False.
+
+        Yields:
+            SzAddRecordResult: One result per input record.
+        """
+        if max_in_flight < 1:
+            raise SzSdkError(f"max_in_flight must be at least 1, not {max_in_flight}")
+
+        def submit(record: Tuple[str, str, str]) -> "Future[str]":
+            data_source_code, record_id, record_definition = record
+            try:
+                return self.futures.add_record(data_source_code, record_id, record_definition, flags)
+            except SzSdkError as err:
+                return failed_future(err)
+
+        for position, (data_source_code, record_id, _), future in pipelined(submit, records, max_in_flight, ordered):
+            try:
+                yield SzAddRecordResult(position, data_source_code, record_id, future.result(), None)
+            except Exception as err:  # pylint: disable=W0718
+                yield SzAddRecordResult(position, data_source_code, record_id, "", err)
+
     @catch_sdk_exceptions
     def close_export_report(self, export_handle: int) -> None:
         try:
@@ -155,18 +253,80 @@ class SzEngineGrpc(SzEngine):
         self,
         csv_column_list: str,
         flags: int = SzEngineFlags.SZ_EXPORT_DEFAULT_FLAGS,
-    ) -> Iterable[str]:
-        """TODO: Add method docstring to export_csv_entity_report_iterator."""
+        prefetch_lines: int = 0,
+        prefetch_bytes: int = 0,
+    ) -> SzExportIterator:
+        """
+        The `export_csv_entity_report_iterator` method streams the lines of a CSV export.
+
+        Given `prefetch_lines` or `prefetch_bytes`, a background thread reads the stream ahead of the consumer
+        into a buffer of at most that many lines or bytes, so slow processing of each line does not slow the transfer.
+
+        Args:
+            csv_column_list (str): A comma-separated list of column names for the CSV export.
+            flags (int, optional): Flags used to control information returned. Defaults to SzEngineFlags.SZ_EXPORT_DEFAULT_FLAGS.
+            prefetch_lines (int, optional): Lines read ahead of the consumer. Defaults to 0, no limit if prefetch_bytes is set, else no prefetching.
+            prefetch_bytes (int, optional): Bytes read ahead of the consumer. Defaults to 0, no limit if prefetch_lines is set, else no prefetching.
+
+        Returns:
+            SzExportIterator: The CSV header, then one line per entity. Closing it cancels the export.
+        """
         try:
             request = szengine_pb2.StreamExportCsvEntityReportRequest(  # type: ignore[unused-ignore]
                 csv_column_list=as_str(csv_column_list), flags=flags
             )
-            for item in self.stub.StreamExportCsvEntityReport(request):
-                if item.result:
-                    yield item.result
+            return SzExportIterator(
+                lambda: self.stub.StreamExportCsvEntityReport(request), prefetch_lines, prefetch_bytes
+            )
         except Exception as err:
             raise new_exception(err) from err
 
+    def export_csv_entity_report_to_file(  # pylint: disable=R0913,R0917
+        self,
+        path: str,
+        csv_column_list: str,
+        flags: int = SzEngineFlags.SZ_EXPORT_DEFAULT_FLAGS,
+        compress: bool = False,
+        buffer_bytes: int = 1024 * 1024,
+        prefetch_bytes: int = 8 * 1024 * 1024,
+        progress: Optional[Callable[[SzExportResult], None]] = None,
+        checkpoint_seconds: Optional[float] = None,
+    ) -> SzExportResult:
+        """
+        The `export_csv_entity_report_to_file` method writes a CSV export to a file.
+
+        The stream is read ahead on a background thread while batches of about `buffer_bytes` are written,
+        each with one call. The file is written under a temporary name and renamed to `path` when complete,
+        so `path` never holds a partial export.
+
+        Given `checkpoint_seconds`, the export is resumable. It is written to `path` + ".partial" and its progress
+        is checkpointed in `path` + ".checkpoint" at that interval. Called again with the same arguments after
+        an interruption, it verifies the partial file against the checkpoint's SHA-256 digest and, as the export
+        stream cannot start part way, reads the stream again from the start, skipping the lines already written.
+
+        Args:
+            path (str): The file to write.
+            csv_column_list (str): A comma-separated list of column names for the CSV export.
+            flags (int, optional): Flags used to control information returned. Defaults to SzEngineFlags.SZ_EXPORT_DEFAULT_FLAGS.
+            compress (bool, optional): Write the file gzip-compressed. Defaults to False.
+            buffer_bytes (int, optional): Bytes joined into each write. Defaults to 1 MiB.
+            prefetch_bytes (int, optional): Bytes read ahead of the writes. Defaults to 8 MiB.
+            progress (Callable[[SzExportResult], None], optional): Called after each write with the progress so far. Defaults to None.
+            checkpoint_seconds (float, optional): Seconds between checkpoints of a resumable export. Defaults to None, not resumable.
+
+        Returns:
+            SzExportResult: The lines and bytes written and the throughput.
+        """
+        if buffer_bytes < 1:
+            raise SzSdkError(f"buffer_bytes must be at least 1, not {buffer_bytes}")
+        with self.export_csv_entity_report_iterator(csv_column_list, flags, prefetch_bytes=prefetch_bytes) as fragments:
+            if checkpoint_seconds is None:
+                return write_export(fragments, path, compress, buffer_bytes, progress)
+            settings = {"export": "csv", "csv_column_list": csv_column_list, "flags": flags}
+            return write_resumable_export(
+                fragments, path, settings, compress, buffer_bytes, progress, checkpoint_seconds
+            )
+
     @catch_sdk_exceptions
     def export_json_entity_report(self, flags: int = SzEngineFlags.SZ_EXPORT_DEFAULT_FLAGS) -> int:
         try:
@@ -182,16 +342,120 @@ class SzEngineGrpc(SzEngine):
     def export_json_entity_report_iterator(
         self,
         flags: int = SzEngineFlags.SZ_EXPORT_DEFAULT_FLAGS,
-    ) -> Iterable[str]:
-        """TODO: Add method docstring to export_json_entity_report_iterator."""
+        prefetch_lines: int = 0,
+        prefetch_bytes: int = 0,
+    ) -> SzExportIterator:
+        """
+        The `export_json_entity_report_iterator` method streams the entities of a JSON export, one JSON document per line.
+
+        Given `prefetch_lines` or `prefetch_bytes`, a background thread reads the stream ahead of the consumer
+        into a buffer of at most that many lines or bytes, so slow processing of each line does not slow the transfer.
+
+        Args:
+            flags (int, optional): Flags used to control information returned. Defaults to SzEngineFlags.SZ_EXPORT_DEFAULT_FLAGS.
+            prefetch_lines (int, optional): Lines read ahead of the consumer. Defaults to 0, no limit if prefetch_bytes is set, else no prefetching.
+            prefetch_bytes (int, optional): Bytes read ahead of the consumer. Defaults to 0, no limit if prefetch_lines is set, else no prefetching.
+
+        Returns:
+            SzExportIterator: One line per entity. Closing it cancels the export.
+        """
         try:
             request = szengine_pb2.StreamExportJsonEntityReportRequest(flags=flags)  # type: ignore[unused-ignore]
-            for item in self.stub.StreamExportJsonEntityReport(request):
-                if item.result:
-                    yield item.result
+            return SzExportIterator(
+                lambda: self.stub.StreamExportJsonEntityReport(request), prefetch_lines, prefetch_bytes
+            )
         except Exception as err:
             raise new_exception(err) from err
 
+    def export_json_entity_report_parsed(  # pylint: disable=R0913,R0917
+        self,
+        flags: int = SzEngineFlags.SZ_EXPORT_DEFAULT_FLAGS,
+        transform: Optional[Callable[[Any], Any]] = None,
+        max_workers: Optional[int] = None,
+        batch_lines: int = 1000,
+        ordered: bool = True,
+        executor: Optional[Executor] = None,
+    ) -> Iterator[Any]:
+        """
+        The `export_json_entity_report_parsed` method streams a JSON export like `export_json_entity_report_iterator`,
+        parsing the entities in a pool of processes instead of the consumer's thread.
+
+        Batches of `batch_lines` raw lines are sent to the processes, which parse each line with ``json.loads``
+        and pass the entity through `transform`, so the consumer only receives the results.
+        At most two batches per worker are outstanding, so the export is never read far ahead of the consumer.
+        Leaving the iterator early cancels the batches not yet started.
+        A new pool starts its processes with the spawn method, as forking a process using gRPC is unsafe.
+
+        Args:
+            flags (int, optional): Flags used to control information returned. Defaults to SzEngineFlags.SZ_EXPORT_DEFAULT_FLAGS.
+            transform (Callable[[Any], Any], optional): Applied to each parsed entity in the worker processes. Must be picklable, e.g. a module-level function. Defaults to None, the parsed entity.
+            max_workers (int, optional): Processes in the pool. Defaults to None, the number of CPUs.
+            batch_lines (int, optional): Lines sent to a process at a time. Defaults to 1000.
+            ordered (bool, optional): If True, results are yielded in export order instead of the order batches finish. Defaults to True.
+            executor (Executor, optional): An executor to use instead of a new pool, e.g. one shared across exports. It is not shut down. Defaults to None.
+
+        Yields:
+            Any: Each parsed, transformed entity.
+        """
+        if batch_lines < 1:
+            raise SzSdkError(f"batch_lines must be at least 1, not {batch_lines}")
+        fragments = self.export_json_entity_report_iterator(flags, prefetch_lines=batch_lines)
+        pool = None
+        if executor is None:
+            pool = ProcessPoolExecutor(max_workers, mp_context=multiprocessing.get_context("spawn"))
+            executor = pool
+        max_in_flight = 2 * (max_workers or os.cpu_count() or 1)
+        try:
+            yield from parse_export(fragments, transform, executor, batch_lines, ordered, max_in_flight)
+        finally:
+            fragments.close()
+            if pool is not None:
+                pool.shutdown(wait=False, cancel_futures=True)
+
+    def export_json_entity_report_to_file(  # pylint: disable=R0913,R0917
+        self,
+        path: str,
+        flags: int = SzEngineFlags.SZ_EXPORT_DEFAULT_FLAGS,
+        compress: bool = False,
+        buffer_bytes: int = 1024 * 1024,
+        prefetch_bytes: int = 8 * 1024 * 1024,
+        progress: Optional[Callable[[SzExportResult], None]] = None,
+        checkpoint_seconds: Optional[float] = None,
+    ) -> SzExportResult:
+        """
+        The `export_json_entity_report_to_file` method writes a JSON export to a file, one entity per line.
+
+        The stream is read ahead on a background thread while batches of about `buffer_bytes` are written,
+        each with one call. The file is written under a temporary name and renamed to `path` when complete,
+        so `path` never holds a partial export.
+
+        Given `checkpoint_seconds`, the export is resumable. It is written to `path` + ".partial" and its progress
+        is checkpointed in `path` + ".checkpoint" at that interval. Called again with the same arguments after
+        an interruption, it verifies the partial file against the checkpoint's SHA-256 digest and, as the export
+        stream cannot start part way, reads the stream again from the start, skipping the lines already written.
+
+        Args:
+            path (str): The file to write.
+            flags (int, optional): Flags used to control information returned. Defaults to SzEngineFlags.SZ_EXPORT_DEFAULT_FLAGS.
+            compress (bool, optional): Write the file gzip-compressed. Defaults to False.
+            buffer_bytes (int, optional): Bytes joined into each write. Defaults to 1 MiB.
+            prefetch_bytes (int, optional): Bytes read ahead of the writes. Defaults to 8 MiB.
+            progress (Callable[[SzExportResult], None], optional): Called after each write with the progress so far. Defaults to None.
+            checkpoint_seconds (float, optional): Seconds between checkpoints of a resumable export. Defaults to None, not resumable.
+
+        Returns:
+            SzExportResult: The lines and bytes written and the throughput.
+        """
+        if buffer_bytes < 1:
+            raise SzSdkError(f"buffer_bytes must be at least 1, not {buffer_bytes}")
+        with self.export_json_entity_report_iterator(flags, prefetch_bytes=prefetch_bytes) as fragments:
+            if checkpoint_seconds is None:
+                return write_export(fragments, path, compress, buffer_bytes, progress)
+            settings = {"export": "json", "flags": flags}
+            return write_resumable_export(
+                fragments, path, settings, compress, buffer_bytes, progress, checkpoint_seconds
+            )
+
     @catch_sdk_exceptions
     def fetch_next(self, export_handle: int) -> str:
         try:
@@ -627,6 +891,515 @@ class SzEngineGrpc(SzEngine):
             raise new_exception(err) from err
 
 
+# -----------------------------------------------------------------------------
+# SzEngineGrpcFutures class
+# -----------------------------------------------------------------------------
+
+
+class SzEngineGrpcFutures:
+    """
+    Non-blocking counterparts of the ``SzEngineGrpc`` methods, available as ``SzEngineGrpc.futures``.
+
+    Each method takes the same arguments as its ``SzEngineGrpc`` namesake, starts the RPC and returns a
+    ``concurrent.futures.Future``. ``Future.result()`` returns what the blocking method would have returned
+    or raises the same mapped ``SzError``. Cancelling the future cancels the RPC.
+    Invalid argument types raise ``SzSdkError`` immediately.
+    """
+
+    # -------------------------------------------------------------------------
+    # Python dunder/magic methods
+    # -------------------------------------------------------------------------
+
+    def __init__(
+        self,
+        grpc_channel: grpc.Channel,
+    ) -> None:
+        """
+        Constructor
+
+        For return value of -> None, see https://peps.python.org/pep-0484/#the-meaning-of-annotations
+        """
+
+        self.channel = grpc_channel
+        self.stub = szengine_pb2_grpc.SzEngineStub(self.channel)
+
+    # -------------------------------------------------------------------------
+    # SzEngine methods returning futures
+    # -------------------------------------------------------------------------
+    @catch_sdk_exceptions
+    def add_record(
+        self,
+        data_source_code: str,
+        record_id: str,
+        record_definition: str,
+        flags: int = SzEngineFlags.SZ_ADD_RECORD_DEFAULT_FLAGS,
+    ) -> "Future[str]":
+        try:
+            request = szengine_pb2.AddRecordRequest(  # type: ignore[unused-ignore]
+                data_source_code=as_str(data_source_code),
+                record_id=as_str(record_id),
+                record_definition=as_str(record_definition),
+                flags=flags,
+            )
+            return as_future(self.stub.AddRecord.future(request), lambda response: str(response.result))
+        except Exception as err:
+            raise new_exception(err) from err
+
+    @catch_sdk_exceptions
+    def close_export_report(self, export_handle: int) -> "Future[None]":
+        try:
+            request = szengine_pb2.CloseExportReportRequest(  # type: ignore[unused-ignore]
+                export_handle=export_handle,
+            )
+            return as_future(self.stub.CloseExportReport.future(request), lambda _: None)
+        except Exception as err:
+            raise new_exception(err) from err
+
+    @catch_sdk_exceptions
+    def count_redo_records(self) -> "Future[int]":
+        try:
+            request = szengine_pb2.CountRedoRecordsRequest()  # type: ignore[unused-ignore]
+            return as_future(self.stub.CountRedoRecords.future(request), lambda response: int(response.result))
+        except Exception as err:
+            raise new_exception(err) from err
+
+    @catch_sdk_exceptions
+    def delete_record(
+        self,
+        data_source_code: str,
+        record_id: str,
+        flags: int = SzEngineFlags.SZ_DELETE_RECORD_DEFAULT_FLAGS,
+    ) -> "Future[str]":
+        try:
+            request = szengine_pb2.DeleteRecordRequest(  # type: ignore[unused-ignore]
+                data_source_code=as_str(data_source_code),
+                record_id=as_str(record_id),
+                flags=flags,
+            )
+            return as_future(self.stub.DeleteRecord.future(request), lambda response: str(response.result))
+        except Exception as err:
+            raise new_exception(err) from err
+
+    @catch_sdk_exceptions
+    def export_csv_entity_report(
+        self,
+        csv_column_list: str,
+        flags: int = SzEngineFlags.SZ_EXPORT_DEFAULT_FLAGS,
+    ) -> "Future[int]":
+        try:
+            request = szengine_pb2.ExportCsvEntityReportRequest(  # type: ignore[unused-ignore]
+                csv_column_list=as_str(csv_column_list),
+                flags=flags,
+            )
+            return as_future(self.stub.ExportCsvEntityReport.future(request), lambda response: int(response.result))
+        except Exception as err:
+            raise new_exception(err) from err
+
+    @catch_sdk_exceptions
+    def export_json_entity_report(self, flags: int = SzEngineFlags.SZ_EXPORT_DEFAULT_FLAGS) -> "Future[int]":
+        try:
+            request = szengine_pb2.ExportJsonEntityReportRequest(  # type: ignore[unused-ignore]
+                flags=flags,
+            )
+            return as_future(self.stub.ExportJsonEntityReport.future(request), lambda response: int(response.result))
+        except Exception as err:
+            raise new_exception(err) from err
+
+    @catch_sdk_exceptions
+    def fetch_next(self, export_handle: int) -> "Future[str]":
+        try:
+            request = szengine_pb2.FetchNextRequest(  # type: ignore[unused-ignore]
+                export_handle=export_handle,
+            )
+            return as_future(self.stub.FetchNext.future(request), lambda response: str(response.result))
+        except Exception as err:
+            raise new_exception(err) from err
+
+    @catch_sdk_exceptions
+    def find_interesting_entities_by_entity_id(
+        self, entity_id: int, flags: int = SzEngineFlags.SZ_FIND_INTERESTING_ENTITIES_DEFAULT_FLAGS
+    ) -> "Future[str]":
+        try:
+            request = szengine_pb2.FindInterestingEntitiesByEntityIdRequest(  # type: ignore[unused-ignore]
+                entity_id=entity_id,
+                flags=flags,
+            )
+            return as_future(
+                self.stub.FindInterestingEntitiesByEntityId.future(request), lambda response: str(response.result)
+            )
+        except Exception as err:
+            raise new_exception(err) from err
+
+    @catch_sdk_exceptions
+    def find_interesting_entities_by_record_id(
+        self,
+        data_source_code: str,
+        record_id: str,
+        flags: int = SzEngineFlags.SZ_FIND_INTERESTING_ENTITIES_DEFAULT_FLAGS,
+    ) -> "Future[str]":
+        try:
+            request = szengine_pb2.FindInterestingEntitiesByRecordIdRequest(  # type: ignore[unused-ignore]
+                data_source_code=as_str(data_source_code),
+                record_id=as_str(record_id),
+                flags=flags,
+            )
+            return as_future(
+                self.stub.FindInterestingEntitiesByRecordId.future(request), lambda response: str(response.result)
+            )
+        except Exception as err:
+            raise new_exception(err) from err
+
+    @catch_sdk_exceptions
+    def find_network_by_entity_id(
+        self,
+        entity_ids: List[int],
+        max_degrees: int,
+        build_out_degrees: int,
+        build_out_max_entities: int,
+        flags: int = SzEngineFlags.SZ_FIND_NETWORK_DEFAULT_FLAGS,
+    ) -> "Future[str]":
+        try:
+            request = szengine_pb2.FindNetworkByEntityIdRequest(  # type: ignore[unused-ignore]
+                entity_ids=entity_ids_json(entity_ids),
+                max_degrees=max_degrees,
+                build_out_degrees=build_out_degrees,
+                build_out_max_entities=build_out_max_entities,
+                flags=flags,
+            )
+            return as_future(self.stub.FindNetworkByEntityId.future(request), lambda response: str(response.result))
+        except Exception as err:
+            raise new_exception(err) from err
+
+    @catch_sdk_exceptions
+    def find_network_by_record_id(
+        self,
+        record_keys: List[Tuple[str, str]],
+        max_degrees: int,
+        build_out_degrees: int,
+        build_out_max_entities: int,
+        flags: int = SzEngineFlags.SZ_FIND_NETWORK_DEFAULT_FLAGS,
+    ) -> "Future[str]":
+        try:
+            request = szengine_pb2.FindNetworkByRecordIdRequest(  # type: ignore[unused-ignore]
+                record_keys=record_keys_json(record_keys),
+                max_degrees=max_degrees,
+                build_out_degrees=build_out_degrees,
+                build_out_max_entities=build_out_max_entities,
+                flags=flags,
+            )
+            return as_future(self.stub.FindNetworkByRecordId.future(request), lambda response: str(response.result))
+        except Exception as err:
+            raise new_exception(err) from err
+
+    @catch_sdk_exceptions
+    def find_path_by_entity_id(
+        self,
+        start_entity_id: int,
+        end_entity_id: int,
+        max_degrees: int,
+        # TODO Should accept both entity and record IDs in V4, test
+        avoid_entity_ids: Optional[List[int]] = None,
+        required_data_sources: Optional[List[str]] = None,
+        flags: int = SzEngineFlags.SZ_FIND_PATH_DEFAULT_FLAGS,
+    ) -> "Future[str]":
+        try:
+            request = szengine_pb2.FindPathByEntityIdRequest(  # type: ignore[unused-ignore]
+                start_entity_id=start_entity_id,
+                end_entity_id=end_entity_id,
+                max_degrees=max_degrees,
+                avoid_entity_ids=avoid_entity_ids_json(avoid_entity_ids),
+                required_data_sources=required_data_sources_json(required_data_sources),
+                flags=flags,
+            )
+            return as_future(self.stub.FindPathByEntityId.future(request), lambda response: str(response.result))
+        except Exception as err:
+            raise new_exception(err) from err
+
+    @catch_sdk_exceptions
+    def find_path_by_record_id(
+        self,
+        start_data_source_code: str,
+        start_record_id: str,
+        end_data_source_code: str,
+        end_record_id: str,
+        max_degrees: int,
+        avoid_record_keys: Optional[List[Tuple[str, str]]] = None,
+        required_data_sources: Optional[List[str]] = None,
+        flags: int = SzEngineFlags.SZ_FIND_PATH_DEFAULT_FLAGS,
+    ) -> "Future[str]":
+        try:
+            request = szengine_pb2.FindPathByRecordIdRequest(  # type: ignore[unused-ignore]
+                start_data_source_code=as_str(start_data_source_code),
+                start_record_id=as_str(start_record_id),
+                end_data_source_code=as_str(end_data_source_code),
+                end_record_id=as_str(end_record_id),
+                max_degrees=max_degrees,
+                avoid_record_keys=avoid_record_keys_json(avoid_record_keys),
+                required_data_sources=required_data_sources_json(required_data_sources),
+                flags=flags,
+            )
+            return as_future(self.stub.FindPathByRecordId.future(request), lambda response: str(response.result))
+        except Exception as err:
+            raise new_exception(err) from err
+
+    @catch_sdk_exceptions
+    def get_active_config_id(self) -> "Future[int]":
+        try:
+            request = szengine_pb2.GetActiveConfigIdRequest()  # type: ignore[unused-ignore]
+            return as_future(self.stub.GetActiveConfigId.future(request), lambda response: int(response.result))
+        except Exception as err:
+            raise new_exception(err) from err
+
+    @catch_sdk_exceptions
+    def get_entity_by_entity_id(
+        self,
+        entity_id: int,
+        flags: int = SzEngineFlags.SZ_ENTITY_DEFAULT_FLAGS,
+    ) -> "Future[str]":
+        try:
+            request = szengine_pb2.GetEntityByEntityIdRequest(  # type: ignore[unused-ignore]
+                entity_id=entity_id,
+                flags=flags,
+            )
+            return as_future(self.stub.GetEntityByEntityId.future(request), lambda response: str(response.result))
+        except Exception as err:
+            raise new_exception(err) from err
+
+    @catch_sdk_exceptions
+    def get_entity_by_record_id(
+        self,
+        data_source_code: str,
+        record_id: str,
+        flags: int = SzEngineFlags.SZ_ENTITY_DEFAULT_FLAGS,
+    ) -> "Future[str]":
+        try:
+            request = szengine_pb2.GetEntityByRecordIdRequest(  # type: ignore[unused-ignore]
+                data_source_code=as_str(data_source_code),
+                record_id=as_str(record_id),
+                flags=flags,
+            )
+            return as_future(self.stub.GetEntityByRecordId.future(request), lambda response: str(response.result))
+        except Exception as err:
+            raise new_exception(err) from err
+
+    @catch_sdk_exceptions
+    def get_record(
+        self,
+        data_source_code: str,
+        record_id: str,
+        flags: int = SzEngineFlags.SZ_RECORD_DEFAULT_FLAGS,
+    ) -> "Future[str]":
+        try:
+            request = szengine_pb2.GetRecordRequest(  # type: ignore[unused-ignore]
+                data_source_code=as_str(data_source_code),
+                record_id=as_str(record_id),
+                flags=flags,
+            )
+            return as_future(self.stub.GetRecord.future(request), lambda response: str(response.result))
+        except Exception as err:
+            raise new_exception(err) from err
+
+    @catch_sdk_exceptions
+    def get_redo_record(self) -> "Future[str]":
+        try:
+            request = szengine_pb2.GetRedoRecordRequest()  # type: ignore[unused-ignore]
+            return as_future(self.stub.GetRedoRecord.future(request), lambda response: str(response.result))
+        except Exception as err:
+            raise new_exception(err) from err
+
+    @catch_sdk_exceptions
+    def get_stats(self) -> "Future[str]":
+        try:
+            request = szengine_pb2.GetStatsRequest()  # type: ignore[unused-ignore]
+            return as_future(self.stub.GetStats.future(request), lambda response: str(response.result))
+        except Exception as err:
+            raise new_exception(err) from err
+
+    @catch_sdk_exceptions
+    def get_virtual_entity_by_record_id(
+        self,
+        record_keys: List[Tuple[str, str]],
+        flags: int = SzEngineFlags.SZ_VIRTUAL_ENTITY_DEFAULT_FLAGS,
+    ) -> "Future[str]":
+        try:
+            request = szengine_pb2.GetVirtualEntityByRecordIdRequest(  # type: ignore[unused-ignore]
+                record_keys=record_keys_json(record_keys),
+                flags=flags,
+            )
+            return as_future(
+                self.stub.GetVirtualEntityByRecordId.future(request), lambda response: str(response.result)
+            )
+        except Exception as err:
+            raise new_exception(err) from err
+
+    @catch_sdk_exceptions
+    def how_entity_by_entity_id(
+        self,
+        entity_id: int,
+        flags: int = SzEngineFlags.SZ_HOW_ENTITY_DEFAULT_FLAGS,
+    ) -> "Future[str]":
+        try:
+            request = szengine_pb2.HowEntityByEntityIdRequest(  # type: ignore[unused-ignore]
+                entity_id=entity_id,
+                flags=flags,
+            )
+            return as_future(self.stub.HowEntityByEntityId.future(request), lambda response: str(response.result))
+        except Exception as err:
+            raise new_exception(err) from err
+
+    @catch_sdk_exceptions
+    def get_record_preview(
+        self,
+        record_definition: str,
+        flags: int = SzEngineFlags.SZ_RECORD_PREVIEW_DEFAULT_FLAGS,
+    ) -> "Future[str]":
+        try:
+            request = szengine_pb2.GetRecordPreviewRequest(  # type: ignore[unused-ignore]
+                record_definition=as_str(record_definition),
+                flags=flags,
+            )
+            return as_future(self.stub.GetRecordPreview.future(request), lambda response: str(response.result))
+        except Exception as err:
+            raise new_exception(err) from err
+
+    @catch_sdk_exceptions
+    def process_redo_record(self, redo_record: str, flags: int = 0) -> "Future[str]":
+        try:
+            request = szengine_pb2.ProcessRedoRecordRequest(  # type: ignore[unused-ignore]
+                redo_record=as_str(redo_record),
+                flags=flags,
+            )
+            return as_future(self.stub.ProcessRedoRecord.future(request), lambda response: str(response.result))
+        except Exception as err:
+            raise new_exception(err) from err
+
+    @catch_sdk_exceptions
+    def reevaluate_entity(
+        self, entity_id: int, flags: int = SzEngineFlags.SZ_REEVALUATE_RECORD_DEFAULT_FLAGS
+    ) -> "Future[str]":
+        try:
+            request = szengine_pb2.ReevaluateEntityRequest(  # type: ignore[unused-ignore]
+                entity_id=entity_id,
+                flags=flags,
+            )
+            return as_future(self.stub.ReevaluateEntity.future(request), lambda response: str(response.result))
+        except Exception as err:
+            raise new_exception(err) from err
+
+    @catch_sdk_exceptions
+    def reevaluate_record(
+        self, data_source_code: str, record_id: str, flags: int = SzEngineFlags.SZ_REEVALUATE_RECORD_DEFAULT_FLAGS
+    ) -> "Future[str]":
+        try:
+            request = szengine_pb2.ReevaluateRecordRequest(  # type: ignore[unused-ignore]
+                data_source_code=as_str(data_source_code),
+                record_id=as_str(record_id),
+                flags=flags,
+            )
+            return as_future(self.stub.ReevaluateRecord.future(request), lambda response: str(response.result))
+        except Exception as err:
+            raise new_exception(err) from err
+
+    @catch_sdk_exceptions
+    def search_by_attributes(
+        self,
+        attributes: str,
+        flags: int = SzEngineFlags.SZ_SEARCH_BY_ATTRIBUTES_DEFAULT_FLAGS,
+        search_profile: str = "",
+    ) -> "Future[str]":
+        try:
+            request = szengine_pb2.SearchByAttributesRequest(  # type: ignore[unused-ignore]
+                attributes=as_str(attributes),
+                search_profile=as_str(search_profile),
+                flags=flags,
+            )
+            return as_future(self.stub.SearchByAttributes.future(request), lambda response: str(response.result))
+        except Exception as err:
+            raise new_exception(err) from err
+
+    @catch_sdk_exceptions
+    def why_entities(
+        self,
+        entity_id_1: int,
+        entity_id_2: int,
+        flags: int = SzEngineFlags.SZ_WHY_ENTITIES_DEFAULT_FLAGS,
+    ) -> "Future[str]":
+        try:
+            request = szengine_pb2.WhyEntitiesRequest(  # type: ignore[unused-ignore]
+                entity_id_1=entity_id_1,
+                entity_id_2=entity_id_2,
+                flags=flags,
+            )
+            return as_future(self.stub.WhyEntities.future(request), lambda response: str(response.result))
+        except Exception as err:
+            raise new_exception(err) from err
+
+    @catch_sdk_exceptions
+    def why_record_in_entity(
+        self,
+        data_source_code: str,
+        record_id: str,
+        flags: int = SzEngineFlags.SZ_WHY_RECORD_IN_ENTITY_DEFAULT_FLAGS,
+    ) -> "Future[str]":
+        try:
+            request = szengine_pb2.WhyRecordInEntityRequest(  # type: ignore[unused-ignore]
+                data_source_code=as_str(data_source_code),
+                record_id=as_str(record_id),
+                flags=flags,
+            )
+            return as_future(self.stub.WhyRecordInEntity.future(request), lambda response: str(response.result))
+        except Exception as err:
+            raise new_exception(err) from err
+
+    @catch_sdk_exceptions
+    def why_records(
+        self,
+        data_source_code_1: str,
+        record_id_1: str,
+        data_source_code_2: str,
+        record_id_2: str,
+        flags: int = SzEngineFlags.SZ_WHY_RECORDS_DEFAULT_FLAGS,
+    ) -> "Future[str]":
+        try:
+            request = szengine_pb2.WhyRecordsRequest(  # type: ignore[unused-ignore]
+                data_source_code_1=as_str(data_source_code_1),
+                record_id_1=as_str(record_id_1),
+                data_source_code_2=as_str(data_source_code_2),
+                record_id_2=as_str(record_id_2),
+                flags=flags,
+            )
+            return as_future(self.stub.WhyRecords.future(request), lambda response: str(response.result))
+        except Exception as err:
+            raise new_exception(err) from err
+
+    @catch_sdk_exceptions
+    def why_search(
+        self,
+        attributes: str,
+        entity_id: int,
+        flags: int = SzEngineFlags.SZ_WHY_SEARCH_DEFAULT_FLAGS,
+        search_profile: str = "",
+    ) -> "Future[str]":
+        try:
+            request = szengine_pb2.WhySearchRequest(  # type: ignore[unused-ignore]
+                attributes=as_str(attributes),
+                entity_id=entity_id,
+                search_profile=as_str(search_profile),
+                flags=flags,
+            )
+            return as_future(self.stub.WhySearch.future(request), lambda response: str(response.result))
+        except Exception as err:
+            raise new_exception(err) from err
+
+    @catch_sdk_exceptions
+    def reinitialize(self, config_id: int) -> "Future[None]":
+        try:
+            request = szengine_pb2.ReinitializeRequest(config_id=config_id)  # type: ignore[unused-ignore]
+            return as_future(self.stub.Reinitialize.future(request), lambda _: None)
+        except Exception as err:
+            raise new_exception(err) from err
+
+
 # -----------------------------------------------------------------------------
 # Helper functions
 # -----------------------------------------------------------------------------
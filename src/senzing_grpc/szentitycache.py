@@ -0,0 +1,455 @@
+#! /usr/bin/env python3
+
+"""
+``senzing_grpc.szentitycache.SzEntityCache`` keeps recent ``get_entity_by_entity_id``
+and ``get_entity_by_record_id`` responses, so repeated reads of an entity do not go to the `gRPC`_ server.
+
+An entry is dropped when it is older than ``ttl_seconds``, when the cache needs room,
+or when a change reported WITH_INFO lists the entity in ``AFFECTED_ENTITIES``.
+Changes made without WITH_INFO only drop the entries of the record they name,
+so other entries of the entities they touch may be stale until their ``ttl_seconds`` runs out.
+
+.. code-block:: python
+
+    entity_cache = SzEntityCache(max_bytes=256 * 1024 * 1024, ttl_seconds=30.0)
+    sz_abstract_factory = SzAbstractFactoryGrpc(grpc_channel, entity_cache=entity_cache)
+    ...
+    print(entity_cache.stats())
+
+.. _gRPC: https://grpc.io
+"""
+
+# pylint: disable=R0902
+
+import json
+import sys
+import threading
+import time
+import types
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, NamedTuple, Optional, Set, Tuple
+
+import grpc
+
+# Metadata
+
+__all__ = ["SzEntityCache"]
+__version__ = "0.0.1"  # See https://www.python.org/dev/peps/pep-0396/
+__date__ = "2026-10-18"
+__updated__ = "2026-10-18"
+
+ENTITY_READ_METHODS = frozenset(
+    [
+        "/szengine.SzEngine/GetEntityByEntityId",
+        "/szengine.SzEngine/GetEntityByRecordId",
+    ]
+)
+"""Methods whose responses are cached."""
+
+CHANGE_METHODS = frozenset(
+    [
+        "/szengine.SzEngine/AddRecord",
+        "/szengine.SzEngine/DeleteRecord",
+        "/szengine.SzEngine/ProcessRedoRecord",
+        "/szengine.SzEngine/ReevaluateEntity",
+        "/szengine.SzEngine/ReevaluateRecord",
+    ]
+)
+"""Methods whose WITH_INFO responses invalidate entries."""
+
+REINITIALIZE_METHOD = "/szengine.SzEngine/Reinitialize"
+
+ENTRY_OVERHEAD = 400
+"""Estimated bytes used by an entry besides its response, i.e. its key, list node and index entries."""
+
+CacheKey = Tuple[Any, ...]
+RecordKey = Tuple[str, str]
+
+# -----------------------------------------------------------------------------
+# SzEntityCache class
+# -----------------------------------------------------------------------------
+
+
+class SzEntityCache(grpc.UnaryUnaryClientInterceptor):  # type: ignore[misc]
+    """
+    A least-recently-used cache of entity reads, bounded in bytes and invalidated by WITH_INFO responses.
+
+    Entries are keyed on the entity id, or data source code and record id, plus the flags of the read.
+    A read that was in flight while an entry was invalidated is not cached,
+    since it may have been answered before the change.
+    ``reinitialize`` clears the cache.
+
+    Args:
+        max_bytes (int, optional): Estimated memory allowed for cached responses. Defaults to 64 MiB.
+        ttl_seconds (float, optional): Seconds an entry is kept after it was cached. Defaults to 60.0. None keeps entries until evicted or invalidated.
+    """
+
+    # -------------------------------------------------------------------------
+    # Python dunder/magic methods
+    # -------------------------------------------------------------------------
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024, ttl_seconds: Optional[float] = 60.0) -> None:
+        """
+        Constructor
+
+        For return value of -> None, see https://peps.python.org/pep-0484/#the-meaning-of-annotations
+        """
+        if max_bytes < 1:
+            raise ValueError(f"max_bytes must be at least 1, not {max_bytes}")
+        if ttl_seconds is not None and ttl_seconds <= 0:
+            raise ValueError(f"ttl_seconds must be positive, not {ttl_seconds}")
+
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+
+        self.lock = threading.Lock()
+        self.entries: "OrderedDict[CacheKey, CacheEntry]" = OrderedDict()
+        self.keys_by_entity: Dict[int, Set[CacheKey]] = {}
+        self.keys_by_record: Dict[RecordKey, Set[CacheKey]] = {}
+        self.size = 0
+        self.generation = 0
+        self.counters: Dict[str, int] = {}
+        self.reset_stats()
+
+    # -------------------------------------------------------------------------
+    # SzEntityCache methods
+    # -------------------------------------------------------------------------
+
+    def clear(self) -> None:
+        """
+        Drop every entry.
+        """
+        with self.lock:
+            self.generation += 1
+            self.entries.clear()
+            self.keys_by_entity.clear()
+            self.keys_by_record.clear()
+            self.size = 0
+
+    def intercept(self, grpc_channel: grpc.Channel) -> grpc.Channel:
+        """
+        Return a channel whose entity reads are answered from this cache when possible.
+
+        Args:
+            grpc_channel (grpc.Channel): The channel to wrap.
+
+        Returns:
+            grpc.Channel: The wrapped channel.
+        """
+        return grpc.intercept_channel(grpc_channel, self)
+
+    def invalidate_entities(self, entity_ids: Iterable[int]) -> None:
+        """
+        Drop the entries of the entities, e.g. after changing them through another client.
+
+        Args:
+            entity_ids (Iterable[int]): The entity ids.
+        """
+        with self.lock:
+            self.generation += 1
+            for entity_id in entity_ids:
+                for key in list(self.keys_by_entity.get(entity_id, ())):
+                    self.remove(key, "invalidations")
+
+    def reset_stats(self) -> None:
+        """
+        Set all counters to zero.
+        """
+        with self.lock:
+            self.counters = {
+                "hits": 0,
+                "misses": 0,
+                "evictions": 0,
+                "expirations": 0,
+                "invalidations": 0,
+            }
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Report hits, misses, entries dropped for room, age and changes, and the current size of the cache.
+
+        Returns:
+            Dict[str, int]: A copy of the counters with the number of ``entries`` and their estimated ``bytes``.
+        """
+        with self.lock:
+            result = dict(self.counters)
+            result["entries"] = len(self.entries)
+            result["bytes"] = self.size
+            return result
+
+    # -------------------------------------------------------------------------
+    # grpc.UnaryUnaryClientInterceptor methods
+    # -------------------------------------------------------------------------
+
+    def intercept_unary_unary(
+        self,
+        continuation: Callable[[grpc.ClientCallDetails, Any], Any],
+        client_call_details: grpc.ClientCallDetails,
+        request: Any,
+    ) -> Any:
+        method = client_call_details.method
+        if method in ENTITY_READ_METHODS:
+            key = cache_key(method, request)
+            response, generation = self.get(key)
+            if response is not None:
+                return CachedCall(response)
+            call = continuation(client_call_details, request)
+            call.add_done_callback(lambda done: self.on_read_done(key, generation, done))
+            return call
+        if method in CHANGE_METHODS:
+            call = continuation(client_call_details, request)
+            call.add_done_callback(lambda done: self.on_change_done(request, done))
+            return call
+        if method == REINITIALIZE_METHOD:
+            call = continuation(client_call_details, request)
+            call.add_done_callback(lambda _: self.clear())
+            return call
+        return continuation(client_call_details, request)
+
+    # -------------------------------------------------------------------------
+    # Non-public SzEntityCache methods
+    # -------------------------------------------------------------------------
+
+    def get(self, key: CacheKey) -> Tuple[Any, int]:
+        """
+        Return the cached response, or None, and the generation to pass to ``put`` after a miss.
+
+        :meta private:
+        """
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None and entry.expires is not None and entry.expires <= time.monotonic():
+                self.remove(key, "expirations")
+                entry = None
+            if entry is None:
+                self.counters["misses"] += 1
+                return None, self.generation
+            self.entries.move_to_end(key)
+            self.counters["hits"] += 1
+            return entry.response, self.generation
+
+    def invalidate_record(self, record_key: RecordKey) -> None:
+        """
+        Drop the entries read by the record's key.
+
+        :meta private:
+        """
+        with self.lock:
+            self.generation += 1
+            for key in list(self.keys_by_record.get(record_key, ())):
+                self.remove(key, "invalidations")
+
+    def on_change_done(self, request: Any, call: Any) -> None:
+        """
+        Invalidate what a finished change touched: the record or entity in its request,
+        and the AFFECTED_ENTITIES of its WITH_INFO response.
+
+        :meta private:
+        """
+        if hasattr(request, "record_id"):
+            self.invalidate_record((request.data_source_code.upper(), request.record_id))
+        if hasattr(request, "entity_id"):
+            self.invalidate_entities([request.entity_id])
+        if call.code() != grpc.StatusCode.OK:
+            return
+        info = call.result().result
+        if not info:
+            return
+        try:
+            parsed = json.loads(info)
+            affected = [int(entity["ENTITY_ID"]) for entity in parsed.get("AFFECTED_ENTITIES", [])]
+        except (ValueError, KeyError, TypeError, AttributeError):
+            self.clear()
+            return
+        if "DATA_SOURCE" in parsed and "RECORD_ID" in parsed:
+            self.invalidate_record((str(parsed["DATA_SOURCE"]).upper(), str(parsed["RECORD_ID"])))
+        self.invalidate_entities(affected)
+
+    def on_read_done(self, key: CacheKey, generation: int, call: Any) -> None:
+        """
+        Cache the response of a successful read.
+
+        :meta private:
+        """
+        if call.code() != grpc.StatusCode.OK:
+            return
+        response = call.result()
+        entity_id = key[1] if key[0] == "entity" else resolved_entity_id(response.result)
+        if entity_id is None:
+            return
+        self.put(key, response, entity_id, generation)
+
+    def put(self, key: CacheKey, response: Any, entity_id: int, generation: int) -> None:
+        """
+        Cache a response, unless something was invalidated since the read started, then evict to fit max_bytes.
+
+        :meta private:
+        """
+        size = sys.getsizeof(response.result) + ENTRY_OVERHEAD
+        if size > self.max_bytes:
+            return
+        expires = None if self.ttl_seconds is None else time.monotonic() + self.ttl_seconds
+        record_key = (key[1], key[2]) if key[0] == "record" else None
+        with self.lock:
+            if generation != self.generation:
+                return
+            if key in self.entries:
+                self.remove(key)
+            self.entries[key] = CacheEntry(response, size, expires, entity_id, record_key)
+            self.keys_by_entity.setdefault(entity_id, set()).add(key)
+            if record_key is not None:
+                self.keys_by_record.setdefault(record_key, set()).add(key)
+            self.size += size
+            while self.size > self.max_bytes:
+                self.remove(next(iter(self.entries)), "evictions")
+
+    def remove(self, key: CacheKey, counter: Optional[str] = None) -> None:
+        """
+        Remove an entry and its index entries. Called with the lock held.
+
+        :meta private:
+        """
+        entry = self.entries.pop(key)
+        self.size -= entry.size
+        discard(self.keys_by_entity, entry.entity_id, key)
+        if entry.record_key is not None:
+            discard(self.keys_by_record, entry.record_key, key)
+        if counter is not None:
+            self.counters[counter] += 1
+
+
+# -----------------------------------------------------------------------------
+# CacheEntry class
+# -----------------------------------------------------------------------------
+
+
+class CacheEntry(NamedTuple):
+    """
+    A cached response with what is needed to expire, evict and invalidate it.
+
+    :meta private:
+    """
+
+    response: Any
+    size: int
+    expires: Optional[float]
+    entity_id: int
+    record_key: Optional[RecordKey]
+
+
+# -----------------------------------------------------------------------------
+# CachedCall class
+# -----------------------------------------------------------------------------
+
+
+class CachedCall(grpc.Call, grpc.Future):  # type: ignore[misc]
+    """
+    The finished call returned to gRPC for a cache hit.
+
+    :meta private:
+    """
+
+    def __init__(self, response: Any) -> None:
+        self.response = response
+
+    # grpc.Future methods
+
+    def add_done_callback(self, fn: Callable[[Any], None]) -> None:
+        fn(self)
+
+    def cancel(self) -> bool:
+        return False
+
+    def cancelled(self) -> bool:
+        return False
+
+    def done(self) -> bool:
+        return True
+
+    def exception(self, timeout: Optional[float] = None) -> Optional[Exception]:
+        return None
+
+    def result(self, timeout: Optional[float] = None) -> Any:
+        return self.response
+
+    def running(self) -> bool:
+        return False
+
+    def traceback(self, timeout: Optional[float] = None) -> Optional[types.TracebackType]:
+        return None
+
+    # grpc.Call methods
+
+    def add_callback(self, callback: Callable[[], None]) -> bool:
+        return False
+
+    def code(self) -> grpc.StatusCode:
+        return grpc.StatusCode.OK
+
+    def details(self) -> str:
+        return ""
+
+    def initial_metadata(self) -> Any:
+        return ()
+
+    def is_active(self) -> bool:
+        return False
+
+    def time_remaining(self) -> Optional[float]:
+        return None
+
+    def trailing_metadata(self) -> Any:
+        return ()
+
+
+# -----------------------------------------------------------------------------
+# Helper functions
+# -----------------------------------------------------------------------------
+
+
+def cache_key(method: str, request: Any) -> CacheKey:
+    """
+    Return the key of an entity read: its entity id, or data source code and record id, and its flags.
+
+    :meta private:
+    """
+    if method.endswith("/GetEntityByEntityId"):
+        return ("entity", request.entity_id, request.flags)
+    return ("record", request.data_source_code.upper(), request.record_id, request.flags)
+
+
+def discard(index: Dict[Any, Set[CacheKey]], index_key: Any, key: CacheKey) -> None:
+    """
+    Remove a key from an index, dropping the index entry when it becomes empty.
+
+    :meta private:
+    """
+    keys = index.get(index_key)
+    if keys is None:
+        return
+    keys.discard(key)
+    if not keys:
+        del index[index_key]
+
+
+def resolved_entity_id(entity: str) -> Optional[int]:
+    """
+    Return the RESOLVED_ENTITY.ENTITY_ID of a ``get_entity_*`` response, or None if it has none.
+
+    :meta private:
+    """
+    try:
+        return int(json.loads(entity)["RESOLVED_ENTITY"]["ENTITY_ID"])
+    except (ValueError, KeyError, TypeError):
+        return None
+
+
+def with_entity_cache(grpc_channel: grpc.Channel, entity_cache: Optional[SzEntityCache]) -> grpc.Channel:
+    """
+    Wrap the channel with the entity cache, if there is one.
+
+    :meta private:
+    """
+    if entity_cache is None:
+        return grpc_channel
+    return entity_cache.intercept(grpc_channel)
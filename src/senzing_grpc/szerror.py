@@ -0,0 +1,29 @@
+#! /usr/bin/env python3
+
+"""
+``senzing_grpc.szerror`` holds exceptions raised only by the `gRPC`_ implementation.
+The Senzing exceptions mapped from server errors are in `senzing.szerror`_.
+
+.. _gRPC: https://grpc.io
+.. _senzing.szerror: https://garage.senzing.com/sz-sdk-python/senzing.html#module-senzing.szerror
+"""
+
+from senzing import SzError
+
+# Metadata
+
+__all__ = ["SzDeadlineExceededError"]
+__version__ = "0.0.1"  # See https://www.python.org/dev/peps/pep-0396/
+__date__ = "2026-10-18"
+__updated__ = "2026-10-18"
+
+# -----------------------------------------------------------------------------
+# Exceptions
+# -----------------------------------------------------------------------------
+
+
+class SzDeadlineExceededError(SzError):
+    """
+    The call did not complete before its deadline.
+    The server may still have carried it out, so repeating a change is only safe if it is idempotent.
+    """
@@ -0,0 +1,564 @@
+#! /usr/bin/env python3
+
+"""
+``senzing_grpc.szexport`` writes Senzing exports streamed over `gRPC`_ to files.
+
+The fragments of the export stream are joined into large batches, each encoded and written with one call,
+so a large export is bound by the network and the disk rather than by Python calls per line.
+The file is written under a temporary name in the same directory and renamed into place when complete,
+so a reader never sees a partial export.
+
+A resumable export also records its progress in a checkpoint file beside the output.
+Called again with the same arguments after an interruption, it checks the partial output against
+the checkpoint and carries on where the checkpoint left off.
+
+Parsing exported JSON is CPU-bound, so ``export_json_entity_report_parsed`` sends batches of lines
+to a pool of processes that parse and transform them while the stream keeps arriving.
+
+.. code-block:: python
+
+    result = sz_engine.export_json_entity_report_to_file("/data/export.jsonl.gz", compress=True)
+    print(f"{result.lines} lines, {result.bytes_per_second / 1e6:.1f} MB/s")
+
+    result = sz_engine.export_json_entity_report_to_file("/data/export.jsonl", checkpoint_seconds=10.0)
+
+    for entity_id in sz_engine.export_json_entity_report_parsed(transform=resolved_entity_id):
+        ...
+
+.. _gRPC: https://grpc.io
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import re
+import tempfile
+import time
+from concurrent.futures import Executor
+from contextlib import suppress
+from types import TracebackType
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    Dict,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Type,
+    Union,
+)
+
+from senzing import SzSdkError
+
+from .szhelpers import new_exception, pipelined, prefetched, replace_file
+
+# Metadata
+
+__all__ = ["SzExportIterator", "SzExportResult"]
+__version__ = "0.0.1"  # See https://www.python.org/dev/peps/pep-0396/
+__date__ = "2026-10-18"
+__updated__ = "2026-10-18"
+
+GZIP_LEVEL = 6
+"""The gzip level of compressed exports, the default of the ``gzip`` command rather than Python's slower 9."""
+
+ENTITY_ID = re.compile(r'"ENTITY_ID":\s*(\d+)')
+
+# -----------------------------------------------------------------------------
+# SzExportResult class
+# -----------------------------------------------------------------------------
+
+
+class SzExportResult(NamedTuple):
+    """
+    The progress or outcome of an export written to a file.
+    """
+
+    path: str
+    lines: int
+    """Lines written by this call."""
+    bytes: int
+    """Bytes of export written by this call, before compression."""
+    bytes_written: int
+    """Bytes written to the file by this call, after compression."""
+    seconds: float
+    """Seconds since this call started."""
+    resumed_lines: int = 0
+    """Lines kept from an earlier, interrupted call of a resumable export."""
+
+    @property
+    def lines_per_second(self) -> float:
+        """Lines written per second."""
+        return self.lines / self.seconds if self.seconds > 0 else 0.0
+
+    @property
+    def bytes_per_second(self) -> float:
+        """Bytes of export written per second, before compression."""
+        return self.bytes / self.seconds if self.seconds > 0 else 0.0
+
+
+# -----------------------------------------------------------------------------
+# SzExportIterator class
+# -----------------------------------------------------------------------------
+
+
+class SzExportIterator(Iterator[str]):
+    """
+    The lines of an export streamed from the server, returned by ``SzEngineGrpc.export_json_entity_report_iterator``
+    and ``SzEngineGrpc.export_csv_entity_report_iterator``.
+
+    Closing the iterator cancels the stream, so the server stops exporting and releases its export handle.
+    It is closed by ``close()``, by leaving a ``with`` block, at the end of the export, on an error
+    and when it is garbage collected.
+    Abandoning a plain generator instead would leave the server exporting until the call was collected.
+
+    .. code-block:: python
+
+        with sz_engine.export_json_entity_report_iterator() as lines:
+            for line in lines:
+                if done(line):
+                    break
+
+    Args:
+        start_call (Callable[[], Any]): Starts the streaming call.
+        prefetch_lines (int, optional): Lines read ahead on a background thread. Defaults to 0.
+        prefetch_bytes (int, optional): Bytes read ahead on a background thread. Defaults to 0.
+    """
+
+    # -------------------------------------------------------------------------
+    # Python dunder/magic methods
+    # -------------------------------------------------------------------------
+
+    def __init__(self, start_call: Callable[[], Any], prefetch_lines: int = 0, prefetch_bytes: int = 0) -> None:
+        """
+        Constructor
+
+        For return value of -> None, see https://peps.python.org/pep-0484/#the-meaning-of-annotations
+        """
+        self.closed = True
+        if prefetch_lines < 0 or prefetch_bytes < 0:
+            raise SzSdkError(
+                f"prefetch_lines and prefetch_bytes must not be negative, not {prefetch_lines} and {prefetch_bytes}"
+            )
+        self.call = start_call()
+        self.closed = False
+        self.prefetch: Optional[Generator[Any, None, None]] = None
+        if prefetch_lines or prefetch_bytes:
+            self.prefetch = prefetched(
+                self.call, prefetch_lines, prefetch_bytes, lambda item: int(item.ByteSize()), self.call.cancel
+            )
+        self.responses: Iterator[Any] = self.prefetch or self.call
+
+    def __del__(self) -> None:
+        self.close()
+
+    def __enter__(self) -> "SzExportIterator":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Union[Type[BaseException], None],
+        exc_val: Union[BaseException, None],
+        exc_tb: Union[TracebackType, None],
+    ) -> None:
+        self.close()
+
+    def __next__(self) -> str:
+        while not self.closed:
+            try:
+                item = next(self.responses)
+            except StopIteration:
+                self.close()
+                break
+            except Exception as err:
+                self.close()
+                raise new_exception(err) from err
+            if item.result:
+                return str(item.result)
+        raise StopIteration
+
+    # -------------------------------------------------------------------------
+    # SzExportIterator methods
+    # -------------------------------------------------------------------------
+
+    def close(self) -> None:
+        """
+        Cancel the stream if it is still running. Further iteration yields nothing.
+        """
+        if self.closed:
+            return
+        self.closed = True
+        if self.prefetch is not None:
+            self.prefetch.close()
+        self.call.cancel()
+
+
+# -----------------------------------------------------------------------------
+# ExportFile class
+# -----------------------------------------------------------------------------
+
+
+class ExportFile:  # pylint: disable=R0902
+    """
+    The output of an export: writes batches of fragments, optionally gzip-compressed,
+    counting lines and bytes and hashing every byte that reaches the file.
+
+    :meta private:
+    """
+
+    def __init__(self, raw_file: BinaryIO, path: str, compress: bool, resumed_lines: int = 0) -> None:
+        self.raw_file = raw_file
+        self.path = path
+        self.compress = compress
+        self.resumed_lines = resumed_lines
+        self.start = time.monotonic()
+        self.digest = hashlib.sha256()
+        self.lines = 0
+        self.bytes = 0
+        self.bytes_written = 0
+        self.last_line = ""
+        self.gzip_file: Optional[gzip.GzipFile] = None
+
+    # Called by gzip.GzipFile, which writes through this object to the file.
+
+    def write(self, data: bytes) -> int:
+        self.raw_file.write(data)
+        self.digest.update(data)
+        self.bytes_written += len(data)
+        return len(data)
+
+    def flush(self) -> None:
+        self.raw_file.flush()
+
+    # ExportFile methods
+
+    def write_batch(self, batch: List[str]) -> None:
+        """Encode a batch of fragments and write it with one call."""
+        text = "".join(batch)
+        if not text:
+            return
+        data = text.encode("utf-8")
+        if self.compress:
+            if self.gzip_file is None:
+                self.gzip_file = gzip.GzipFile(fileobj=self, mode="wb", compresslevel=GZIP_LEVEL)
+            self.gzip_file.write(data)
+        else:
+            self.write(data)
+        self.lines += text.count("\n")
+        self.bytes += len(data)
+        self.last_line = text[text.rfind("\n", 0, len(text) - 1) + 1 :]
+
+    def sync(self) -> None:
+        """Make everything written so far durable. A compressed file ends its gzip member, so it can be continued."""
+        if self.gzip_file is not None:
+            self.gzip_file.close()
+            self.gzip_file = None
+        self.raw_file.flush()
+        os.fsync(self.raw_file.fileno())
+
+    def result(self) -> SzExportResult:
+        return SzExportResult(
+            self.path, self.lines, self.bytes, self.bytes_written, time.monotonic() - self.start, self.resumed_lines
+        )
+
+
+# -----------------------------------------------------------------------------
+# Helper functions
+# -----------------------------------------------------------------------------
+
+
+def write_export(  # pylint: disable=R0913,R0917
+    fragments: Iterable[str],
+    path: str,
+    compress: bool = False,
+    buffer_bytes: int = 1024 * 1024,
+    progress: Optional[Callable[[SzExportResult], None]] = None,
+) -> SzExportResult:
+    """
+    Write the fragments of an export to path, atomically, in batches of about buffer_bytes.
+
+    Fragments are written as received; the export streams end each line with a newline.
+
+    Args:
+        fragments (Iterable[str]): The fragments of the export stream.
+        path (str): The file to write. Replaced when the export is complete.
+        compress (bool, optional): Write the file gzip-compressed. Defaults to False.
+        buffer_bytes (int, optional): Characters joined into each write. Defaults to 1 MiB.
+        progress (Callable[[SzExportResult], None], optional): Called after each write. Defaults to None.
+
+    Returns:
+        SzExportResult: The lines and bytes written and the time taken.
+
+    :meta private:
+    """
+    descriptor, temporary_path = tempfile.mkstemp(
+        dir=os.path.dirname(os.path.abspath(path)), prefix=".tmp-", suffix="-" + os.path.basename(path)
+    )
+    try:
+        with os.fdopen(descriptor, "wb", buffering=0) as raw_file:
+            export_file = ExportFile(raw_file, path, compress)
+            for batch in batches(fragments, buffer_bytes):
+                export_file.write_batch(batch)
+                if progress is not None:
+                    progress(export_file.result())
+            export_file.sync()
+        os.replace(temporary_path, path)
+    except BaseException:
+        with suppress(OSError):
+            os.remove(temporary_path)
+        raise
+    return export_file.result()
+
+
+def write_resumable_export(  # pylint: disable=R0913,R0917
+    fragments: Iterable[str],
+    path: str,
+    settings: Dict[str, Any],
+    compress: bool = False,
+    buffer_bytes: int = 1024 * 1024,
+    progress: Optional[Callable[[SzExportResult], None]] = None,
+    checkpoint_seconds: float = 10.0,
+) -> SzExportResult:
+    """
+    Write the fragments of an export to path like ``write_export``, checkpointing progress
+    so an interrupted export is resumed by calling again with the same settings.
+
+    The output is written to ``path + ".partial"`` and its progress recorded in ``path + ".checkpoint"``:
+    the lines written, the size of the file and its SHA-256 digest, the entity id of the last line and the settings.
+    On resuming, the partial file is checked against the digest and truncated to the checkpointed size,
+    and the lines already written are skipped as the stream is read again from the start.
+    The JSON entity id of the last skipped line must match the checkpoint, so a changed export is not spliced.
+
+    Args:
+        fragments (Iterable[str]): The fragments of the export stream.
+        path (str): The file to write. Replaced when the export is complete.
+        settings (Dict[str, Any]): What was exported, e.g. the flags; a checkpoint with other settings is not resumed.
+        compress (bool, optional): Write the file gzip-compressed, as a gzip member per checkpoint. Defaults to False.
+        buffer_bytes (int, optional): Characters joined into each write. Defaults to 1 MiB.
+        progress (Callable[[SzExportResult], None], optional): Called after each write. Defaults to None.
+        checkpoint_seconds (float, optional): Seconds between checkpoints. Defaults to 10.0.
+
+    Returns:
+        SzExportResult: The lines and bytes written by this call, the time taken and the lines resumed.
+
+    Raises:
+        SzSdkError: The checkpoint does not match the settings, the partial file or the export.
+
+    :meta private:
+    """
+    partial_path = path + ".partial"
+    checkpoint_path = path + ".checkpoint"
+    settings = dict(settings, compress=compress)
+    checkpoint = read_checkpoint(checkpoint_path, settings)
+    if checkpoint is None:
+        checkpoint = {"settings": settings, "lines": 0, "file_bytes": 0, "sha256": "", "entity_id": 0}
+        with open(partial_path, "wb"):
+            pass
+
+    with open(partial_path, "r+b", buffering=0) as raw_file:
+        export_file = ExportFile(raw_file, path, compress, checkpoint["lines"])
+        verify_partial_file(export_file, partial_path, checkpoint)
+        last_checkpoint = time.monotonic()
+        for batch in batches(skip_lines(fragments, checkpoint["lines"], checkpoint["entity_id"]), buffer_bytes):
+            export_file.write_batch(batch)
+            if time.monotonic() - last_checkpoint >= checkpoint_seconds and export_file.last_line.endswith("\n"):
+                write_checkpoint(export_file, checkpoint_path, checkpoint)
+                last_checkpoint = time.monotonic()
+            if progress is not None:
+                progress(export_file.result())
+        export_file.sync()
+    os.replace(partial_path, path)
+    with suppress(OSError):
+        os.remove(checkpoint_path)
+    return export_file.result()
+
+
+def parse_export(  # pylint: disable=R0913,R0917
+    fragments: Iterable[str],
+    transform: Optional[Callable[[Any], Any]],
+    executor: Executor,
+    batch_lines: int = 1000,
+    ordered: bool = True,
+    max_in_flight: int = 8,
+) -> Iterator[Any]:
+    """
+    Parse the lines of a JSON export in an executor, such as a ``ProcessPoolExecutor``, a batch of lines per task.
+
+    Each batch is sent as one string; the task parses its lines with ``json.loads`` and passes each entity through
+    transform. Batches are read from the fragments only while fewer than max_in_flight are being parsed or waiting to be yielded.
+
+    Args:
+        fragments (Iterable[str]): The fragments of the export stream.
+        transform (Callable[[Any], Any], optional): Applied to each parsed entity in the executor. Must be picklable, e.g. a module-level function.
+        executor (Executor): Runs the tasks.
+        batch_lines (int, optional): Lines per task. Defaults to 1000.
+        ordered (bool, optional): If True, yield in export order instead of the order batches finish. Defaults to True.
+        max_in_flight (int, optional): Batches submitted and not yet yielded. Defaults to 8.
+
+    Yields:
+        Any: Each parsed, transformed entity.
+
+    :meta private:
+    """
+    for _, _, future in pipelined(
+        lambda text: executor.submit(parse_lines, text, transform),
+        line_batches(fragments, batch_lines),
+        max_in_flight,
+        ordered,
+    ):
+        yield from future.result()
+
+
+def batches(fragments: Iterable[str], buffer_bytes: int) -> Iterator[List[str]]:
+    """
+    Group fragments into batches of at least buffer_bytes characters, except the last.
+
+    :meta private:
+    """
+    batch: List[str] = []
+    batch_size = 0
+    for fragment in fragments:
+        batch.append(fragment)
+        batch_size += len(fragment)
+        if batch_size >= buffer_bytes:
+            yield batch
+            batch, batch_size = [], 0
+    if batch:
+        yield batch
+
+
+def entity_id(line: str) -> int:
+    """
+    Return the first entity id in a line of a JSON export, or 0.
+
+    :meta private:
+    """
+    match = ENTITY_ID.search(line)
+    return int(match.group(1)) if match else 0
+
+
+def line_batches(fragments: Iterable[str], batch_lines: int) -> Iterator[str]:
+    """
+    Join fragments into strings of at least batch_lines whole lines, except the last.
+
+    :meta private:
+    """
+    batch: List[str] = []
+    lines = 0
+    for fragment in fragments:
+        batch.append(fragment)
+        lines += fragment.count("\n")
+        if lines >= batch_lines and fragment.endswith("\n"):
+            yield "".join(batch)
+            batch, lines = [], 0
+    if batch:
+        yield "".join(batch)
+
+
+def parse_lines(text: str, transform: Optional[Callable[[Any], Any]]) -> List[Any]:
+    """
+    Parse each non-blank line of text as JSON and pass it through transform. Runs in the executor of ``parse_export``.
+
+    :meta private:
+    """
+    entities = [json.loads(line) for line in text.splitlines() if line.strip()]
+    if transform is None:
+        return entities
+    return [transform(entity) for entity in entities]
+
+
+def read_checkpoint(checkpoint_path: str, settings: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Return the checkpoint of an interrupted export, or None if there is none.
+
+    :meta private:
+    """
+    try:
+        with open(checkpoint_path, "r", encoding="utf-8") as checkpoint_file:
+            checkpoint: Dict[str, Any] = json.load(checkpoint_file)
+    except FileNotFoundError:
+        return None
+    except ValueError as err:
+        raise SzSdkError(f"checkpoint {checkpoint_path} is not valid JSON: {err}") from err
+    if checkpoint.get("settings") != settings:
+        raise SzSdkError(
+            f"checkpoint {checkpoint_path} is of an export with {checkpoint.get('settings')}, not {settings};"
+            " remove it to start over"
+        )
+    return checkpoint
+
+
+def skip_lines(fragments: Iterable[str], count: int, last_entity_id: int) -> Iterator[str]:
+    """
+    Skip the first count lines of the fragments, checking the entity id of the last line skipped.
+
+    :meta private:
+    """
+    fragments = iter(fragments)
+    if not count:
+        yield from fragments
+        return
+    skipped = 0
+    pending = ""
+    last_line = ""
+    for fragment in fragments:
+        pending += fragment
+        while skipped < count:
+            end = pending.find("\n")
+            if end < 0:
+                break
+            last_line, pending = pending[:end], pending[end + 1 :]
+            skipped += 1
+        if skipped == count:
+            if last_entity_id and entity_id(last_line) != last_entity_id:
+                raise SzSdkError(
+                    f"line {count} of the export is now entity {entity_id(last_line)}, not {last_entity_id};"
+                    " the repository changed since the checkpoint"
+                )
+            if pending:
+                yield pending
+            yield from fragments
+            return
+    raise SzSdkError(f"the export has {skipped} lines, fewer than the {count} already written")
+
+
+def verify_partial_file(export_file: ExportFile, partial_path: str, checkpoint: Dict[str, Any]) -> None:
+    """
+    Check the checkpointed part of the partial file against its digest and drop anything written after it.
+
+    :meta private:
+    """
+    raw_file = export_file.raw_file
+    file_bytes = checkpoint["file_bytes"]
+    if os.fstat(raw_file.fileno()).st_size < file_bytes:
+        raise SzSdkError(f"{partial_path} is shorter than its checkpoint of {file_bytes} bytes")
+    remaining = file_bytes
+    while remaining:
+        data = raw_file.read(min(remaining, 1024 * 1024))
+        export_file.digest.update(data)
+        remaining -= len(data)
+    if file_bytes and export_file.digest.hexdigest() != checkpoint["sha256"]:
+        raise SzSdkError(f"{partial_path} does not match the digest of its checkpoint")
+    raw_file.truncate(file_bytes)
+    raw_file.seek(file_bytes)
+
+
+def write_checkpoint(export_file: ExportFile, checkpoint_path: str, checkpoint: Dict[str, Any]) -> None:
+    """
+    Make the output written so far durable, then record it in the checkpoint.
+
+    :meta private:
+    """
+    export_file.sync()
+    checkpoint.update(
+        lines=export_file.resumed_lines + export_file.lines,
+        file_bytes=export_file.raw_file.tell(),
+        sha256=export_file.digest.hexdigest(),
+        entity_id=entity_id(export_file.last_line),
+    )
+    replace_file(checkpoint_path, json.dumps(checkpoint).encode("utf-8"))
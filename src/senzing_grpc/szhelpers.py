@@ -2,16 +2,37 @@
 TODO: szhelpers.py
 """
 
+import abc
+import collections
 import json
+import os
+import queue
+import tempfile
+import threading
+import types
 from collections.abc import Callable
+from concurrent.futures import Future, InvalidStateError
 from contextlib import suppress
 from functools import wraps
-from typing import Any, Dict, TypeVar, Union
+from typing import (
+    Any,
+    Dict,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
 from typing import cast as typing_cast
 
 import grpc
 from senzing import ENGINE_EXCEPTION_MAP, SzError, SzSdkError
 
+from .szerror import SzDeadlineExceededError
+
 # Metadata
 
 __version__ = "0.0.1"  # See https://www.python.org/dev/peps/pep-0396/
@@ -20,6 +41,7 @@ __updated__ = "2025-01-16"
 
 
 _F = TypeVar("_F", bound=Callable[..., Any])
+_T = TypeVar("_T")
 
 # -----------------------------------------------------------------------------
 # Helpers for working with parameters
@@ -41,6 +63,402 @@ def as_str(candidate_value: Union[str, Dict[Any, Any]]) -> str:
     return candidate_value
 
 
+# -----------------------------------------------------------------------------
+# Helpers for working with futures
+# -----------------------------------------------------------------------------
+
+
+class GrpcCallFuture(Future):  # type: ignore[type-arg]
+    """
+    A ``concurrent.futures.Future`` that cancels its gRPC call when cancelled.
+
+    :meta private:
+    """
+
+    def __init__(self, call: grpc.Future) -> None:
+        super().__init__()
+        self.call = call
+
+    def cancel(self) -> bool:
+        result = super().cancel()
+        self.call.cancel()
+        return result
+
+
+def as_future(call: grpc.Future, convert: Callable[[Any], _T]) -> "Future[_T]":
+    """
+    Adapt a gRPC future into a ``concurrent.futures.Future``.
+
+    The response is passed through convert. RPC failures are mapped with new_exception.
+
+    Args:
+        call (grpc.Future): The future returned by a stub's ``.future()`` method.
+        convert (Callable[[Any], _T]): Converts the response message into the result.
+
+    Returns:
+        Future[_T]: Completes when the call completes.
+
+    :meta private:
+    """
+    result = GrpcCallFuture(call)
+
+    def on_done(done: grpc.Future) -> None:
+        if result.cancelled():
+            return
+        with suppress(InvalidStateError):
+            try:
+                result.set_result(convert(done.result()))
+            except Exception as err:  # pylint: disable=W0718
+                result.set_exception(new_exception(err))
+
+    call.add_done_callback(on_done)
+    return result
+
+
+class CompositeCall(grpc.Call, grpc.Future, abc.ABC):  # type: ignore[misc]
+    """
+    A call made of one or more attempts, such as retries or hedges, that reports the outcome of one of them.
+
+    Subclasses start attempts, keep the latest in ``current``, call ``finish`` with the attempt whose outcome
+    is the outcome of the whole call, and implement ``cancel_attempts``.
+
+    :meta private:
+    """
+
+    def __init__(self) -> None:
+        self.condition = threading.Condition()
+        self.current: Any = None
+        self.final: Any = None
+        self.was_cancelled = False
+        self.done_callbacks: List[Callable[[Any], None]] = []
+
+    @abc.abstractmethod
+    def cancel_attempts(self) -> None:
+        """
+        Cancel the attempts in progress. Called once, after ``cancelled`` became True.
+        ``finish`` must follow, either from the cancelled attempt's callback or directly.
+        """
+
+    def finish(self, call: Any) -> None:
+        with self.condition:
+            if self.final is not None:
+                return
+            self.final = call
+            self.condition.notify_all()
+            done_callbacks, self.done_callbacks = self.done_callbacks, []
+        for done_callback in done_callbacks:
+            done_callback(self)
+
+    def latest(self) -> Any:
+        return self.final if self.final is not None else self.current
+
+    def wait(self, timeout: Optional[float]) -> Any:
+        with self.condition:
+            if not self.condition.wait_for(lambda: self.final is not None, timeout):
+                raise grpc.FutureTimeoutError()
+            if self.was_cancelled:
+                raise grpc.FutureCancelledError()
+            return self.final
+
+    # grpc.Future methods
+
+    def add_done_callback(self, fn: Callable[[Any], None]) -> None:
+        with self.condition:
+            if self.final is None:
+                self.done_callbacks.append(fn)
+                return
+        fn(self)
+
+    def cancel(self) -> bool:
+        with self.condition:
+            if self.final is not None or self.was_cancelled:
+                return self.was_cancelled
+            self.was_cancelled = True
+        self.cancel_attempts()
+        return True
+
+    def cancelled(self) -> bool:
+        return self.was_cancelled
+
+    def done(self) -> bool:
+        return self.final is not None
+
+    def exception(self, timeout: Optional[float] = None) -> Optional[Exception]:
+        return self.wait(timeout).exception()  # type: ignore[no-any-return]
+
+    def result(self, timeout: Optional[float] = None) -> Any:
+        return self.wait(timeout).result()
+
+    def running(self) -> bool:
+        return self.final is None
+
+    def traceback(self, timeout: Optional[float] = None) -> Optional[types.TracebackType]:
+        return self.wait(timeout).traceback()  # type: ignore[no-any-return]
+
+    # grpc.Call methods
+
+    def add_callback(self, callback: Callable[[], None]) -> bool:
+        self.add_done_callback(lambda _: callback())
+        return True
+
+    def code(self) -> Optional[grpc.StatusCode]:
+        return self.latest().code()
+
+    def details(self) -> Optional[str]:
+        return self.latest().details()  # type: ignore[no-any-return]
+
+    def initial_metadata(self) -> Any:
+        return self.latest().initial_metadata()
+
+    def is_active(self) -> bool:
+        return self.final is None
+
+    def time_remaining(self) -> Optional[float]:
+        return self.latest().time_remaining()  # type: ignore[no-any-return]
+
+    def trailing_metadata(self) -> Any:
+        return self.latest().trailing_metadata()
+
+
+def failed_future(exception: BaseException) -> "Future[Any]":
+    """
+    Return an already completed future that raises the exception.
+
+    :meta private:
+    """
+    result: "Future[Any]" = Future()
+    result.set_exception(exception)
+    return result
+
+
+def pipelined(
+    submit: Callable[[_T], Any],
+    items: Iterable[_T],
+    max_in_flight: int,
+    ordered: bool = False,
+) -> Iterator[Tuple[int, _T, Any]]:
+    """
+    Submit items while keeping at most max_in_flight of their futures outstanding.
+
+    Items are pulled from the iterable only when there is room, so the input is never read ahead
+    by more than max_in_flight. When ordered, a completed future held back behind a slower one still takes
+    up room, so a stalled item stops the input being read. Abandoning the iterator cancels the futures still outstanding.
+
+    Args:
+        submit (Callable[[_T], Any]): Starts the work for one item and returns a future supporting ``add_done_callback``.
+        items (Iterable[_T]): The items to submit.
+        max_in_flight (int): The maximum number of outstanding futures.
+        ordered (bool, optional): If True, yield in input order instead of completion order. Defaults to False.
+
+    Yields:
+        Tuple[int, _T, Any]: The zero-based position of the item, the item and its completed future.
+
+    :meta private:
+    """
+    completed: "queue.Queue[Tuple[int, _T, Any]]" = queue.Queue()
+    in_flight: Dict[int, Any] = {}
+    held_back: Dict[int, Tuple[int, _T, Any]] = {}
+    next_position = 0
+    items_iterator = enumerate(items)
+    exhausted = False
+
+    try:
+        while True:
+            while not exhausted and len(in_flight) + len(held_back) < max_in_flight:
+                try:
+                    position, item = next(items_iterator)
+                except StopIteration:
+                    exhausted = True
+                    break
+                future = submit(item)
+                in_flight[position] = future
+                future.add_done_callback(lambda done, p=position, i=item: completed.put((p, i, done)))
+
+            if not in_flight:
+                break
+
+            done = completed.get()
+            del in_flight[done[0]]
+
+            if not ordered:
+                yield done
+                continue
+            held_back[done[0]] = done
+            while next_position in held_back:
+                yield held_back.pop(next_position)
+                next_position += 1
+    finally:
+        for future in in_flight.values():
+            future.cancel()
+
+
+# -----------------------------------------------------------------------------
+# Helpers for working with streams
+# -----------------------------------------------------------------------------
+
+
+def prefetched(  # pylint: disable=R0914
+    items: Iterable[_T],
+    max_items: int,
+    max_bytes: int,
+    size: Callable[[_T], int],
+    cancel: Optional[Callable[[], Any]] = None,
+) -> Generator[_T, None, None]:
+    """
+    Read items on a background thread into a bounded buffer, so reading overlaps with the consumer's work.
+
+    The buffer holds at most max_items items and max_bytes bytes as measured by size; zero does not limit that measure.
+    An item larger than max_bytes is still read when the buffer is empty.
+    An exception raised while reading is raised to the consumer after the items read before it.
+    Abandoning the iterator stops the reader, calling cancel to interrupt a read in progress.
+
+    Args:
+        items (Iterable[_T]): The items to read, e.g. a gRPC response stream.
+        max_items (int): The most items buffered, or 0 for no limit.
+        max_bytes (int): The most bytes buffered, or 0 for no limit.
+        size (Callable[[_T], int]): The size in bytes of an item.
+        cancel (Callable[[], Any], optional): Interrupts a read in progress, e.g. the cancel of the gRPC call. Defaults to None.
+
+    Yields:
+        _T: The items, in order.
+
+    :meta private:
+    """
+    buffer: "collections.deque[Tuple[_T, int]]" = collections.deque()
+    condition = threading.Condition()
+    buffered_bytes = 0
+    done = False
+    stopped = False
+    error: Optional[BaseException] = None
+
+    def is_full(item_size: int) -> bool:
+        if not buffer:
+            return False
+        return bool(max_items and len(buffer) >= max_items) or bool(
+            max_bytes and buffered_bytes + item_size > max_bytes
+        )
+
+    def read() -> None:
+        nonlocal buffered_bytes, done, error
+        try:
+            for item in items:
+                item_size = size(item) if max_bytes else 0
+                with condition:
+                    while is_full(item_size) and not stopped:
+                        condition.wait()
+                    if stopped:
+                        return
+                    buffer.append((item, item_size))
+                    buffered_bytes += item_size
+                    condition.notify_all()
+        except Exception as err:  # pylint: disable=W0718
+            with condition:
+                error = err
+        finally:
+            with condition:
+                done = True
+                condition.notify_all()
+
+    threading.Thread(target=read, name="senzing-grpc-prefetch", daemon=True).start()
+    try:
+        while True:
+            with condition:
+                while not buffer and not done:
+                    condition.wait()
+                if not buffer:
+                    break
+                item, item_size = buffer.popleft()
+                buffered_bytes -= item_size
+                condition.notify_all()
+            yield item
+        if error is not None:
+            raise error
+    finally:
+        with condition:
+            stopped = True
+            interrupt = not done
+            condition.notify_all()
+        if interrupt and cancel is not None:
+            cancel()
+
+
+# -----------------------------------------------------------------------------
+# Helpers for working with files
+# -----------------------------------------------------------------------------
+
+
+def replace_file(path: str, data: bytes) -> None:
+    """
+    Write data to a temporary file in the same directory, flush it to disk and rename it to path,
+    so path holds either its old or its new contents, even after a crash.
+
+    :meta private:
+    """
+    descriptor, temporary_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix=".tmp-")
+    try:
+        with os.fdopen(descriptor, "wb") as temporary_file:
+            temporary_file.write(data)
+            temporary_file.flush()
+            os.fsync(temporary_file.fileno())
+        os.replace(temporary_path, path)
+    except BaseException:
+        with suppress(OSError):
+            os.remove(temporary_path)
+        raise
+
+
+# -----------------------------------------------------------------------------
+# Helpers for working with interceptors
+# -----------------------------------------------------------------------------
+
+
+class ClientCallDetails(
+    collections.namedtuple(
+        "ClientCallDetails", ("method", "timeout", "metadata", "credentials", "wait_for_ready", "compression")
+    ),
+    grpc.ClientCallDetails,  # type: ignore[misc]
+):
+    """
+    A ``grpc.ClientCallDetails`` an interceptor can pass on to its continuation.
+
+    :meta private:
+    """
+
+
+def with_timeout(client_call_details: grpc.ClientCallDetails, timeout: Optional[float]) -> ClientCallDetails:
+    """
+    Copy call details, replacing the timeout.
+
+    :meta private:
+    """
+    return ClientCallDetails(
+        client_call_details.method,
+        timeout,
+        client_call_details.metadata,
+        client_call_details.credentials,
+        client_call_details.wait_for_ready,
+        client_call_details.compression,
+    )
+
+
+def with_compression(
+    client_call_details: grpc.ClientCallDetails, compression: Optional[grpc.Compression]
+) -> ClientCallDetails:
+    """
+    Copy call details, replacing the compression.
+
+    :meta private:
+    """
+    return ClientCallDetails(
+        client_call_details.method,
+        client_call_details.timeout,
+        client_call_details.metadata,
+        client_call_details.credentials,
+        client_call_details.wait_for_ready,
+        compression,
+    )
+
+
 # -----------------------------------------------------------------------------
 # Helpers for working with errors
 # -----------------------------------------------------------------------------
@@ -78,6 +496,10 @@ def new_exception(initial_exception: Exception) -> Exception:
 
     if isinstance(initial_exception, grpc.RpcError):
 
+        code = getattr(initial_exception, "code", lambda: None)()
+        if code == grpc.StatusCode.DEADLINE_EXCEEDED:
+            return SzDeadlineExceededError(initial_exception.details())  # type: ignore[unused-ignore]
+
         details = initial_exception.details()  # type: ignore[unused-ignore]
 
         if details:
@@ -133,29 +555,54 @@ def catch_sdk_exceptions(func_to_decorate: _F) -> _F:
         try:
             return typing_cast(_F, func_to_decorate(*args, **kwargs))
         except (TypeError, ValueError) as err:
-            # Get wrapped function annotation, remove unwanted keys
-            annotations_dict = func_to_decorate.__annotations__
-            with suppress(KeyError):
-                del annotations_dict["return"]
-                del annotations_dict["kwargs"]
-
-            # Get the wrapped function signature names and types and build a string to append to the error message
-            func_signature = ", ".join(
-                [
-                    f"{name}: {type if isinstance(type, str) else type.__name__}"
-                    for name, type in annotations_dict.items()
-                ]
-            )
-
-            method_and_signature = f"{func_to_decorate.__module__}.{func_to_decorate.__name__}({func_signature})"
-            append_err_msg = f" - expected: {method_and_signature}"
-
-            arg_0 = err.args[0]
-            if " missing " in err.args[0] and " required positional argument" in err.args[0]:
-                arg_0 = " ".join(err.args[0].split()[1:])
-            new_arg_0 = f"calling {method_and_signature}" if not err.args else f"{arg_0}{append_err_msg}"
-            err.args = (new_arg_0,) + err.args[1:]
-
-            raise SzSdkError(err) from err
+            raise new_sdk_error(func_to_decorate, err) from err
+
+    return typing_cast(_F, wrapped_func)
+
+
+def catch_sdk_exceptions_async(func_to_decorate: _F) -> _F:
+    """
+    The coroutine equivalent of ``catch_sdk_exceptions``.
+    Request messages are built inside the coroutine, so type errors surface when it is awaited.
+
+    :meta private:
+    """
+
+    @wraps(func_to_decorate)
+    async def wrapped_func(*args: Any, **kwargs: Any) -> Any:
+        try:
+            return await func_to_decorate(*args, **kwargs)
+        except (TypeError, ValueError) as err:
+            raise new_sdk_error(func_to_decorate, err) from err
 
     return typing_cast(_F, wrapped_func)
+
+
+def new_sdk_error(func_to_decorate: Callable[..., Any], err: Exception) -> SzSdkError:
+    """
+    Append the SDK method signature to a TypeError or ValueError and wrap it in a SzSdkError.
+
+    :meta private:
+    """
+
+    # Get wrapped function annotation, remove unwanted keys
+    annotations_dict = func_to_decorate.__annotations__
+    with suppress(KeyError):
+        del annotations_dict["return"]
+        del annotations_dict["kwargs"]
+
+    # Get the wrapped function signature names and types and build a string to append to the error message
+    func_signature = ", ".join(
+        [f"{name}: {type if isinstance(type, str) else type.__name__}" for name, type in annotations_dict.items()]
+    )
+
+    method_and_signature = f"{func_to_decorate.__module__}.{func_to_decorate.__name__}({func_signature})"
+    append_err_msg = f" - expected: {method_and_signature}"
+
+    arg_0 = err.args[0]
+    if " missing " in err.args[0] and " required positional argument" in err.args[0]:
+        arg_0 = " ".join(err.args[0].split()[1:])
+    new_arg_0 = f"calling {method_and_signature}" if not err.args else f"{arg_0}{append_err_msg}"
+    err.args = (new_arg_0,) + err.args[1:]
+
+    return SzSdkError(err)
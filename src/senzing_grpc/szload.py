@@ -0,0 +1,659 @@
+#! /usr/bin/env python3
+
+"""
+``senzing_grpc.szload`` loads records from files into Senzing over `gRPC`_ with ``SzEngineGrpc.add_records``,
+reporting records per second, latency percentiles and errors as it goes.
+
+Input is JSON Lines, optionally gzip-compressed, or CSV with a column holding each record's JSON,
+read from files or standard input. Records are read as they are sent, so files of any size load
+in constant memory.
+
+.. code-block:: console
+
+    python -m senzing_grpc load --target localhost:8261 customers.jsonl.gz watchlist.csv
+    python -m senzing_grpc load --checkpoint customers.checkpoint customers.jsonl.gz
+    zcat customers.jsonl.gz | python -m senzing_grpc load --data-source CUSTOMERS
+
+.. code-block:: python
+
+    sz_load_stats = load_files(sz_engine, ["customers.jsonl.gz"])
+    print(sz_load_stats.summary())
+
+.. _gRPC: https://grpc.io
+"""
+
+import argparse
+import csv
+import gzip
+import io
+import itertools
+import json
+import os
+import sys
+import threading
+import time
+from collections import Counter, OrderedDict
+from contextlib import ExitStack, suppress
+from typing import IO, Any, Dict, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+from typing import cast as typing_cast
+
+import grpc
+from senzing import SZ_WITHOUT_INFO, SzSdkError
+
+from .channelpool import ChannelPool
+from .szengine import SzEngineGrpc
+from .szhelpers import replace_file
+
+# Metadata
+
+__all__ = ["SzInputRecord", "SzLoadStats", "load_files", "main", "read_records"]
+__version__ = "0.0.1"  # See https://www.python.org/dev/peps/pep-0396/
+__date__ = "2026-10-18"
+__updated__ = "2026-10-18"
+
+AUTO = "auto"
+CSV = "csv"
+JSONL = "jsonl"
+FORMATS = (AUTO, JSONL, CSV)
+GZIP_MAGIC = b"\x1f\x8b"
+PERCENTILES = (50, 95, 99)
+SKIP_BYTES = 1024 * 1024
+STDIN = "-"
+
+# -----------------------------------------------------------------------------
+# SzInputRecord class
+# -----------------------------------------------------------------------------
+
+
+class SzInputRecord(NamedTuple):
+    """
+    One record read from an input file by ``read_records``.
+    """
+
+    path: str
+    """The file, or "-" for standard input."""
+    line: int
+    """The line the record starts on, counting from 1."""
+    last_line: int
+    """The line the record ends on."""
+    offset: int
+    """The byte offset just after the record in the uncompressed input."""
+    data_source_code: str
+    record_id: str
+    record_definition: str
+    error: Optional[Exception]
+    """Why the record could not be read, in which case it is not loaded."""
+
+
+# -----------------------------------------------------------------------------
+# SzLoadStats class
+# -----------------------------------------------------------------------------
+
+
+class SzLoadStats:
+    """
+    Counts the records of a load and their latencies, from handing a record to ``add_records``
+    to its response. Percentiles are over the records completed since the previous ``report``.
+    """
+
+    # -------------------------------------------------------------------------
+    # Python dunder/magic methods
+    # -------------------------------------------------------------------------
+
+    def __init__(self) -> None:
+        """
+        Constructor
+
+        For return value of -> None, see https://peps.python.org/pep-0484/#the-meaning-of-annotations
+        """
+        self.lock = threading.Lock()
+        self.started = time.monotonic()
+        self.reported = self.started
+        self.loaded = 0
+        self.loaded_at_report = 0
+        self.errors: "Counter[str]" = Counter()
+        self.latencies: List[float] = []
+
+    # -------------------------------------------------------------------------
+    # SzLoadStats methods
+    # -------------------------------------------------------------------------
+
+    def add(self, latency: float, error: Optional[Exception] = None) -> None:
+        """
+        Count a record sent to the server, and its error if it failed.
+
+        Args:
+            latency (float): Seconds from submitting the record to its response.
+            error (Exception, optional): Why the record failed. Defaults to None.
+        """
+        with self.lock:
+            self.latencies.append(latency)
+            if error is None:
+                self.loaded += 1
+            else:
+                self.errors[error_kind(error)] += 1
+
+    def add_input_error(self) -> None:
+        """
+        Count a record that could not be read from its input.
+        """
+        with self.lock:
+            self.errors["input"] += 1
+
+    def error_count(self) -> int:
+        """
+        Returns:
+            int: The records that failed to read or load.
+        """
+        with self.lock:
+            return sum(self.errors.values())
+
+    def report(self) -> str:
+        """
+        Describe the progress since the previous report and start a new interval.
+
+        Returns:
+            str: Records loaded, the rate and latency percentiles over the interval, and the errors so far.
+        """
+        with self.lock:
+            now = time.monotonic()
+            seconds = now - self.reported
+            rate = (self.loaded - self.loaded_at_report) / seconds if seconds > 0 else 0.0
+            latencies = sorted(self.latencies)
+            self.reported, self.loaded_at_report, self.latencies = now, self.loaded, []
+            return (
+                f"loaded {self.loaded}, {rate:.1f} records/s, latency {format_percentiles(latencies)}, "
+                f"errors {format_errors(self.errors)}"
+            )
+
+    def summary(self) -> str:
+        """
+        Describe the whole load.
+
+        Returns:
+            str: Records loaded, the overall rate and the errors.
+        """
+        with self.lock:
+            seconds = time.monotonic() - self.started
+            rate = self.loaded / seconds if seconds > 0 else 0.0
+            return f"loaded {self.loaded} in {seconds:.1f}s, {rate:.1f} records/s, errors {format_errors(self.errors)}"
+
+
+# -----------------------------------------------------------------------------
+# Loading
+# -----------------------------------------------------------------------------
+
+
+def load_files(  # pylint: disable=R0912,R0913,R0914,R0915,R0917
+    sz_engine: SzEngineGrpc,
+    paths: Sequence[str],
+    input_format: str = AUTO,
+    json_column: str = "JSON",
+    data_source_code: str = "",
+    max_in_flight: int = 64,
+    progress_seconds: float = 5.0,
+    output: Optional[IO[str]] = None,
+    checkpoint_path: Optional[str] = None,
+    checkpoint_seconds: float = 10.0,
+) -> SzLoadStats:
+    """
+    Load the records of files, one after another, through one ``add_records`` pipeline.
+
+    Every ``progress_seconds`` a ``SzLoadStats.report`` line is written to ``output``,
+    and each record that fails is written there with its file and line.
+
+    Given a ``checkpoint_path``, the load is resumable. Every ``checkpoint_seconds``, and when the load stops,
+    the line and byte offset after the last record of the unbroken run of completed records from the start
+    of each file is written to that file, replacing it atomically. Called again with the same arguments,
+    the load carries on from there. Records that were in flight are sent again, which is safe as
+    ``add_record`` replaces a record with the same keys; records that failed are not.
+    The checkpoint is removed when every file is loaded. A file whose size changed is not resumed.
+
+    Args:
+        sz_engine (SzEngineGrpc): The engine to add the records with.
+        paths (Sequence[str]): The files to load; "-" is standard input.
+        input_format (str, optional): "jsonl", "csv" or "auto", choosing by file name. Defaults to "auto".
+        json_column (str, optional): The CSV column holding each record's JSON. Defaults to "JSON".
+        data_source_code (str, optional): The data source of records without a DATA_SOURCE. Defaults to "".
+        max_in_flight (int, optional): The most AddRecord calls outstanding. Defaults to 64.
+        progress_seconds (float, optional): Seconds between progress reports. Defaults to 5.0.
+        output (IO[str], optional): Where to write progress and errors. Defaults to sys.stderr.
+        checkpoint_path (str, optional): The checkpoint file of a resumable load. Defaults to None, not resumable.
+        checkpoint_seconds (float, optional): Seconds between checkpoints. Defaults to 10.0.
+
+    Returns:
+        SzLoadStats: The counts and latencies of the load.
+    """
+    output = output or sys.stderr
+    stats = SzLoadStats()
+    checkpoint = None
+    if checkpoint_path:
+        settings = {"input_format": input_format, "json_column": json_column, "data_source_code": data_source_code}
+        checkpoint = LoadCheckpoint(checkpoint_path, paths, settings)
+    in_flight: Dict[int, Tuple[SzInputRecord, float, int]] = {}
+    positions = itertools.count()
+
+    # add_records pulls a record just before sending it, so its latency is timed from here.
+
+    def records() -> Iterator[Tuple[str, str, str]]:
+        for path in paths:
+            start_line, start_offset, ticket = 0, 0, 0
+            if checkpoint:
+                start = checkpoint.start(path)
+                if start is None:
+                    print(f"{path}: already loaded", file=output)
+                    continue
+                start_line, start_offset = start
+                if start_offset:
+                    print(f"{path}: resuming after line {start_line}", file=output)
+            for record in read_records(path, input_format, json_column, data_source_code, start_line, start_offset):
+                if checkpoint:
+                    ticket = checkpoint.read(record)
+                if record.error is not None:
+                    stats.add_input_error()
+                    print(f"{record.path}:{record.line}: {record.error}", file=output)
+                    if checkpoint:
+                        checkpoint.completed(path, ticket)
+                    continue
+                in_flight[next(positions)] = (record, time.monotonic(), ticket)
+                yield record.data_source_code, record.record_id, record.record_definition
+            if checkpoint:
+                checkpoint.read_all(path)
+
+    next_report = time.monotonic() + progress_seconds
+    next_checkpoint = time.monotonic() + checkpoint_seconds
+    try:
+        for result in sz_engine.add_records(records(), SZ_WITHOUT_INFO, max_in_flight):
+            record, started, ticket = in_flight.pop(result.position)
+            stats.add(time.monotonic() - started, result.error)
+            if result.error is not None:
+                print(
+                    f"{record.path}:{record.line}: {error_kind(result.error)}: {error_message(result.error)}",
+                    file=output,
+                )
+            if checkpoint:
+                checkpoint.completed(record.path, ticket)
+                if time.monotonic() >= next_checkpoint:
+                    checkpoint.save()
+                    next_checkpoint = time.monotonic() + checkpoint_seconds
+            if time.monotonic() >= next_report:
+                print(stats.report(), file=output, flush=True)
+                next_report = time.monotonic() + progress_seconds
+    finally:
+        if checkpoint:
+            checkpoint.save()
+    if checkpoint and checkpoint.complete():
+        checkpoint.remove()
+    return stats
+
+
+# -----------------------------------------------------------------------------
+# Checkpoints
+# -----------------------------------------------------------------------------
+
+
+class LoadCheckpoint:
+    """
+    The progress of a resumable load, by file: the line and byte offset after the last record
+    of the unbroken run of completed records from the start of the file, and whether it is complete.
+
+    Records complete out of order, so those read but not yet part of the unbroken run are kept,
+    in reading order, until the records before them complete.
+
+    :meta private:
+    """
+
+    def __init__(self, checkpoint_path: str, paths: Sequence[str], settings: Dict[str, Any]) -> None:
+        if STDIN in paths:
+            raise SzSdkError("standard input cannot be resumed; load files to use a checkpoint")
+        self.checkpoint_path = checkpoint_path
+        self.settings = settings
+        self.files: Dict[str, Dict[str, Any]] = {}
+        self.pending: Dict[str, "OrderedDict[int, List[Any]]"] = {}
+        self.reading: Dict[str, bool] = {}
+        self.tickets = itertools.count()
+        try:
+            with open(checkpoint_path, "r", encoding="utf-8") as checkpoint_file:
+                previous = json.load(checkpoint_file)
+        except FileNotFoundError:
+            previous = {"settings": settings, "files": {}}
+        except ValueError as err:
+            raise SzSdkError(f"checkpoint {checkpoint_path} is not valid JSON: {err}") from err
+        if previous.get("settings") != settings:
+            raise SzSdkError(
+                f"checkpoint {checkpoint_path} is of a load with {previous.get('settings')}, not {settings};"
+                " remove it to start over"
+            )
+        self.files = previous["files"]
+        for path in paths:
+            key = os.path.abspath(path)
+            size = os.path.getsize(path)
+            if key in self.files and self.files[key]["size"] != size:
+                raise SzSdkError(
+                    f"{path} is {size} bytes, not the {self.files[key]['size']} bytes checkpointed in"
+                    f" {checkpoint_path}; remove the checkpoint to start over"
+                )
+            self.files.setdefault(key, {"size": size, "line": 0, "offset": 0, "complete": False})
+            self.pending[key] = OrderedDict()
+            self.reading[key] = True
+
+    def start(self, path: str) -> Optional[Tuple[int, int]]:
+        """
+        The line and offset to resume a file from, or None if it is already loaded.
+        """
+        progress = self.files[os.path.abspath(path)]
+        if progress["complete"]:
+            return None
+        return progress["line"], progress["offset"]
+
+    def read(self, record: SzInputRecord) -> int:
+        """
+        Note a record read from its file, returning the ticket to complete it with.
+        """
+        ticket = next(self.tickets)
+        self.pending[os.path.abspath(record.path)][ticket] = [False, record.last_line, record.offset]
+        return ticket
+
+    def completed(self, path: str, ticket: int) -> None:
+        """
+        Note a record loaded, or failed, and extend the unbroken run of completed records.
+        """
+        key = os.path.abspath(path)
+        pending = self.pending[key]
+        pending[ticket][0] = True
+        while pending and next(iter(pending.values()))[0]:
+            _, (_, line, offset) = pending.popitem(last=False)
+            self.files[key].update(line=line, offset=offset)
+        self.files[key]["complete"] = not self.reading[key] and not pending
+
+    def read_all(self, path: str) -> None:
+        """
+        Note every record of a file read.
+        """
+        key = os.path.abspath(path)
+        self.reading[key] = False
+        self.files[key]["complete"] = not self.pending[key]
+
+    def complete(self) -> bool:
+        """
+        Whether every file of the load is loaded.
+        """
+        return all(self.files[key]["complete"] for key in self.pending)
+
+    def save(self) -> None:
+        """
+        Write the checkpoint file.
+        """
+        replace_file(self.checkpoint_path, json.dumps({"settings": self.settings, "files": self.files}).encode())
+
+    def remove(self) -> None:
+        """
+        Remove the checkpoint file.
+        """
+        with suppress(FileNotFoundError):
+            os.remove(self.checkpoint_path)
+
+
+# -----------------------------------------------------------------------------
+# Reading input
+# -----------------------------------------------------------------------------
+
+
+def read_records(  # pylint: disable=R0913,R0917
+    path: str,
+    input_format: str = AUTO,
+    json_column: str = "JSON",
+    data_source_code: str = "",
+    start_line: int = 0,
+    start_offset: int = 0,
+) -> Iterator[SzInputRecord]:
+    """
+    Read the records of a JSON Lines or CSV file, or of standard input, one at a time.
+    Gzip-compressed input is recognized by its first bytes. Blank lines are skipped.
+
+    Given a ``start_offset``, reading starts there, after the ``start_line`` lines before it.
+    An uncompressed file is read from that offset; a compressed file is decompressed up to it.
+    A CSV file's header, which must be one line, is always read first.
+
+    Args:
+        path (str): The file, or "-" for standard input.
+        input_format (str, optional): "jsonl", "csv" or "auto", choosing "csv" for names ending in .csv or .csv.gz. Defaults to "auto".
+        json_column (str, optional): The CSV column holding each record's JSON. Defaults to "JSON".
+        data_source_code (str, optional): The data source of records without a DATA_SOURCE. Defaults to "".
+        start_line (int, optional): The lines before ``start_offset``. Defaults to 0.
+        start_offset (int, optional): The byte offset of the first record to read, as in ``SzInputRecord.offset``. Defaults to 0.
+
+    Yields:
+        SzInputRecord: Each record, with an error instead of its keys if it could not be read.
+    """
+    if input_format not in FORMATS:
+        raise ValueError(f"input_format must be one of {', '.join(FORMATS)}, not {input_format}")
+    if input_format == AUTO:
+        input_format = CSV if path.lower().endswith((".csv", ".csv.gz")) else JSONL
+    with ExitStack() as stack:
+        stream = typing_cast(io.BufferedReader, sys.stdin.buffer)
+        if path != STDIN:
+            stream = stack.enter_context(open(path, "rb"))
+        compressed = stream.peek(len(GZIP_MAGIC))[: len(GZIP_MAGIC)] == GZIP_MAGIC
+        if compressed:
+            stream = typing_cast(io.BufferedReader, stack.enter_context(gzip.GzipFile(fileobj=stream, mode="rb")))
+        if input_format == CSV:
+            header = stream.readline()
+            if start_offset:
+                skip_to(stream, start_offset, compressed)
+            else:
+                start_line, start_offset = 1, len(header)
+            fieldnames = next(csv.reader([header.decode("utf-8")]), None)
+            lines = numbered_lines(stream, start_line, start_offset)
+            yield from csv_records(path, fieldnames, lines, start_line, json_column, data_source_code)
+            return
+        if start_offset:
+            skip_to(stream, start_offset, compressed)
+        for line_number, offset, line in numbered_lines(stream, start_line, start_offset):
+            if line.strip():
+                yield input_record(path, line_number, line_number, offset, line, data_source_code)
+
+
+def skip_to(stream: IO[bytes], offset: int, compressed: bool) -> None:
+    """
+    Move a stream to an offset, seeking an uncompressed file and reading through a compressed one.
+
+    :meta private:
+    """
+    if not compressed:
+        stream.seek(offset)
+        return
+    remaining = offset - stream.tell()
+    while remaining > 0:
+        skipped = len(stream.read(min(remaining, SKIP_BYTES)))
+        if not skipped:
+            raise SzSdkError(f"input ends before offset {offset}")
+        remaining -= skipped
+
+
+def numbered_lines(stream: IO[bytes], start_line: int = 0, offset: int = 0) -> Iterator[Tuple[int, int, str]]:
+    """
+    The lines of a stream with their line numbers and the byte offset just after each,
+    continuing from the lines and bytes before the stream's position.
+
+    :meta private:
+    """
+    for line_number, line in enumerate(stream, start_line + 1):
+        offset += len(line)
+        yield line_number, offset, line.decode("utf-8")
+
+
+def csv_records(  # pylint: disable=R0913,R0917
+    path: str,
+    fieldnames: Optional[List[str]],
+    lines: Iterator[Tuple[int, int, str]],
+    start_line: int,
+    json_column: str,
+    data_source_code: str,
+) -> Iterator[SzInputRecord]:
+    """
+    The records of CSV lines. A quoted field may span lines; a record's offset is after its last line.
+    A DATA_SOURCE column gives the data source of records whose JSON has none.
+
+    :meta private:
+    """
+    if fieldnames is None:
+        return
+    if json_column not in fieldnames:
+        yield SzInputRecord(path, 1, 1, 0, "", "", "", ValueError(f"no {json_column} column"))
+        return
+    position = [start_line, 0]
+
+    def text() -> Iterator[str]:
+        for line_number, offset, line in lines:
+            position[:] = [line_number, offset]
+            yield line
+
+    for row in csv.DictReader(text(), fieldnames):
+        data_source = row.get("DATA_SOURCE") or data_source_code
+        yield input_record(path, start_line + 1, position[0], position[1], row[json_column] or "", data_source)
+        start_line = position[0]
+
+
+def input_record(  # pylint: disable=R0913,R0917
+    path: str, line_number: int, last_line: int, offset: int, text: str, data_source_code: str
+) -> SzInputRecord:
+    """
+    Parse a record's JSON for its DATA_SOURCE and RECORD_ID.
+
+    :meta private:
+    """
+    record_definition = text.strip()
+    try:
+        record = json.loads(record_definition)
+    except ValueError as err:
+        error: Optional[Exception] = ValueError(f"not JSON: {err}")
+        return SzInputRecord(path, line_number, last_line, offset, "", "", record_definition, error)
+    if not isinstance(record, dict):
+        error = ValueError("not a JSON object")
+        return SzInputRecord(path, line_number, last_line, offset, "", "", record_definition, error)
+    data_source = str(record.get("DATA_SOURCE") or data_source_code)
+    record_id = str(record.get("RECORD_ID") or "")
+    error = None
+    if not data_source or not record_id:
+        error = ValueError("no DATA_SOURCE" if not data_source else "no RECORD_ID")
+    return SzInputRecord(path, line_number, last_line, offset, data_source, record_id, record_definition, error)
+
+
+# -----------------------------------------------------------------------------
+# Formatting
+# -----------------------------------------------------------------------------
+
+
+def error_kind(error: Exception) -> str:
+    """
+    The class of a Senzing error, or the status code of a gRPC error that is not a Senzing error.
+
+    :meta private:
+    """
+    if isinstance(error, grpc.RpcError) and hasattr(error, "code"):
+        return str(error.code().name)
+    return type(error).__name__
+
+
+def error_message(error: Exception) -> str:
+    """
+    :meta private:
+    """
+    if isinstance(error, grpc.RpcError) and hasattr(error, "details"):
+        return str(error.details())
+    return str(error)
+
+
+def format_percentiles(latencies: List[float]) -> str:
+    """
+    :meta private:
+    """
+    if not latencies:
+        return "-"
+    return " ".join(
+        f"p{percentile} {1000 * latencies[min(len(latencies) - 1, len(latencies) * percentile // 100)]:.1f}ms"
+        for percentile in PERCENTILES
+    )
+
+
+def format_errors(errors: "Counter[str]") -> str:
+    """
+    :meta private:
+    """
+    total = sum(errors.values())
+    if not total:
+        return "0"
+    return f"{total} (" + ", ".join(f"{kind} {count}" for kind, count in errors.most_common()) + ")"
+
+
+# -----------------------------------------------------------------------------
+# Command line
+# -----------------------------------------------------------------------------
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    ``python -m senzing_grpc load``: load files into Senzing.
+
+    Args:
+        argv (Sequence[str], optional): The arguments after the program name. Defaults to sys.argv[1:].
+
+    Returns:
+        int: The exit status, 1 if any record failed.
+    """
+    parser = argparse.ArgumentParser(prog="python -m senzing_grpc", description="Senzing gRPC client tools.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    load = commands.add_parser("load", help="Load JSON Lines or CSV records with add_record.")
+    load.add_argument("paths", nargs="*", default=[STDIN], metavar="FILE", help='Files to load; "-" is stdin.')
+    load.add_argument("--target", default="localhost:8261", help="The gRPC server. Defaults to localhost:8261.")
+    load.add_argument("--channels", type=int, default=1, help="Connections to the server. Defaults to 1.")
+    load.add_argument("--ca-certificate", help="The server's certificate authority, for TLS.")
+    load.add_argument("--format", choices=FORMATS, default=AUTO, dest="input_format", help="Defaults to auto.")
+    load.add_argument("--json-column", default="JSON", help="The CSV column holding the JSON. Defaults to JSON.")
+    load.add_argument("--data-source", default="", help="The data source of records without a DATA_SOURCE.")
+    load.add_argument("--max-in-flight", type=int, default=64, help="Outstanding AddRecord calls. Defaults to 64.")
+    load.add_argument("--progress-seconds", type=float, default=5.0, help="Seconds between reports. Defaults to 5.")
+    load.add_argument("--checkpoint", help="A checkpoint file, to resume an interrupted load of the same files.")
+    load.add_argument("--checkpoint-seconds", type=float, default=10.0, help="Seconds between checkpoints.")
+    args = parser.parse_args(argv)
+    if args.checkpoint and STDIN in args.paths:
+        parser.error("--checkpoint needs files, not standard input")
+
+    credentials = None
+    if args.ca_certificate:
+        with open(args.ca_certificate, "rb") as certificate_file:
+            credentials = grpc.ssl_channel_credentials(root_certificates=certificate_file.read())
+    grpc_channel = grpc_channel_for(args.target, args.channels, credentials)
+    try:
+        stats = load_files(
+            SzEngineGrpc(grpc_channel),
+            args.paths,
+            args.input_format,
+            args.json_column,
+            args.data_source,
+            args.max_in_flight,
+            args.progress_seconds,
+            checkpoint_path=args.checkpoint,
+            checkpoint_seconds=args.checkpoint_seconds,
+        )
+    except SzSdkError as err:
+        print(f"error: {err}", file=sys.stderr)
+        return 2
+    except KeyboardInterrupt:
+        return 130
+    finally:
+        grpc_channel.close()
+    print(stats.summary(), file=sys.stderr)
+    return 1 if stats.error_count() else 0
+
+
+def grpc_channel_for(target: str, channels: int, credentials: Optional[grpc.ChannelCredentials]) -> grpc.Channel:
+    """
+    :meta private:
+    """
+    if channels > 1:
+        return ChannelPool(target, size=channels, credentials=credentials)
+    if credentials:
+        return grpc.secure_channel(target, credentials)
+    return grpc.insecure_channel(target)
@@ -11,13 +11,14 @@ of the `senzing.szproduct.SzProduct`_ interface.
 # pylint: disable=E1101
 
 from types import TracebackType
-from typing import Any, Dict, Type, Union
+from typing import Any, Dict, Optional, Type, Union
 
 import grpc
 from senzing import SzProduct
 from senzing_grpc_protobuf import szproduct_pb2, szproduct_pb2_grpc
 
 from .szhelpers import catch_sdk_exceptions, new_exception
+from .szretry import SzRetryPolicy, with_retry_policy
 
 # Metadata
 
@@ -47,6 +48,7 @@ class SzProductGrpc(SzProduct):
     def __init__(
         self,
         grpc_channel: grpc.Channel,
+        retry_policy: Optional[SzRetryPolicy] = None,
     ) -> None:
         """
         Constructor
@@ -55,7 +57,7 @@ class SzProductGrpc(SzProduct):
         """
         # pylint: disable=W0613
 
-        self.channel = grpc_channel
+        self.channel = with_retry_policy(grpc_channel, retry_policy)
         self.stub = szproduct_pb2_grpc.SzProductStub(self.channel)
 
     def __enter__(
@@ -0,0 +1,116 @@
+#! /usr/bin/env python3
+
+"""
+``senzing_grpc.szproductasync.SzProductGrpcAsync`` is an `asyncio`_ `gRPC`_ implementation
+of the `senzing.szproduct.SzProduct`_ methods.
+
+.. _asyncio: https://docs.python.org/3/library/asyncio.html
+
+.. _gRPC: https://grpc.io
+.. _senzing.szproduct.SzProduct: https://garage.senzing.com/sz-sdk-python/senzing.html#module-senzing.szproduct
+"""
+
+# pylint: disable=E1101
+
+from types import TracebackType
+from typing import Any, Dict, Type, Union
+
+import grpc
+from senzing_grpc_protobuf import szproduct_pb2, szproduct_pb2_grpc
+
+from .szhelpers import catch_sdk_exceptions_async, new_exception
+
+# Metadata
+
+__all__ = ["SzProductGrpcAsync"]
+__version__ = "0.0.1"  # See https://www.python.org/dev/peps/pep-0396/
+__date__ = "2026-10-18"
+__updated__ = "2026-10-18"
+
+SENZING_PRODUCT_ID = (
+    "5056"  # See https://github.com/senzing-garage/knowledge-base/blob/main/lists/senzing-component-ids.md
+)
+
+# -----------------------------------------------------------------------------
+# SzProductGrpcAsync class
+# -----------------------------------------------------------------------------
+
+
+class SzProductGrpcAsync:
+    """
+    SzProduct module access library over asyncio gRPC.
+
+    Method names, parameters and return values match ``SzProductGrpc``, but methods that call the server must be awaited.
+    """
+
+    # -------------------------------------------------------------------------
+    # Python dunder/magic methods
+    # -------------------------------------------------------------------------
+
+    def __init__(
+        self,
+        grpc_channel: grpc.aio.Channel,
+    ) -> None:
+        """
+        Constructor
+
+        For return value of -> None, see https://peps.python.org/pep-0484/#the-meaning-of-annotations
+        """
+        # pylint: disable=W0613
+
+        self.channel = grpc_channel
+        self.stub = szproduct_pb2_grpc.SzProductStub(self.channel)
+
+    async def __aenter__(
+        self,
+    ) -> "SzProductGrpcAsync":
+        """Asynchronous Context Manager method."""
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Union[Type[BaseException], None],
+        exc_val: Union[BaseException, None],
+        exc_tb: Union[TracebackType, None],
+    ) -> None:
+        """Asynchronous Context Manager method."""
+
+    # -------------------------------------------------------------------------
+    # SzProduct methods as coroutines
+    # -------------------------------------------------------------------------
+
+    @catch_sdk_exceptions_async
+    async def get_license(self) -> str:
+        try:
+            request = szproduct_pb2.GetLicenseRequest()  # type: ignore[unused-ignore]
+            response = await self.stub.GetLicense(request)
+            return str(response.result)
+        except Exception as err:
+            raise new_exception(err) from err
+
+    @catch_sdk_exceptions_async
+    async def get_version(self) -> str:
+        try:
+            request = szproduct_pb2.GetVersionRequest()  # type: ignore[unused-ignore]
+            response = await self.stub.GetVersion(request)
+            return str(response.result)
+        except Exception as err:
+            raise new_exception(err) from err
+
+    # -------------------------------------------------------------------------
+    # Non-public SzProductCore methods
+    # -------------------------------------------------------------------------
+
+    async def _destroy(self) -> None:
+        """Null function in the sz-sdk-python-grpc implementation."""
+
+    async def initialize(
+        self,
+        instance_name: str,
+        settings: Union[str, Dict[Any, Any]],
+        verbose_logging: int = 0,
+    ) -> None:
+        """Null function in the sz-sdk-python-grpc implementation."""
+        _ = instance_name
+        _ = settings
+        _ = verbose_logging
@@ -0,0 +1,411 @@
+#! /usr/bin/env python3
+
+"""
+``senzing_grpc.szredo.SzRedoProcessor`` drains the redo queue with several workers
+sharing one `gRPC`_ channel or ``ChannelPool``.
+
+``get_redo_record`` followed by ``process_redo_record`` is strictly serial, one record per two round trips.
+The processor runs that loop on up to ``max_workers`` threads, each fetching the next records while
+it processes the current one. It polls ``count_redo_records`` to add workers while the backlog grows
+and retire them as it shrinks, and returns when the queue is empty.
+
+.. code-block:: python
+
+    sz_engine = sz_abstract_factory.create_engine()
+    sz_redo_processor = SzRedoProcessor(sz_engine, max_workers=16, on_info=print)
+    print(sz_redo_processor.run())
+
+.. _gRPC: https://grpc.io
+"""
+
+import hashlib
+import json
+import math
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import Future
+from contextlib import suppress
+from typing import Any, Callable, Deque, Dict, Optional, Tuple
+
+from senzing import SzEngineFlags
+
+from .szengine import SzEngineGrpc
+
+# Metadata
+
+__all__ = ["SzRedoProcessor"]
+__version__ = "0.0.1"  # See https://www.python.org/dev/peps/pep-0396/
+__date__ = "2026-10-18"
+__updated__ = "2026-10-18"
+
+BACKLOG_SAMPLES = 12
+
+# -----------------------------------------------------------------------------
+# SzRedoProcessor class
+# -----------------------------------------------------------------------------
+
+
+class SzRedoProcessor:  # pylint: disable=R0902
+    """
+    Processes redo records on a pool of worker threads until the redo queue is empty.
+
+    Every ``poll_seconds`` the processor counts the redo records and runs one worker per
+    ``records_per_worker`` of backlog, between ``min_workers`` and ``max_workers``.
+    Each worker keeps up to ``lookahead`` ``get_redo_record`` calls in flight while it processes a record,
+    so fetching overlaps processing instead of adding a round trip per record.
+    Workers beyond the target, or told to ``stop``, fetch no more and exit once the records
+    already fetched are processed; a fetched record has left the server's queue and is never dropped.
+    A worker finding the queue empty exits; ``run`` returns when the last worker has found it empty,
+    or when no worker is running and the count is zero.
+
+    Given a ``dedupe_window``, redo records identical to one of that many recent records are skipped.
+    Records are compared by the SHA-256 digest of their JSON with sorted keys, so key order and spacing
+    do not matter. With ``dedupe_by_entity`` as well, a record targeting the same ``ENTITY_ID`` as one of
+    the recent records is also skipped, as processing either re-resolves the same entity.
+    Skipping relies on the earlier record being processed after the change that queued the duplicate,
+    so deduplication is off by default. The window is cleared when ``run`` starts.
+
+    A record failing to process does not stop the processor; it is counted and passed to ``on_error``.
+    Given ``on_info``, records are processed WITH_INFO and each response is passed to it.
+    An exception raised by ``on_info`` counts the record as an error and is passed to ``on_error``;
+    one raised by ``on_error`` is ignored.
+    The callbacks are called from the worker threads, one call at a time.
+
+    Args:
+        sz_engine (SzEngineGrpc): The engine whose redo queue is processed. Its channel is shared by the workers.
+        max_workers (int, optional): The most workers to run. Defaults to 8.
+        min_workers (int, optional): The fewest workers to run while there is a backlog. Defaults to 1.
+        records_per_worker (int, optional): Redo records of backlog per worker. Defaults to 1000.
+        lookahead (int, optional): Redo records each worker fetches ahead of the one it is processing. 0 fetches after each record is processed. Defaults to 2.
+        poll_seconds (float, optional): Seconds between counts of the redo records. Defaults to 5.0.
+        dedupe_window (int, optional): Recent redo records remembered to skip duplicates of. Defaults to 0, no deduplication.
+        dedupe_by_entity (bool, optional): Also skip records targeting an entity targeted by a recent record. Defaults to False.
+        flags (int, optional): Flags passed to ``process_redo_record``. Defaults to 0.
+        on_info (Callable[[str], None], optional): Called with each WITH_INFO response. Defaults to None.
+        on_error (Callable[[str, Exception], None], optional): Called with each redo record that failed and its error. Defaults to None.
+    """
+
+    # -------------------------------------------------------------------------
+    # Python dunder/magic methods
+    # -------------------------------------------------------------------------
+
+    def __init__(  # pylint: disable=R0913,R0917
+        self,
+        sz_engine: SzEngineGrpc,
+        max_workers: int = 8,
+        min_workers: int = 1,
+        records_per_worker: int = 1000,
+        lookahead: int = 2,
+        poll_seconds: float = 5.0,
+        dedupe_window: int = 0,
+        dedupe_by_entity: bool = False,
+        flags: int = 0,
+        on_info: Optional[Callable[[str], None]] = None,
+        on_error: Optional[Callable[[str, Exception], None]] = None,
+    ) -> None:
+        """
+        Constructor
+
+        For return value of -> None, see https://peps.python.org/pep-0484/#the-meaning-of-annotations
+        """
+        if not 1 <= min_workers <= max_workers:
+            raise ValueError(f"need 1 <= min_workers <= max_workers, not {min_workers} and {max_workers}")
+        if records_per_worker < 1:
+            raise ValueError(f"records_per_worker must be at least 1, not {records_per_worker}")
+        if lookahead < 0:
+            raise ValueError(f"lookahead must not be negative, not {lookahead}")
+        if poll_seconds <= 0:
+            raise ValueError(f"poll_seconds must be positive, not {poll_seconds}")
+        if dedupe_window < 0:
+            raise ValueError(f"dedupe_window must not be negative, not {dedupe_window}")
+        self.sz_engine = sz_engine
+        self.max_workers = max_workers
+        self.min_workers = min_workers
+        self.records_per_worker = records_per_worker
+        self.lookahead = lookahead
+        self.poll_seconds = poll_seconds
+        self.dedupe_window = dedupe_window
+        self.dedupe_by_entity = dedupe_by_entity
+        self.flags = flags | SzEngineFlags.SZ_WITH_INFO if on_info else flags
+        self.on_info = on_info
+        self.on_error = on_error
+        self.condition = threading.Condition()
+        self.callback_lock = threading.Lock()
+        self.workers: Dict[int, threading.Thread] = {}
+        self.target_workers = 0
+        self.stopping = False
+        self.drained = False
+        self.started = 0.0
+        self.backlog: Deque[Tuple[float, int]] = deque(maxlen=BACKLOG_SAMPLES)
+        self.recent: Dict[str, "OrderedDict[Any, None]"] = {"duplicates": OrderedDict(), "collapsed": OrderedDict()}
+        self.counters: Dict[str, float] = {}
+        self.reset_stats()
+
+    # -------------------------------------------------------------------------
+    # SzRedoProcessor methods
+    # -------------------------------------------------------------------------
+
+    def run(self) -> Dict[str, float]:
+        """
+        Process redo records until the queue is empty or ``stop`` is called.
+        Workers process the records they have already fetched before ``run`` returns.
+
+        Returns:
+            Dict[str, float]: The final ``stats``.
+        """
+        with self.condition:
+            self.stopping = False
+            self.started = time.monotonic()
+            self.backlog.clear()
+            for recent in self.recent.values():
+                recent.clear()
+        try:
+            while True:
+                backlog = self.sz_engine.count_redo_records()
+                with self.condition:
+                    self.counters["polls"] += 1
+                    self.backlog.append((time.monotonic(), backlog))
+                    if self.stopping or (backlog == 0 and not self.workers):
+                        break
+                    self.scale(backlog)
+                    self.condition.wait_for(lambda: self.stopping or not self.workers, self.poll_seconds)
+                    if self.drained and not self.workers:
+                        break
+        finally:
+            self.stop()
+            for worker in list(self.workers.values()):
+                worker.join()
+        return self.stats()
+
+    def stop(self) -> None:
+        """
+        Ask the workers to exit once the records they have fetched are processed, and ``run`` to return.
+        Safe to call from any thread.
+        """
+        with self.condition:
+            self.stopping = True
+            self.target_workers = 0
+            self.condition.notify_all()
+
+    def reset_stats(self) -> None:
+        """
+        Set all counters to zero.
+        """
+        with self.condition:
+            self.counters = {
+                "processed": 0,
+                "errors": 0,
+                "polls": 0,
+                "scaled_up": 0,
+                "scaled_down": 0,
+                "duplicates": 0,
+                "collapsed": 0,
+                "process_seconds": 0.0,
+            }
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Report the redo records ``processed`` and ``errors``, the ``polls`` of the redo count and how often workers
+        were ``scaled_up`` and ``scaled_down``, with the current ``workers``, the last ``backlog`` counted,
+        ``processed_per_second`` since ``run`` started and ``backlog_trend``, the change in backlog per second
+        over the recent polls; negative while the queue is draining.
+
+        Records skipped as identical to a recent record are counted as ``duplicates``, and those skipped for
+        targeting a recent record's entity as ``collapsed``. ``process_seconds`` is the time spent in
+        ``process_redo_record`` and ``saved_seconds`` estimates the time the skipped records would have taken.
+
+        Returns:
+            Dict[str, float]: A copy of the counters with the rates.
+        """
+        with self.condition:
+            result: Dict[str, float] = dict(self.counters)
+            seconds = time.monotonic() - self.started if self.started else 0.0
+            result["workers"] = len(self.workers)
+            result["backlog"] = self.backlog[-1][1] if self.backlog else 0
+            result["processed_per_second"] = self.counters["processed"] / seconds if seconds else 0.0
+            result["saved_seconds"] = 0.0
+            if self.counters["processed"]:
+                result["saved_seconds"] = (
+                    (self.counters["duplicates"] + self.counters["collapsed"])
+                    * self.counters["process_seconds"]
+                    / self.counters["processed"]
+                )
+            result["backlog_trend"] = 0.0
+            if len(self.backlog) > 1 and self.backlog[-1][0] > self.backlog[0][0]:
+                result["backlog_trend"] = (self.backlog[-1][1] - self.backlog[0][1]) / (
+                    self.backlog[-1][0] - self.backlog[0][0]
+                )
+            return result
+
+    # -------------------------------------------------------------------------
+    # Non-public methods
+    # -------------------------------------------------------------------------
+
+    def scale(self, backlog: int) -> None:
+        """
+        Set the number of workers for a backlog and start the missing ones. Called holding the condition.
+
+        :meta private:
+        """
+        target = min(self.max_workers, max(self.min_workers, math.ceil(backlog / self.records_per_worker)))
+        if target > self.target_workers:
+            self.counters["scaled_up"] += 1
+        elif target < self.target_workers:
+            self.counters["scaled_down"] += 1
+        self.target_workers = target
+        for index in range(target):
+            if index not in self.workers:
+                self.drained = False
+                worker = threading.Thread(target=self.work, args=(index,), name=f"SzRedoProcessor-{index}", daemon=True)
+                self.workers[index] = worker
+                worker.start()
+
+    def work(self, index: int) -> None:
+        """
+        Process redo records until the queue is empty or this worker is beyond the target,
+        keeping up to ``lookahead`` fetches in flight while a record is processed.
+
+        A fetch removes its record from the server's queue, so fetches are never cancelled and
+        no fetched record is dropped: once the worker is told to exit, or a fetch finds the queue empty or fails,
+        it stops fetching, waits for the fetches in flight and processes the records they return.
+        Processing a record may add redo records, so a record processed after an empty fetch starts fetching again.
+
+        :meta private:
+        """
+        fetches: Deque["Future[str]"] = deque()
+        empty = failed = False
+        try:
+            while True:
+                while not empty and not failed and len(fetches) <= self.lookahead and self.wanted(index):
+                    fetches.append(self.sz_engine.futures.get_redo_record())
+                if not fetches:
+                    break
+                try:
+                    redo_record = fetches.popleft().result()
+                except Exception:  # pylint: disable=W0718
+                    failed = True
+                    with self.condition:
+                        self.counters["errors"] += 1
+                    continue
+                if not redo_record:
+                    empty = True
+                    continue
+                empty = False
+                self.process(redo_record)
+        finally:
+            with self.condition:
+                self.drained = empty and not failed
+                del self.workers[index]
+                self.condition.notify_all()
+
+    def wanted(self, index: int) -> bool:
+        """
+        Whether a worker should keep fetching.
+
+        :meta private:
+        """
+        with self.condition:
+            return not self.stopping and index < self.target_workers
+
+    def process(self, redo_record: str) -> None:
+        """
+        Process one redo record unless it is a recent duplicate, counting it and passing its response
+        or error to the callbacks.
+
+        :meta private:
+        """
+        started = time.monotonic()
+        try:
+            if self.dedupe_window and self.skip(redo_record):
+                return
+            info = self.sz_engine.process_redo_record(redo_record, self.flags)
+        except Exception as err:  # pylint: disable=W0718
+            self.failed(redo_record, err)
+            return
+        with self.condition:
+            self.counters["processed"] += 1
+            self.counters["process_seconds"] += time.monotonic() - started
+        if self.on_info and info:
+            try:
+                with self.callback_lock:
+                    self.on_info(info)
+            except Exception as err:  # pylint: disable=W0718
+                self.failed(redo_record, err)
+
+    def failed(self, redo_record: str, err: Exception) -> None:
+        """
+        Count a redo record as an error and pass it to ``on_error``.
+        An exception from ``on_error`` is ignored, so it cannot stop a worker holding fetched records.
+
+        :meta private:
+        """
+        with self.condition:
+            self.counters["errors"] += 1
+        if self.on_error:
+            with suppress(Exception), self.callback_lock:
+                self.on_error(redo_record, err)
+
+    def skip(self, redo_record: str) -> bool:
+        """
+        Whether a redo record duplicates a recent one, remembering it if not.
+
+        :meta private:
+        """
+        keys = redo_keys(redo_record, self.dedupe_by_entity)
+        with self.condition:
+            for counter, key in keys.items():
+                if key in self.recent[counter]:
+                    self.counters[counter] += 1
+                    return True
+            for counter, key in keys.items():
+                recent = self.recent[counter]
+                recent[key] = None
+                if len(recent) > self.dedupe_window:
+                    recent.popitem(last=False)
+            return False
+
+
+# -----------------------------------------------------------------------------
+# Helper functions
+# -----------------------------------------------------------------------------
+
+
+def redo_keys(redo_record: str, by_entity: bool) -> Dict[str, Any]:
+    """
+    The keys a redo record is deduplicated by: the digest of its canonical JSON as ``duplicates``
+    and, if ``by_entity``, the entity it targets as ``collapsed``.
+
+    :meta private:
+    """
+    try:
+        redo = json.loads(redo_record)
+    except ValueError:
+        return {"duplicates": hashlib.sha256(redo_record.encode("utf-8")).digest()}
+    canonical = json.dumps(redo, sort_keys=True, separators=(",", ":"))
+    result: Dict[str, Any] = {"duplicates": hashlib.sha256(canonical.encode("utf-8")).digest()}
+    entity_id = target_entity_id(redo) if by_entity else None
+    if entity_id is not None:
+        result["collapsed"] = entity_id
+    return result
+
+
+def target_entity_id(redo: Any) -> Optional[str]:
+    """
+    The ``ENTITY_ID`` a redo record targets, either at its top level or as a ``UMF_PROC`` parameter.
+
+    :meta private:
+    """
+    if not isinstance(redo, dict):
+        return None
+    if "ENTITY_ID" in redo:
+        return str(redo["ENTITY_ID"])
+    umf_proc = redo.get("UMF_PROC")
+    params = umf_proc.get("PARAMS") if isinstance(umf_proc, dict) else None
+    if not isinstance(params, list):
+        return None
+    for entry in params:
+        param = entry.get("PARAM") if isinstance(entry, dict) else None
+        if isinstance(param, dict) and param.get("NAME") == "ENTITY_ID":
+            return str(param.get("VALUE"))
+    return None
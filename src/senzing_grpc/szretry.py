@@ -0,0 +1,331 @@
+#! /usr/bin/env python3
+
+"""
+``senzing_grpc.szretry.SzRetryPolicy`` retries failed `gRPC`_ calls with jittered exponential backoff.
+
+A call is retried when the server reports a ``SzRetryableError``, which means the operation did not happen,
+or when an idempotent method fails with a transient gRPC status such as ``UNAVAILABLE``.
+Retries draw on a shared budget, so a failing server sees at most a fraction more traffic, not a multiple.
+A call's timeout, e.g. from ``SzDeadlines``, bounds all of its attempts together.
+
+A policy is attached to a channel with ``intercept``, or given to ``SzAbstractFactoryGrpc``
+or a client constructor as ``retry_policy``:
+
+.. code-block:: python
+
+    retry_policy = SzRetryPolicy(max_attempts=5)
+    sz_abstract_factory = SzAbstractFactoryGrpc(grpc_channel, retry_policy=retry_policy)
+    ...
+    print(retry_policy.stats())
+
+.. _gRPC: https://grpc.io
+"""
+
+# pylint: disable=R0902
+
+import random
+import threading
+import time
+from typing import Any, Callable, Dict, FrozenSet, Optional
+
+import grpc
+from senzing import SzRetryableError
+
+from .szhelpers import CompositeCall, new_exception, with_timeout
+
+# Metadata
+
+__all__ = ["NON_IDEMPOTENT_METHODS", "RETRYABLE_STATUS_CODES", "SzRetryPolicy"]
+__version__ = "0.0.1"  # See https://www.python.org/dev/peps/pep-0396/
+__date__ = "2026-10-18"
+__updated__ = "2026-10-18"
+
+RETRYABLE_STATUS_CODES = frozenset(
+    [
+        grpc.StatusCode.UNAVAILABLE,
+        grpc.StatusCode.RESOURCE_EXHAUSTED,
+        grpc.StatusCode.ABORTED,
+    ]
+)
+"""gRPC status codes retried for idempotent methods."""
+
+NON_IDEMPOTENT_METHODS = frozenset(
+    [
+        "/szconfigmanager.SzConfigManager/RegisterConfig",
+        "/szconfigmanager.SzConfigManager/ReplaceDefaultConfigId",
+        "/szconfigmanager.SzConfigManager/SetDefaultConfig",
+        "/szengine.SzEngine/CloseExportReport",
+        "/szengine.SzEngine/ExportCsvEntityReport",
+        "/szengine.SzEngine/ExportJsonEntityReport",
+        "/szengine.SzEngine/FetchNext",
+        "/szengine.SzEngine/GetRedoRecord",
+    ]
+)
+"""
+Methods whose repetition is visible, e.g. reading the next line of an export or taking a redo record off the queue.
+They are only retried on ``SzRetryableError``, never on a transport failure that may have happened after the server acted.
+"""
+
+# -----------------------------------------------------------------------------
+# SzRetryPolicy class
+# -----------------------------------------------------------------------------
+
+
+class SzRetryPolicy(grpc.UnaryUnaryClientInterceptor):  # type: ignore[misc]
+    """
+    Decides whether and when a failed unary call is retried and counts the retries.
+
+    The n-th retry waits a random time between 0 and ``min(max_backoff, initial_backoff * multiplier ** (n - 1))``.
+    Every call adds ``budget_ratio`` to the retry budget, up to ``budget_max``, and every retry spends 1,
+    so in steady state retries are limited to ``budget_ratio`` of calls.
+
+    Args:
+        max_attempts (int, optional): Attempts per call, including the first. Defaults to 5.
+        initial_backoff (float, optional): Upper bound in seconds of the first backoff. Defaults to 0.1.
+        max_backoff (float, optional): Upper bound in seconds of any backoff. Defaults to 10.0.
+        multiplier (float, optional): Growth of the backoff bound per retry. Defaults to 2.0.
+        retryable_status_codes (FrozenSet[grpc.StatusCode], optional): Status codes retried for idempotent methods. Defaults to RETRYABLE_STATUS_CODES.
+        non_idempotent_methods (FrozenSet[str], optional): Full method names never retried on a status code alone. Defaults to NON_IDEMPOTENT_METHODS.
+        budget_ratio (float, optional): Retry budget earned per call. Defaults to 0.1.
+        budget_max (float, optional): Largest retry budget, which is also the initial budget. Defaults to 100.0.
+    """
+
+    # -------------------------------------------------------------------------
+    # Python dunder/magic methods
+    # -------------------------------------------------------------------------
+
+    def __init__(
+        self,
+        max_attempts: int = 5,
+        initial_backoff: float = 0.1,
+        max_backoff: float = 10.0,
+        multiplier: float = 2.0,
+        retryable_status_codes: FrozenSet[grpc.StatusCode] = RETRYABLE_STATUS_CODES,
+        non_idempotent_methods: FrozenSet[str] = NON_IDEMPOTENT_METHODS,
+        budget_ratio: float = 0.1,
+        budget_max: float = 100.0,
+    ) -> None:
+        """
+        Constructor
+
+        For return value of -> None, see https://peps.python.org/pep-0484/#the-meaning-of-annotations
+        """
+        if max_attempts < 1:
+            raise ValueError(f"max_attempts must be at least 1, not {max_attempts}")
+
+        self.max_attempts = max_attempts
+        self.initial_backoff = initial_backoff
+        self.max_backoff = max_backoff
+        self.multiplier = multiplier
+        self.retryable_status_codes = retryable_status_codes
+        self.non_idempotent_methods = non_idempotent_methods
+        self.budget_ratio = budget_ratio
+        self.budget_max = budget_max
+
+        self.lock = threading.Lock()
+        self.budget = budget_max
+        self.counters: Dict[str, Any] = {}
+        self.reset_stats()
+
+    # -------------------------------------------------------------------------
+    # SzRetryPolicy methods
+    # -------------------------------------------------------------------------
+
+    def intercept(self, grpc_channel: grpc.Channel) -> grpc.Channel:
+        """
+        Return a channel whose unary calls are retried according to this policy.
+
+        Args:
+            grpc_channel (grpc.Channel): The channel to wrap.
+
+        Returns:
+            grpc.Channel: The wrapped channel.
+        """
+        return grpc.intercept_channel(grpc_channel, self)
+
+    def reset_stats(self) -> None:
+        """
+        Set all counters to zero.
+        """
+        with self.lock:
+            self.counters = {
+                "calls": 0,
+                "retries": 0,
+                "retried_calls_succeeded": 0,
+                "gave_up_max_attempts": 0,
+                "gave_up_budget": 0,
+                "gave_up_deadline": 0,
+                "backoff_seconds": 0.0,
+                "retries_by_method": {},
+            }
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Report how many calls were made and retried, why retrying stopped and how long was spent backing off.
+
+        Returns:
+            Dict[str, Any]: A copy of the counters.
+        """
+        with self.lock:
+            result = dict(self.counters)
+            result["retries_by_method"] = dict(self.counters["retries_by_method"])
+            result["budget"] = self.budget
+            return result
+
+    # -------------------------------------------------------------------------
+    # grpc.UnaryUnaryClientInterceptor methods
+    # -------------------------------------------------------------------------
+
+    def intercept_unary_unary(
+        self,
+        continuation: Callable[[grpc.ClientCallDetails, Any], Any],
+        client_call_details: grpc.ClientCallDetails,
+        request: Any,
+    ) -> Any:
+        with self.lock:
+            self.counters["calls"] += 1
+            self.budget = min(self.budget_max, self.budget + self.budget_ratio)
+
+        deadline = None
+        if client_call_details.timeout is not None:
+            deadline = time.monotonic() + client_call_details.timeout
+
+        def start() -> Any:
+            if deadline is None:
+                return continuation(client_call_details, request)
+            return continuation(with_timeout(client_call_details, max(0.0, deadline - time.monotonic())), request)
+
+        return RetryingCall(self, client_call_details.method, start, deadline)
+
+    # -------------------------------------------------------------------------
+    # Non-public SzRetryPolicy methods
+    # -------------------------------------------------------------------------
+
+    def is_retryable(self, method: str, call: Any) -> bool:
+        """
+        Decide whether the failure of a finished call may be retried.
+
+        :meta private:
+        """
+        code = call.code()
+        if code in (None, grpc.StatusCode.OK, grpc.StatusCode.CANCELLED, grpc.StatusCode.DEADLINE_EXCEEDED):
+            return False
+        if code in self.retryable_status_codes and method not in self.non_idempotent_methods:
+            return True
+        return isinstance(new_exception(call), SzRetryableError)
+
+    def next_backoff(self, method: str, call: Any, attempt: int, deadline: Optional[float] = None) -> Optional[float]:
+        """
+        Return the seconds to wait before retrying a call after its failed attempt, or None to give up.
+        Attempts are numbered from 1. A retry that would start after the deadline is not made.
+
+        :meta private:
+        """
+        if not self.is_retryable(method, call):
+            return None
+        with self.lock:
+            if attempt >= self.max_attempts:
+                self.counters["gave_up_max_attempts"] += 1
+                return None
+            if self.budget < 1.0:
+                self.counters["gave_up_budget"] += 1
+                return None
+            backoff = random.uniform(0, min(self.max_backoff, self.initial_backoff * self.multiplier ** (attempt - 1)))
+            if deadline is not None and time.monotonic() + backoff >= deadline:
+                self.counters["gave_up_deadline"] += 1
+                return None
+            self.budget -= 1.0
+            retries_by_method = self.counters["retries_by_method"]
+            retries_by_method[method] = retries_by_method.get(method, 0) + 1
+            self.counters["retries"] += 1
+            self.counters["backoff_seconds"] += backoff
+            return backoff
+
+    def record_success_after_retry(self) -> None:
+        """
+        Count a call that succeeded after at least one retry.
+
+        :meta private:
+        """
+        with self.lock:
+            self.counters["retried_calls_succeeded"] += 1
+
+
+# -----------------------------------------------------------------------------
+# RetryingCall class
+# -----------------------------------------------------------------------------
+
+
+class RetryingCall(CompositeCall):
+    """
+    The call returned to gRPC by SzRetryPolicy.
+
+    Attempts run through the continuation and completion is signalled by callbacks,
+    so ``.future()`` returns at once and backoff waits happen on timer threads.
+    Once no retry is due, this call reports the outcome of the last attempt.
+
+    :meta private:
+    """
+
+    def __init__(
+        self, policy: SzRetryPolicy, method: str, start: Callable[[], Any], deadline: Optional[float] = None
+    ) -> None:
+        super().__init__()
+        self.policy = policy
+        self.method = method
+        self.start = start
+        self.deadline = deadline
+        self.attempt = 0
+        self.timer: Optional[threading.Timer] = None
+        self.launch()
+
+    def launch(self) -> None:
+        with self.condition:
+            if self.was_cancelled:
+                return
+            self.attempt += 1
+        call = self.start()
+        with self.condition:
+            self.current = call
+            finished = self.final is not None or self.was_cancelled
+        if finished:
+            call.cancel()
+        call.add_done_callback(self.on_attempt_done)
+
+    def on_attempt_done(self, call: Any) -> None:
+        backoff = (
+            None if self.was_cancelled else self.policy.next_backoff(self.method, call, self.attempt, self.deadline)
+        )
+        if backoff is None:
+            if self.attempt > 1 and call.code() == grpc.StatusCode.OK:
+                self.policy.record_success_after_retry()
+            self.finish(call)
+            return
+        with self.condition:
+            self.timer = threading.Timer(backoff, self.launch)
+            self.timer.daemon = True
+            self.timer.start()
+
+    def cancel_attempts(self) -> None:
+        with self.condition:
+            timer, current = self.timer, self.current
+        if timer:
+            timer.cancel()
+        if current is not None and not current.cancel():
+            self.finish(current)
+
+
+# -----------------------------------------------------------------------------
+# Helper functions
+# -----------------------------------------------------------------------------
+
+
+def with_retry_policy(grpc_channel: grpc.Channel, retry_policy: Optional[SzRetryPolicy]) -> grpc.Channel:
+    """
+    Wrap the channel with the retry policy, if there is one.
+
+    :meta private:
+    """
+    if retry_policy is None:
+        return grpc_channel
+    return retry_policy.intercept(grpc_channel)
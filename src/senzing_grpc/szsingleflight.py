@@ -0,0 +1,325 @@
+#! /usr/bin/env python3
+
+"""
+``senzing_grpc.szsingleflight.SzSingleFlight`` lets identical reads that are in flight at the same time
+share one `gRPC`_ call.
+
+When many threads ask for the same popular entity at once, only the first request goes to the server;
+the others wait for its response. Nothing is kept after the call completes,
+so a read started afterwards always goes to the server.
+
+.. code-block:: python
+
+    single_flight = SzSingleFlight()
+    sz_abstract_factory = SzAbstractFactoryGrpc(grpc_channel, single_flight=single_flight)
+    ...
+    print(single_flight.stats())
+
+.. _gRPC: https://grpc.io
+"""
+
+import json
+import threading
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Tuple
+
+import grpc
+
+from .szhelpers import CompositeCall
+
+# Metadata
+
+__all__ = ["COALESCED_METHODS", "SzSingleFlight"]
+__version__ = "0.0.1"  # See https://www.python.org/dev/peps/pep-0396/
+__date__ = "2026-10-18"
+__updated__ = "2026-10-18"
+
+COALESCED_METHODS = frozenset(
+    [
+        "/szengine.SzEngine/GetEntityByEntityId",
+        "/szengine.SzEngine/GetEntityByRecordId",
+        "/szengine.SzEngine/GetRecord",
+        "/szengine.SzEngine/HowEntityByEntityId",
+        "/szengine.SzEngine/SearchByAttributes",
+        "/szengine.SzEngine/WhyEntities",
+        "/szengine.SzEngine/WhyRecordInEntity",
+        "/szengine.SzEngine/WhyRecords",
+        "/szengine.SzEngine/WhySearch",
+    ]
+)
+"""Read methods whose identical concurrent calls are coalesced by default."""
+
+FlightKey = Tuple[str, bytes]
+
+# -----------------------------------------------------------------------------
+# SzSingleFlight class
+# -----------------------------------------------------------------------------
+
+
+class SzSingleFlight(grpc.UnaryUnaryClientInterceptor):  # type: ignore[misc]
+    """
+    Coalesces identical concurrent calls of read methods into one call.
+
+    Calls are identical when they have the same method, arguments and flags.
+    JSON ``attributes`` are compared after sorting their keys, so key order does not matter.
+    Each caller can cancel its own wait; the shared call is only cancelled when every caller has.
+    Callers joining a call wait for it under the deadline of the caller that started it.
+
+    Args:
+        methods (FrozenSet[str], optional): Full method names to coalesce. Only idempotent reads belong here. Defaults to COALESCED_METHODS.
+    """
+
+    # -------------------------------------------------------------------------
+    # Python dunder/magic methods
+    # -------------------------------------------------------------------------
+
+    def __init__(self, methods: FrozenSet[str] = COALESCED_METHODS) -> None:
+        """
+        Constructor
+
+        For return value of -> None, see https://peps.python.org/pep-0484/#the-meaning-of-annotations
+        """
+        self.methods = methods
+        self.lock = threading.Lock()
+        self.flights: Dict[FlightKey, Flight] = {}
+        self.counters: Dict[str, int] = {}
+        self.reset_stats()
+
+    # -------------------------------------------------------------------------
+    # SzSingleFlight methods
+    # -------------------------------------------------------------------------
+
+    def intercept(self, grpc_channel: grpc.Channel) -> grpc.Channel:
+        """
+        Return a channel whose identical concurrent reads share one call.
+
+        Args:
+            grpc_channel (grpc.Channel): The channel to wrap.
+
+        Returns:
+            grpc.Channel: The wrapped channel.
+        """
+        return grpc.intercept_channel(grpc_channel, self)
+
+    def reset_stats(self) -> None:
+        """
+        Set all counters to zero.
+        """
+        with self.lock:
+            self.counters = {
+                "calls": 0,
+                "flights": 0,
+                "coalesced": 0,
+            }
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Report how many calls of the coalesced methods were made, how many went to the server as ``flights``
+        and how many were ``coalesced`` into a flight already in progress.
+
+        Returns:
+            Dict[str, int]: A copy of the counters with the number of flights ``in_flight``.
+        """
+        with self.lock:
+            result = dict(self.counters)
+            result["in_flight"] = len(self.flights)
+            return result
+
+    # -------------------------------------------------------------------------
+    # grpc.UnaryUnaryClientInterceptor methods
+    # -------------------------------------------------------------------------
+
+    def intercept_unary_unary(
+        self,
+        continuation: Callable[[grpc.ClientCallDetails, Any], Any],
+        client_call_details: grpc.ClientCallDetails,
+        request: Any,
+    ) -> Any:
+        method = client_call_details.method
+        if method not in self.methods:
+            return continuation(client_call_details, request)
+
+        key = (method, canonical_request(request))
+        with self.lock:
+            self.counters["calls"] += 1
+            flight = self.flights.get(key)
+            leader = flight is None
+            if flight is None:
+                flight = Flight(self, key)
+                self.flights[key] = flight
+                self.counters["flights"] += 1
+            else:
+                self.counters["coalesced"] += 1
+            waiter = CoalescedCall(flight)
+            flight.waiters.append(waiter)
+
+        if leader:
+            try:
+                call = continuation(client_call_details, request)
+            except Exception as err:
+                flight.on_done(LocalOutcome(grpc.StatusCode.UNKNOWN, str(err), err))
+                raise
+            flight.start(call)
+        return waiter
+
+    # -------------------------------------------------------------------------
+    # Non-public SzSingleFlight methods
+    # -------------------------------------------------------------------------
+
+    def land(self, flight: "Flight") -> None:
+        """
+        Forget a flight whose call has completed, so later reads start a new call.
+
+        :meta private:
+        """
+        with self.lock:
+            if self.flights.get(flight.key) is flight:
+                del self.flights[flight.key]
+
+
+# -----------------------------------------------------------------------------
+# Flight class
+# -----------------------------------------------------------------------------
+
+
+class Flight:
+    """
+    One call shared by the callers waiting for it.
+
+    :meta private:
+    """
+
+    def __init__(self, single_flight: SzSingleFlight, key: FlightKey) -> None:
+        self.single_flight = single_flight
+        self.key = key
+        self.call: Any = None
+        self.waiters: List[CoalescedCall] = []
+
+    def start(self, call: Any) -> None:
+        with self.single_flight.lock:
+            self.call = call
+            cancel = not self.waiters
+        if cancel:
+            call.cancel()
+        call.add_done_callback(self.on_done)
+
+    def on_done(self, call: Any) -> None:
+        self.single_flight.land(self)
+        with self.single_flight.lock:
+            waiters, self.waiters = self.waiters, []
+        for waiter in waiters:
+            waiter.finish(call)
+
+    def leave(self, waiter: "CoalescedCall") -> None:
+        """Stop waiting; cancel the shared call if nobody else waits for it."""
+        with self.single_flight.lock:
+            if waiter not in self.waiters:
+                return
+            self.waiters.remove(waiter)
+            call = self.call if not self.waiters else None
+            if not self.waiters:
+                self.single_flight.flights.pop(self.key, None)
+        if call is not None:
+            call.cancel()
+
+
+# -----------------------------------------------------------------------------
+# CoalescedCall class
+# -----------------------------------------------------------------------------
+
+
+class CoalescedCall(CompositeCall):
+    """
+    One caller's view of a shared call.
+
+    :meta private:
+    """
+
+    def __init__(self, flight: Flight) -> None:
+        super().__init__()
+        self.flight = flight
+
+    def latest(self) -> Any:
+        latest = super().latest()
+        return self.flight.call if latest is None else latest
+
+    def cancel_attempts(self) -> None:
+        self.flight.leave(self)
+        self.finish(LocalOutcome(grpc.StatusCode.CANCELLED, "Cancelled"))
+
+
+# -----------------------------------------------------------------------------
+# LocalOutcome class
+# -----------------------------------------------------------------------------
+
+
+class LocalOutcome:
+    """
+    The outcome of a wait that ended without a response from the shared call.
+
+    :meta private:
+    """
+
+    def __init__(self, code: grpc.StatusCode, details: str, exception: Optional[Exception] = None) -> None:
+        self.status_code = code
+        self.status_details = details
+        self.error = exception
+
+    def code(self) -> grpc.StatusCode:
+        return self.status_code
+
+    def details(self) -> str:
+        return self.status_details
+
+    def exception(self) -> Optional[Exception]:
+        return self.error
+
+    def initial_metadata(self) -> Any:
+        return ()
+
+    def result(self) -> Any:
+        if self.error is None:
+            raise grpc.FutureCancelledError()
+        raise self.error
+
+    def time_remaining(self) -> Optional[float]:
+        return None
+
+    def traceback(self) -> Any:
+        return None if self.error is None else self.error.__traceback__
+
+    def trailing_metadata(self) -> Any:
+        return ()
+
+
+# -----------------------------------------------------------------------------
+# Helper functions
+# -----------------------------------------------------------------------------
+
+
+def canonical_request(request: Any) -> bytes:
+    """
+    Serialize a request so that identical calls give identical bytes, sorting the keys of JSON ``attributes``.
+
+    :meta private:
+    """
+    attributes = getattr(request, "attributes", "")
+    if attributes:
+        try:
+            canonical = json.dumps(json.loads(attributes), sort_keys=True, separators=(",", ":"))
+        except ValueError:
+            canonical = attributes
+        if canonical != attributes:
+            request = type(request).FromString(request.SerializeToString())
+            request.attributes = canonical
+    return bytes(request.SerializeToString(deterministic=True))
+
+
+def with_single_flight(grpc_channel: grpc.Channel, single_flight: Optional[SzSingleFlight]) -> grpc.Channel:
+    """
+    Wrap the channel with the single-flight layer, if there is one.
+
+    :meta private:
+    """
+    if single_flight is None:
+        return grpc_channel
+    return single_flight.intercept(grpc_channel)
@@ -0,0 +1,265 @@
+#! /usr/bin/env python3
+
+import json
+import time
+from concurrent.futures import wait
+from typing import List, Set
+
+import grpc
+import pytest
+from senzing import SZ_WITHOUT_INFO, SzNotFoundError
+
+from senzing_grpc import (
+    HEDGEABLE_METHODS,
+    LEAST_OUTSTANDING,
+    ChannelPool,
+    SzAbstractFactoryGrpc,
+)
+
+from .helpers import get_grpc_channel_pool, get_grpc_target
+
+# -----------------------------------------------------------------------------
+# Test cases
+# -----------------------------------------------------------------------------
+
+
+def test_round_robin() -> None:
+    """Test ChannelPool spreads blocking calls evenly over its connections."""
+    with get_grpc_channel_pool(size=4) as grpc_channel:
+        sz_engine = SzAbstractFactoryGrpc(grpc_channel=grpc_channel).create_engine()
+        for _ in range(20):
+            sz_engine.get_active_config_id()
+        stats = grpc_channel.stats()
+    assert [subchannel["calls"] for subchannel in stats] == [5, 5, 5, 5]
+    assert [subchannel["outstanding"] for subchannel in stats] == [0, 0, 0, 0]
+
+
+def test_least_outstanding() -> None:
+    """Test ChannelPool with the least outstanding policy and concurrent futures."""
+    with get_grpc_channel_pool(size=3, policy=LEAST_OUTSTANDING) as grpc_channel:
+        sz_engine = SzAbstractFactoryGrpc(grpc_channel=grpc_channel).create_engine()
+        futures = [sz_engine.futures.add_record("TEST", f"POOL-{i}", "{}", SZ_WITHOUT_INFO) for i in range(30)]
+        wait(futures)
+        for i in range(30):
+            sz_engine.delete_record("TEST", f"POOL-{i}")
+        stats = grpc_channel.stats()
+    assert [future.result() for future in futures] == [""] * 30
+    assert sum(subchannel["calls"] for subchannel in stats) == 60
+    assert all(subchannel["calls"] > 0 for subchannel in stats)
+    assert [subchannel["outstanding"] for subchannel in stats] == [0, 0, 0]
+
+
+def test_error_releases_call() -> None:
+    """Test a failed call is no longer counted as outstanding."""
+    with get_grpc_channel_pool(size=2) as grpc_channel:
+        sz_engine = SzAbstractFactoryGrpc(grpc_channel=grpc_channel).create_engine()
+        with pytest.raises(SzNotFoundError):
+            sz_engine.get_entity_by_record_id("TEST", "POOL-DOES-NOT-EXIST")
+        with pytest.raises(SzNotFoundError):
+            sz_engine.futures.get_entity_by_record_id("TEST", "POOL-DOES-NOT-EXIST").result()
+        stats = grpc_channel.stats()
+    assert [subchannel["outstanding"] for subchannel in stats] == [0, 0]
+
+
+def test_export_iterator() -> None:
+    """Test a streaming call through a ChannelPool is outstanding until it completes."""
+    with get_grpc_channel_pool(size=2) as grpc_channel:
+        sz_engine = SzAbstractFactoryGrpc(grpc_channel=grpc_channel).create_engine()
+        sz_engine.add_record("TEST", "POOL-EXPORT", "{}")
+        lines = list(sz_engine.export_json_entity_report_iterator())
+        sz_engine.delete_record("TEST", "POOL-EXPORT")
+        stats = grpc_channel.stats()
+    assert len(lines) > 0
+    assert [subchannel["outstanding"] for subchannel in stats] == [0, 0]
+
+
+def test_weighted_targets() -> None:
+    """Test ChannelPool sends calls to servers in proportion to their weights."""
+    target = get_grpc_target()
+    with get_grpc_channel_pool(size=1, target=[(target, 3), (target, 1)]) as grpc_channel:
+        sz_engine = SzAbstractFactoryGrpc(grpc_channel=grpc_channel).create_engine()
+        for _ in range(40):
+            sz_engine.get_active_config_id()
+        stats = grpc_channel.stats()
+    assert [subchannel["calls"] for subchannel in stats] == [30, 10]
+    assert [subchannel["weight"] for subchannel in stats] == [3, 1]
+
+
+def test_unavailable_target_is_ejected() -> None:
+    """Test a server returning UNAVAILABLE receives no more calls until the ejection expires."""
+    failures = 0
+    with get_grpc_channel_pool(size=1, target=[get_grpc_target(), "localhost:1"]) as grpc_channel:
+        sz_engine = SzAbstractFactoryGrpc(grpc_channel=grpc_channel).create_engine()
+        for _ in range(10):
+            try:
+                sz_engine.get_active_config_id()
+            except grpc.RpcError as err:
+                assert err.code() == grpc.StatusCode.UNAVAILABLE  # pylint: disable=E1101
+                failures += 1
+        stats = grpc_channel.stats()
+    assert failures == 1
+    assert [subchannel["ejected"] for subchannel in stats] == [False, True]
+    assert [subchannel["calls"] for subchannel in stats] == [9, 1]
+
+
+def test_check_health() -> None:
+    """Test ChannelPool.check_health() ejects servers failing the probe and readmits those passing it."""
+    target = get_grpc_target()
+    unhealthy: Set[grpc.Channel] = set()
+    with get_grpc_channel_pool(
+        size=1, target=[target, target], health_check=lambda grpc_channel: grpc_channel not in unhealthy
+    ) as grpc_channel:
+        unhealthy.add(grpc_channel.server_channels()[1])
+        grpc_channel.check_health()
+        ejected_after_failure = [subchannel["ejected"] for subchannel in grpc_channel.stats()]
+        unhealthy.clear()
+        grpc_channel.check_health()
+        ejected_after_success = [subchannel["ejected"] for subchannel in grpc_channel.stats()]
+    assert ejected_after_failure == [False, True]
+    assert ejected_after_success == [False, False]
+
+
+def test_health_check_interval() -> None:
+    """Test ChannelPool probes servers in the background."""
+    with get_grpc_channel_pool(
+        size=1, target=[get_grpc_target(), "localhost:1"], health_check_interval=0.01
+    ) as grpc_channel:
+        deadline = time.monotonic() + 5.0
+        while not grpc_channel.stats()[1]["ejected"] and time.monotonic() < deadline:
+            time.sleep(0.01)
+        stats = grpc_channel.stats()
+    assert [subchannel["ejected"] for subchannel in stats] == [False, True]
+
+
+def test_record_affinity() -> None:
+    """Test ChannelPool sends every change to a record to the same server while spreading reads."""
+    target = get_grpc_target()
+    with get_grpc_channel_pool(size=2, target=[target, target, target], record_affinity=True) as grpc_channel:
+        sz_engine = SzAbstractFactoryGrpc(grpc_channel=grpc_channel).create_engine()
+        owners = []
+        for _ in range(3):
+            before = [subchannel["calls"] for subchannel in grpc_channel.stats()]
+            sz_engine.add_record("TEST", "AFFINITY-1", "{}", SZ_WITHOUT_INFO)
+            sz_engine.reevaluate_record("TEST", "AFFINITY-1")
+            sz_engine.delete_record("TEST", "AFFINITY-1")
+            after = [subchannel["calls"] for subchannel in grpc_channel.stats()]
+            servers = {position // 2 for position in range(6) if after[position] > before[position]}
+            owners.append(servers)
+        before = [subchannel["calls"] for subchannel in grpc_channel.stats()]
+        for _ in range(12):
+            sz_engine.get_active_config_id()
+        after = [subchannel["calls"] for subchannel in grpc_channel.stats()]
+    assert all(len(servers) == 1 for servers in owners)
+    assert owners[0] == owners[1] == owners[2]
+    assert [after[position] - before[position] for position in range(6)] == [2] * 6
+
+
+def test_record_affinity_spreads_records() -> None:
+    """Test ChannelPool spreads different records over the servers and avoids ejected servers."""
+    target = get_grpc_target()
+    with get_grpc_channel_pool(size=1, target=[target, target, target], record_affinity=True) as grpc_channel:
+        sz_engine = SzAbstractFactoryGrpc(grpc_channel=grpc_channel).create_engine()
+        for i in range(60):
+            sz_engine.add_record("TEST", f"AFFINITY-{i}", "{}", SZ_WITHOUT_INFO)
+        spread = [subchannel["calls"] for subchannel in grpc_channel.stats()]
+        grpc_channel.eject(grpc_channel.targets[0])
+        for i in range(60):
+            sz_engine.delete_record("TEST", f"AFFINITY-{i}")
+        after = [subchannel["calls"] for subchannel in grpc_channel.stats()]
+    assert all(calls > 5 for calls in spread)
+    assert after[0] == spread[0]
+    assert sum(after) == 120
+
+
+def test_hedged_reads() -> None:
+    """Test ChannelPool hedges slow reads once it knows their latency, and every call still gets one answer."""
+    target = get_grpc_target()
+    with get_grpc_channel_pool(
+        size=1,
+        target=[target, target],
+        hedged_methods=HEDGEABLE_METHODS,
+        hedge_percentile=1.0,
+        hedge_min_delay=0.0,
+    ) as grpc_channel:
+        sz_engine = SzAbstractFactoryGrpc(grpc_channel=grpc_channel).create_engine()
+        sz_engine.add_record("TEST", "HEDGE-1", "{}", SZ_WITHOUT_INFO)
+        blocking = [sz_engine.get_entity_by_record_id("TEST", "HEDGE-1") for _ in range(100)]
+        futures = [sz_engine.futures.get_entity_by_record_id("TEST", "HEDGE-1") for _ in range(100)]
+        wait(futures)
+        sz_engine.delete_record("TEST", "HEDGE-1")
+        time.sleep(0.1)
+        stats = grpc_channel.stats()
+        hedging_stats = grpc_channel.hedging_stats()
+    assert len({json.loads(entity)["RESOLVED_ENTITY"]["ENTITY_ID"] for entity in blocking}) == 1
+    assert all(future.result() == blocking[0] for future in futures)
+    assert hedging_stats["hedged_calls"] == 200
+    assert hedging_stats["hedges"] > 0
+    assert hedging_stats["delays"]["/szengine.SzEngine/GetEntityByRecordId"] is not None
+    assert sum(subchannel["calls"] for subchannel in stats) == 202 + hedging_stats["hedges"]
+    assert [subchannel["outstanding"] for subchannel in stats] == [0, 0]
+
+
+def test_hedged_read_not_found() -> None:
+    """Test an error response from a hedged read is raised."""
+    with get_grpc_channel_pool(size=2, hedged_methods=HEDGEABLE_METHODS) as grpc_channel:
+        sz_engine = SzAbstractFactoryGrpc(grpc_channel=grpc_channel).create_engine()
+        with pytest.raises(SzNotFoundError):
+            sz_engine.get_entity_by_record_id("TEST", "HEDGE-DOES-NOT-EXIST")
+        with pytest.raises(SzNotFoundError):
+            sz_engine.futures.get_entity_by_record_id("TEST", "HEDGE-DOES-NOT-EXIST").result()
+
+
+def test_hedge_after_finish() -> None:
+    """Test a hedge launched as its call finishes is cancelled and leaves the outcome alone."""
+    target = get_grpc_target()
+    with get_grpc_channel_pool(size=1, target=[target, target], hedged_methods=HEDGEABLE_METHODS) as grpc_channel:
+        sz_engine = SzAbstractFactoryGrpc(grpc_channel=grpc_channel).create_engine()
+        future = sz_engine.futures.get_entity_by_record_id("TEST", "HEDGE-DOES-NOT-EXIST")
+        with pytest.raises(SzNotFoundError):
+            future.result()
+        hedged_call = future.call  # type: ignore[attr-defined]
+        attempts = list(hedged_call.attempts)
+        hedged_call.launch()
+        time.sleep(0.1)
+        stats = grpc_channel.stats()
+    assert hedged_call.attempts == attempts
+    assert hedged_call.latest() is attempts[0]
+    assert sum(subchannel["calls"] for subchannel in stats) == 2
+    assert [subchannel["outstanding"] for subchannel in stats] == [0, 0]
+
+
+def test_writes_are_not_hedged() -> None:
+    """Test methods that change the repository cannot be hedged."""
+    with pytest.raises(ValueError):
+        get_grpc_channel_pool(hedged_methods=["/szengine.SzEngine/AddRecord"])
+    with get_grpc_channel_pool(size=2, hedged_methods=HEDGEABLE_METHODS) as grpc_channel:
+        sz_engine = SzAbstractFactoryGrpc(grpc_channel=grpc_channel).create_engine()
+        sz_engine.add_record("TEST", "HEDGE-2", "{}", SZ_WITHOUT_INFO)
+        sz_engine.delete_record("TEST", "HEDGE-2")
+        assert grpc_channel.hedging_stats()["hedged_calls"] == 0
+
+
+# -----------------------------------------------------------------------------
+# Unique testcases
+# -----------------------------------------------------------------------------
+
+
+def test_constructor_bad_size() -> None:
+    """Test ChannelPool constructor with a bad size."""
+    with pytest.raises(ValueError):
+        ChannelPool("localhost:8261", size=0)
+
+
+def test_constructor_bad_policy() -> None:
+    """Test ChannelPool constructor with a bad policy."""
+    with pytest.raises(ValueError):
+        ChannelPool("localhost:8261", policy="random")
+
+
+def test_subscribe() -> None:
+    """Test ChannelPool.subscribe() and ChannelPool.unsubscribe()."""
+    states: List[grpc.ChannelConnectivity] = []
+    with get_grpc_channel_pool(size=2) as grpc_channel:
+        grpc_channel.subscribe(states.append, try_to_connect=True)
+        grpc_channel.unsubscribe(states.append)
+    assert all(isinstance(state, grpc.ChannelConnectivity) for state in states)
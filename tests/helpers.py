@@ -1,8 +1,14 @@
 import os
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Iterator, Optional, Sequence, Tuple, Union
 
 import grpc
 from cryptography.hazmat.primitives import serialization
 from cryptography.hazmat.primitives.asymmetric import rsa
+from senzing_grpc_protobuf import szengine_pb2_grpc
+
+from senzing_grpc.channelpool import ROUND_ROBIN, ChannelPool
 
 # -----------------------------------------------------------------------------
 # Helpers
@@ -10,6 +16,58 @@ from cryptography.hazmat.primitives.asymmetric import rsa
 
 
 def get_grpc_channel() -> grpc.Channel:
+    client_credentials = get_grpc_channel_credentials()
+    if client_credentials:
+        return grpc.secure_channel("0.0.0.0:8261", client_credentials)
+    return grpc.insecure_channel("localhost:8261")
+
+
+def get_grpc_channel_async() -> grpc.aio.Channel:
+    client_credentials = get_grpc_channel_credentials()
+    if client_credentials:
+        return grpc.aio.secure_channel("0.0.0.0:8261", client_credentials)
+    return grpc.aio.insecure_channel("localhost:8261")
+
+
+def get_grpc_channel_pool(
+    size: int = 4,
+    policy: str = ROUND_ROBIN,
+    target: Optional[Sequence[Union[str, Tuple[str, int]]]] = None,
+    **kwargs: Any,
+) -> ChannelPool:
+    client_credentials = get_grpc_channel_credentials()
+    return ChannelPool(target or get_grpc_target(), size=size, policy=policy, credentials=client_credentials, **kwargs)
+
+
+@contextmanager
+def in_process_engine(servicer: Any, max_workers: int = 8) -> Iterator[grpc.Channel]:
+    """A channel to an in-process server running an SzEngineServicer written by a test."""
+    with in_process_engine_target(servicer, max_workers) as target:
+        with grpc.insecure_channel(target) as grpc_channel:
+            yield grpc_channel
+
+
+@contextmanager
+def in_process_engine_target(servicer: Any, max_workers: int = 8) -> Iterator[str]:
+    """The address of an in-process server running an SzEngineServicer written by a test."""
+    server = grpc.server(ThreadPoolExecutor(max_workers=max_workers))
+    szengine_pb2_grpc.add_SzEngineServicer_to_server(servicer, server)
+    port = server.add_insecure_port("localhost:0")
+    server.start()
+    try:
+        yield f"localhost:{port}"
+    finally:
+        server.stop(None)
+
+
+def get_grpc_target() -> str:
+    if get_grpc_channel_credentials():
+        return "0.0.0.0:8261"
+    return "localhost:8261"
+
+
+def get_grpc_channel_credentials() -> Optional[grpc.ChannelCredentials]:
+    result = None
     ca_certificate_file = os.environ.get("SENZING_TOOLS_SERVER_CA_CERTIFICATE_FILE")
     if ca_certificate_file:
 
@@ -48,17 +106,10 @@ def get_grpc_channel() -> grpc.Channel:
 
         # Create client credentials.
 
-        client_credentials = grpc.ssl_channel_credentials(
+        result = grpc.ssl_channel_credentials(
             root_certificates=server_cert,
             private_key=client_key,
             certificate_chain=client_cert,
         )
 
-        # Create a secure channel
-
-        result = grpc.secure_channel("0.0.0.0:8261", client_credentials)
-
-    else:
-        result = grpc.insecure_channel("localhost:8261")
-
     return result
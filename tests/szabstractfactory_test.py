@@ -1,5 +1,7 @@
 from datetime import datetime
+from typing import Any, Dict
 
+import grpc
 import pytest
 from senzing import (
     SzAbstractFactory,
@@ -9,9 +11,18 @@ from senzing import (
     SzProduct,
 )
 
-from senzing_grpc import SzAbstractFactoryGrpc, SzAbstractFactoryParametersGrpc
+from senzing_grpc import (
+    HEDGEABLE_METHODS,
+    ChannelPool,
+    SzAbstractFactoryGrpc,
+    SzAbstractFactoryParametersGrpc,
+)
 
-from .helpers import get_grpc_channel
+from .helpers import (
+    get_grpc_channel,
+    get_grpc_channel_credentials,
+    get_grpc_target,
+)
 
 FACTORY_PARAMETERS: SzAbstractFactoryParametersGrpc = {
     "grpc_channel": get_grpc_channel(),
@@ -146,6 +157,40 @@ def test_constructor() -> None:
     assert isinstance(actual, SzAbstractFactory)
 
 
+def test_constructor_grpc_targets() -> None:
+    """Test constructor with a list of servers."""
+    with SzAbstractFactoryGrpc(
+        grpc_targets=[(get_grpc_target(), 2), get_grpc_target()],
+        grpc_credentials=get_grpc_channel_credentials(),
+    ) as actual:
+        assert isinstance(actual.base_channel, ChannelPool)
+        sz_engine = actual.create_engine()
+        assert sz_engine.get_active_config_id() > 0
+        actual.reinitialize(sz_engine.get_active_config_id())
+
+
+def test_constructor_without_channel_or_targets() -> None:
+    """Test constructor with neither a channel nor servers."""
+    with pytest.raises(ValueError):
+        SzAbstractFactoryGrpc()
+
+
+@pytest.mark.parametrize(
+    "pool_option",
+    [
+        {"grpc_credentials": grpc.ssl_channel_credentials()},
+        {"health_check_interval": 1.0},
+        {"ejection_seconds": 5.0},
+        {"record_affinity": True},
+        {"hedged_methods": HEDGEABLE_METHODS},
+    ],
+)
+def test_constructor_pool_option_without_targets(pool_option: Dict[str, Any]) -> None:
+    """Test constructor with an option of grpc_targets given with a channel instead."""
+    with pytest.raises(ValueError):
+        SzAbstractFactoryGrpc(grpc_channel=get_grpc_channel(), **pool_option)
+
+
 def test_context() -> None:
     """Test constructor."""
     with SzAbstractFactoryGrpc(grpc_channel=get_grpc_channel()) as actual:
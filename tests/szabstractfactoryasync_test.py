@@ -0,0 +1,87 @@
+import asyncio
+from datetime import datetime
+
+from senzing_grpc import (
+    SzAbstractFactoryGrpcAsync,
+    SzConfigManagerGrpcAsync,
+    SzDiagnosticGrpcAsync,
+    SzEngineGrpcAsync,
+    SzProductGrpcAsync,
+)
+
+from .helpers import get_grpc_channel_async
+
+# -----------------------------------------------------------------------------
+# Test cases
+# -----------------------------------------------------------------------------
+
+
+def test_create_configmanager() -> None:
+    """Test SzAbstractFactoryGrpcAsync.create_configmanager()."""
+    actual = SzAbstractFactoryGrpcAsync(get_grpc_channel_async()).create_configmanager()
+    assert isinstance(actual, SzConfigManagerGrpcAsync)
+
+
+def test_create_diagnostic() -> None:
+    """Test SzAbstractFactoryGrpcAsync.create_diagnostic()."""
+    actual = SzAbstractFactoryGrpcAsync(get_grpc_channel_async()).create_diagnostic()
+    assert isinstance(actual, SzDiagnosticGrpcAsync)
+
+
+def test_create_engine() -> None:
+    """Test SzAbstractFactoryGrpcAsync.create_engine()."""
+    actual = SzAbstractFactoryGrpcAsync(get_grpc_channel_async()).create_engine()
+    assert isinstance(actual, SzEngineGrpcAsync)
+
+
+def test_create_product() -> None:
+    """Test SzAbstractFactoryGrpcAsync.create_product()."""
+    actual = SzAbstractFactoryGrpcAsync(get_grpc_channel_async()).create_product()
+    assert isinstance(actual, SzProductGrpcAsync)
+
+
+def test_reinitialize() -> None:
+    """Test SzAbstractFactoryGrpcAsync.reinitialize()."""
+
+    datasource = f"Test_Datasource_{datetime.now().timestamp()}"
+    config_comment = f"Test_config_{datetime.now().timestamp()}"
+
+    async def run() -> None:
+        async with SzAbstractFactoryGrpcAsync(get_grpc_channel_async()) as sz_abstractfactory:
+            sz_configmanager = sz_abstractfactory.create_configmanager()
+            sz_engine = sz_abstractfactory.create_engine()
+
+            old_default_config_id = await sz_configmanager.get_default_config_id()
+            sz_config = await sz_configmanager.create_config_from_config_id(old_default_config_id)
+            await sz_config.register_data_source(datasource)
+            new_default_config_id = await sz_configmanager.set_default_config(sz_config.export(), config_comment)
+            assert old_default_config_id != new_default_config_id
+
+            await sz_abstractfactory.reinitialize(new_default_config_id)
+            assert await sz_engine.get_active_config_id() == new_default_config_id
+
+    asyncio.run(run())
+
+
+# -----------------------------------------------------------------------------
+# Unique testcases
+# -----------------------------------------------------------------------------
+
+
+def test_concurrent_use_across_services() -> None:
+    """Test concurrent calls to several services sharing one channel."""
+
+    async def run() -> None:
+        async with SzAbstractFactoryGrpcAsync(get_grpc_channel_async()) as sz_abstractfactory:
+            sz_diagnostic = sz_abstractfactory.create_diagnostic()
+            sz_engine = sz_abstractfactory.create_engine()
+            sz_product = sz_abstractfactory.create_product()
+            results = await asyncio.gather(
+                sz_diagnostic.get_repository_info(),
+                sz_engine.get_stats(),
+                sz_product.get_version(),
+                *[sz_engine.get_active_config_id() for _ in range(50)],
+            )
+            assert len(results) == 53
+
+    asyncio.run(run())
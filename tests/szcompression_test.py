@@ -0,0 +1,129 @@
+#! /usr/bin/env python3
+
+# pylint: disable=E1101
+
+import json
+from typing import Any, List
+
+import grpc
+import pytest
+from senzing import SZ_WITHOUT_INFO
+from senzing_grpc_protobuf import szconfigmanager_pb2, szengine_pb2
+
+from senzing_grpc import (
+    LARGE_RESPONSE_METHODS,
+    SzAbstractFactoryGrpc,
+    SzCompressionPolicy,
+)
+from senzing_grpc.szhelpers import ClientCallDetails
+
+from .helpers import get_grpc_channel
+
+# -----------------------------------------------------------------------------
+# Test cases
+# -----------------------------------------------------------------------------
+
+
+def test_factory_compresses_calls() -> None:
+    """Test calls through a factory with a policy are compressed and still answered."""
+    compression = SzCompressionPolicy(min_request_bytes=0, algorithm=grpc.Compression.Deflate)
+    sz_abstract_factory = SzAbstractFactoryGrpc(get_grpc_channel(), compression=compression)
+    sz_engine = sz_abstract_factory.create_engine()
+    sz_engine.add_record("TEST", "COMPRESSION-1", "{}", SZ_WITHOUT_INFO)
+    result = json.loads(sz_engine.get_entity_by_record_id("TEST", "COMPRESSION-1"))
+    exported = list(sz_engine.export_json_entity_report_iterator())
+    sz_engine.delete_record("TEST", "COMPRESSION-1")
+    sz_configmanager = sz_abstract_factory.create_configmanager()
+    assert json.loads(sz_configmanager.get_template_config())
+    assert result["RESOLVED_ENTITY"]["ENTITY_ID"] > 0
+    assert exported
+    stats = compression.stats()
+    assert stats["compressed"] == 5
+    assert stats["uncompressed"] == 0
+
+
+def test_factory_without_policy() -> None:
+    """Test a factory without a policy leaves calls alone."""
+    sz_abstract_factory = SzAbstractFactoryGrpc(get_grpc_channel())
+    assert sz_abstract_factory.compression is None
+    assert sz_abstract_factory.create_product().get_version()
+
+
+# -----------------------------------------------------------------------------
+# Unique testcases
+# -----------------------------------------------------------------------------
+
+
+def call_details(method: str, compression: Any = None) -> ClientCallDetails:
+    return ClientCallDetails(method, None, None, None, None, compression)
+
+
+def intercepted(policy: SzCompressionPolicy, details: ClientCallDetails, request: Any) -> List[Any]:
+    seen: List[Any] = []
+
+    def continuation(client_call_details: Any, _: Any) -> None:
+        seen.append(client_call_details.compression)
+
+    policy.intercept_unary_unary(continuation, details, request)
+    policy.intercept_unary_stream(continuation, details, request)
+    return seen
+
+
+def test_by_method() -> None:
+    """Test the default policy compresses the large-response methods only."""
+    policy = SzCompressionPolicy()
+    network = szengine_pb2.FindNetworkByEntityIdRequest()
+    add_record = szengine_pb2.AddRecordRequest(record_definition="{}")
+    assert "/szengine.SzEngine/FindNetworkByEntityId" in LARGE_RESPONSE_METHODS
+    assert (
+        intercepted(policy, call_details("/szengine.SzEngine/FindNetworkByEntityId"), network)
+        == [grpc.Compression.Gzip] * 2
+    )
+    assert (
+        intercepted(policy, call_details("/szengine.SzEngine/AddRecord"), add_record)
+        == [grpc.Compression.NoCompression] * 2
+    )
+    assert policy.stats() == {"compressed": 2, "uncompressed": 2}
+
+
+def test_by_size() -> None:
+    """Test requests of at least min_request_bytes are compressed with the algorithm."""
+    policy = SzCompressionPolicy(methods={}, algorithm=grpc.Compression.Deflate, min_request_bytes=1000)
+    method = "/szconfigmanager.SzConfigManager/RegisterConfig"
+    small = szconfigmanager_pb2.RegisterConfigRequest(config_definition="{}")
+    large = szconfigmanager_pb2.RegisterConfigRequest(config_definition="x" * 1000)
+    assert policy.compression_for(method, small) == grpc.Compression.NoCompression
+    assert policy.compression_for(method, large) == grpc.Compression.Deflate
+    assert SzCompressionPolicy(methods={}, min_request_bytes=None).compression_for(method, large) == (
+        grpc.Compression.NoCompression
+    )
+
+
+def test_method_setting_wins_over_size() -> None:
+    """Test a method's own setting applies whatever the size of its request."""
+    method = "/szconfigmanager.SzConfigManager/RegisterConfig"
+    policy = SzCompressionPolicy(methods={method: grpc.Compression.NoCompression}, min_request_bytes=0)
+    request = szconfigmanager_pb2.RegisterConfigRequest(config_definition="x" * 1000)
+    assert policy.compression_for(method, request) == grpc.Compression.NoCompression
+
+
+def test_caller_compression_is_kept() -> None:
+    """Test a call whose caller chose a compression is left alone and not counted."""
+    policy = SzCompressionPolicy(min_request_bytes=0)
+    details = call_details("/szengine.SzEngine/AddRecord", grpc.Compression.Deflate)
+    assert intercepted(policy, details, szengine_pb2.AddRecordRequest()) == [grpc.Compression.Deflate] * 2
+    assert policy.stats() == {"compressed": 0, "uncompressed": 0}
+
+
+def test_reset_stats() -> None:
+    """Test SzCompressionPolicy.reset_stats()."""
+    policy = SzCompressionPolicy(min_request_bytes=0)
+    intercepted(policy, call_details("/szengine.SzEngine/AddRecord"), szengine_pb2.AddRecordRequest())
+    policy.reset_stats()
+    assert policy.stats() == {"compressed": 0, "uncompressed": 0}
+
+
+def test_constructor_bad_min_request_bytes() -> None:
+    """Test SzCompressionPolicy constructor with a bad min_request_bytes."""
+    with pytest.raises(ValueError):
+        SzCompressionPolicy(min_request_bytes=-1)
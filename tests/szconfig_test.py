@@ -7,7 +7,7 @@ import pytest
 from pytest_schema import Optional, Or, schema
 from senzing import SzAbstractFactory, SzConfig, SzConfigManager, SzError, SzSdkError
 
-from senzing_grpc import SzAbstractFactoryGrpc, SzConfigGrpc
+from senzing_grpc import SzAbstractFactoryGrpc, SzConfigGrpc, SzConfigManagerGrpc
 
 from .helpers import get_grpc_channel
 
@@ -110,6 +110,59 @@ def test_constructor() -> None:
     assert isinstance(actual, SzConfig)
 
 
+def test_register_data_sources() -> None:
+    """Test SzConfigGrpc.register_data_sources() gives the configuration registering one by one does, sending less."""
+    data_source_codes = [f"BATCH_{i}" for i in range(10)]
+    one_by_one = SzConfigManagerGrpc(get_grpc_channel()).create_config_from_template()
+    expected = {code: one_by_one.register_data_source(code) for code in data_source_codes}
+    expected_stats = one_by_one.stats()
+    batch = SzConfigManagerGrpc(get_grpc_channel()).create_config_from_template()
+    actual = batch.register_data_sources(data_source_codes)
+    stats = batch.stats()
+    assert {code: json.loads(result) for code, result in actual.items()} == {
+        code: json.loads(result) for code, result in expected.items()
+    }
+    assert json.loads(batch.export()) == json.loads(one_by_one.export())
+    assert batch.get_data_source_registry() == one_by_one.get_data_source_registry()
+    assert stats["round_trips"] == stats["round_trips_one_by_one"] == 10
+    assert stats["bytes_sent"] * 4 < stats["bytes_sent_one_by_one"]
+    assert stats["bytes_sent_one_by_one"] == expected_stats["bytes_sent"]
+
+
+def test_unregister_data_sources() -> None:
+    """Test SzConfigGrpc.unregister_data_sources() gives the configuration unregistering one by one does."""
+    data_source_codes = [f"BATCH_{i}" for i in range(5)]
+    one_by_one = SzConfigManagerGrpc(get_grpc_channel()).create_config_from_template()
+    one_by_one.register_data_sources(data_source_codes)
+    batch = SzConfigManagerGrpc(get_grpc_channel()).create_config_from_string(one_by_one.export())
+    for code in data_source_codes:
+        one_by_one.unregister_data_source(code)
+    batch.unregister_data_sources(data_source_codes)
+    assert json.loads(batch.export()) == json.loads(one_by_one.export())
+
+
+def test_edit_rollback() -> None:
+    """Test the configuration is unchanged when the block of SzConfigGrpc.edit() raises."""
+    sz_config = SzConfigManagerGrpc(get_grpc_channel()).create_config_from_template()
+    expected = sz_config.export()
+    with pytest.raises(RuntimeError):
+        with sz_config.edit():
+            sz_config.register_data_source("ROLLBACK_1")
+            sz_config.register_data_source("ROLLBACK_2")
+            assert "ROLLBACK_2" in sz_config.export()
+            raise RuntimeError("rollback")
+    assert sz_config.export() == expected
+
+
+def test_edit_nested() -> None:
+    """Test SzConfigGrpc.edit() cannot be nested."""
+    sz_config = SzConfigManagerGrpc(get_grpc_channel()).create_config_from_template()
+    with sz_config.edit():
+        with pytest.raises(SzSdkError):
+            with sz_config.edit():
+                pass
+
+
 # -----------------------------------------------------------------------------
 # Fixtures
 # -----------------------------------------------------------------------------
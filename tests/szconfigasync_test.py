@@ -0,0 +1,57 @@
+import asyncio
+import json
+
+import pytest
+from senzing import SzError
+
+from senzing_grpc import SzConfigGrpcAsync, SzConfigManagerGrpcAsync
+
+from .helpers import get_grpc_channel_async
+
+# -----------------------------------------------------------------------------
+# Test cases
+# -----------------------------------------------------------------------------
+
+
+def test_register_data_source() -> None:
+    """Test SzConfigGrpcAsync.register_data_source()."""
+
+    async def run() -> str:
+        async with get_grpc_channel_async() as grpc_channel:
+            sz_configmanager = SzConfigManagerGrpcAsync(grpc_channel)
+            sz_config = await sz_configmanager.create_config_from_template()
+            assert isinstance(sz_config, SzConfigGrpcAsync)
+            await sz_config.register_data_source("NAME_OF_DATASOURCE")
+            return await sz_config.get_data_source_registry()
+
+    actual = asyncio.run(run())
+    data_source_codes = [item["DSRC_CODE"] for item in json.loads(actual)["DATA_SOURCES"]]
+    assert "NAME_OF_DATASOURCE" in data_source_codes
+
+
+def test_unregister_data_source() -> None:
+    """Test SzConfigGrpcAsync.unregister_data_source()."""
+
+    async def run() -> str:
+        async with get_grpc_channel_async() as grpc_channel:
+            sz_configmanager = SzConfigManagerGrpcAsync(grpc_channel)
+            sz_config = await sz_configmanager.create_config_from_template()
+            await sz_config.register_data_source("NAME_OF_DATASOURCE")
+            await sz_config.unregister_data_source("NAME_OF_DATASOURCE")
+            return await sz_config.get_data_source_registry()
+
+    actual = asyncio.run(run())
+    data_source_codes = [item["DSRC_CODE"] for item in json.loads(actual)["DATA_SOURCES"]]
+    assert "NAME_OF_DATASOURCE" not in data_source_codes
+
+
+def test_verify_config_definition_bad() -> None:
+    """Test SzConfigGrpcAsync.create_config_from_string() with a bad config."""
+
+    async def run() -> None:
+        async with get_grpc_channel_async() as grpc_channel:
+            sz_configmanager = SzConfigManagerGrpcAsync(grpc_channel)
+            await sz_configmanager.create_config_from_string("{}")
+
+    with pytest.raises(SzError):
+        asyncio.run(run())
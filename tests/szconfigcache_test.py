@@ -0,0 +1,95 @@
+#! /usr/bin/env python3
+
+import os
+from pathlib import Path
+
+import pytest
+
+from senzing_grpc import SzAbstractFactoryGrpc, SzConfigCache, SzConfigManagerGrpc
+
+from .helpers import get_grpc_channel
+
+# -----------------------------------------------------------------------------
+# Test cases
+# -----------------------------------------------------------------------------
+
+
+def test_create_config_from_config_id() -> None:
+    """Test a configuration is downloaded once and then read from memory."""
+    config_cache = SzConfigCache()
+    sz_configmanager = SzConfigManagerGrpc(get_grpc_channel(), config_cache=config_cache)
+    config_id = sz_configmanager.get_default_config_id()
+    first = sz_configmanager.create_config_from_config_id(config_id).export()
+    second = sz_configmanager.create_config_from_config_id(config_id).export()
+    stats = config_cache.stats()
+    assert first == second
+    assert stats["misses"] == 1
+    assert stats["memory_hits"] == 1
+
+
+def test_create_config_from_template() -> None:
+    """Test the template is downloaded once per server version through a factory."""
+    config_cache = SzConfigCache()
+    sz_abstract_factory = SzAbstractFactoryGrpc(get_grpc_channel(), config_cache=config_cache)
+    first = sz_abstract_factory.create_configmanager().create_config_from_template().export()
+    second = sz_abstract_factory.create_configmanager().create_config_from_template().export()
+    stats = config_cache.stats()
+    assert first == second
+    assert stats["misses"] == 1
+    assert stats["memory_hits"] == 1
+
+
+def test_disk_cache(tmp_path: Path) -> None:
+    """Test a configuration written to disk is read back by another cache."""
+    sz_configmanager = SzConfigManagerGrpc(get_grpc_channel(), config_cache=SzConfigCache(directory=str(tmp_path)))
+    config_id = sz_configmanager.get_default_config_id()
+    expected = sz_configmanager.create_config_from_config_id(config_id).export()
+    config_cache = SzConfigCache(directory=str(tmp_path))
+    sz_configmanager = SzConfigManagerGrpc(get_grpc_channel(), config_cache=config_cache)
+    actual = sz_configmanager.create_config_from_config_id(config_id).export()
+    assert actual == expected
+    assert config_cache.stats()["disk_hits"] == 1
+    assert config_cache.stats()["misses"] == 0
+
+
+# -----------------------------------------------------------------------------
+# Unique testcases
+# -----------------------------------------------------------------------------
+
+
+def test_corrupt_file_is_discarded(tmp_path: Path) -> None:
+    """Test a file on disk that does not match its digest is removed and downloaded again."""
+    SzConfigCache(directory=str(tmp_path)).config(1, lambda: '{"G2_CONFIG": {}}')
+    with open(tmp_path / "config-1.json", "a", encoding="utf-8") as config_file:
+        config_file.write(" ")
+    config_cache = SzConfigCache(directory=str(tmp_path))
+    assert config_cache.config(1, lambda: '{"G2_CONFIG": {"FRESH": 1}}') == '{"G2_CONFIG": {"FRESH": 1}}'
+    assert config_cache.stats()["corrupt_files"] == 1
+    assert config_cache.stats()["misses"] == 1
+    assert SzConfigCache(directory=str(tmp_path)).config(1, lambda: "") == '{"G2_CONFIG": {"FRESH": 1}}'
+
+
+def test_max_entries() -> None:
+    """Test the least recently used documents are evicted from memory."""
+    config_cache = SzConfigCache(max_entries=2)
+    for config_id in (1, 2, 1, 3):
+        config_cache.config(config_id, lambda: "{}")
+    config_cache.config(1, lambda: "{}")
+    stats = config_cache.stats()
+    assert stats["entries"] == 2
+    assert stats["evictions"] == 1
+    assert stats["memory_hits"] == 2
+    assert stats["misses"] == 3
+
+
+def test_template_key_is_a_safe_file_name(tmp_path: Path) -> None:
+    """Test a server version is turned into a file name inside the directory."""
+    config_cache = SzConfigCache(directory=str(tmp_path))
+    config_cache.template("../4.0.0 (1)", lambda: "{}")
+    assert sorted(os.listdir(tmp_path)) == ["template-.._4.0.0__1_.json", "template-.._4.0.0__1_.json.sha256"]
+
+
+def test_constructor_bad_max_entries() -> None:
+    """Test SzConfigCache constructor with a bad max_entries."""
+    with pytest.raises(ValueError):
+        SzConfigCache(max_entries=0)
@@ -0,0 +1,50 @@
+import asyncio
+from datetime import datetime
+
+from senzing_grpc import SzConfigManagerGrpcAsync
+
+from .helpers import get_grpc_channel_async
+
+# -----------------------------------------------------------------------------
+# Test cases
+# -----------------------------------------------------------------------------
+
+
+def test_create_config_from_config_id() -> None:
+    """Test SzConfigManagerGrpcAsync.create_config_from_config_id()."""
+
+    async def run() -> str:
+        async with get_grpc_channel_async() as grpc_channel:
+            sz_configmanager = SzConfigManagerGrpcAsync(grpc_channel)
+            config_id = await sz_configmanager.get_default_config_id()
+            sz_config = await sz_configmanager.create_config_from_config_id(config_id)
+            return sz_config.export()
+
+    actual = asyncio.run(run())
+    assert "G2_CONFIG" in actual
+
+
+def test_register_config() -> None:
+    """Test SzConfigManagerGrpcAsync.register_config()."""
+    config_comment = f"Test_config_{datetime.now().timestamp()}"
+
+    async def run() -> int:
+        async with get_grpc_channel_async() as grpc_channel:
+            sz_configmanager = SzConfigManagerGrpcAsync(grpc_channel)
+            sz_config = await sz_configmanager.create_config_from_template()
+            return await sz_configmanager.register_config(sz_config.export(), config_comment)
+
+    actual = asyncio.run(run())
+    assert actual > 0
+
+
+def test_get_config_registry() -> None:
+    """Test SzConfigManagerGrpcAsync.get_config_registry()."""
+
+    async def run() -> str:
+        async with get_grpc_channel_async() as grpc_channel:
+            async with SzConfigManagerGrpcAsync(grpc_channel) as sz_configmanager:
+                return await sz_configmanager.get_config_registry()
+
+    actual = asyncio.run(run())
+    assert len(actual) > 0
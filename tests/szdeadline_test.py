@@ -0,0 +1,150 @@
+#! /usr/bin/env python3
+
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+import grpc
+import pytest
+from senzing import SzError
+
+from senzing_grpc import (
+    SzAbstractFactoryGrpc,
+    SzDeadlineExceededError,
+    SzDeadlines,
+    SzRetryPolicy,
+    deadline,
+)
+
+from .helpers import get_grpc_channel
+
+SLOW_CALL_SECONDS = 2
+
+# -----------------------------------------------------------------------------
+# Test cases
+# -----------------------------------------------------------------------------
+
+
+def test_deadline_exceeded() -> None:
+    """Test a call running out of time raises SzDeadlineExceededError."""
+    sz_abstract_factory = SzAbstractFactoryGrpc(get_grpc_channel(), deadlines=SzDeadlines(diagnostics=0.5))
+    sz_diagnostic = sz_abstract_factory.create_diagnostic()
+    start = time.monotonic()
+    with pytest.raises(SzDeadlineExceededError):
+        sz_diagnostic.check_repository_performance(SLOW_CALL_SECONDS)
+    assert time.monotonic() - start < SLOW_CALL_SECONDS
+
+
+def test_deadline_by_method_class() -> None:
+    """Test a deadline for one class of method does not apply to the others."""
+    sz_abstract_factory = SzAbstractFactoryGrpc(
+        get_grpc_channel(), deadlines=SzDeadlines(reads=0.5, diagnostics=SLOW_CALL_SECONDS * 5)
+    )
+    sz_diagnostic = sz_abstract_factory.create_diagnostic()
+    sz_diagnostic.check_repository_performance(SLOW_CALL_SECONDS)
+
+
+def test_deadline_override() -> None:
+    """Test deadline() replaces the default for calls in the with block only."""
+    sz_abstract_factory = SzAbstractFactoryGrpc(get_grpc_channel(), deadlines=SzDeadlines(diagnostics=None))
+    sz_diagnostic = sz_abstract_factory.create_diagnostic()
+    with deadline(0.5):
+        with pytest.raises(SzDeadlineExceededError):
+            sz_diagnostic.check_repository_performance(SLOW_CALL_SECONDS)
+        with deadline(None):
+            sz_diagnostic.check_repository_performance(1)
+    sz_diagnostic.check_repository_performance(1)
+
+
+def test_deadline_bounds_retries() -> None:
+    """Test the deadline of a call bounds all of its retries."""
+    retry_policy = SzRetryPolicy(max_attempts=100, initial_backoff=0.05, multiplier=1.0)
+    sz_abstract_factory = SzAbstractFactoryGrpc(
+        grpc.insecure_channel("localhost:1"), retry_policy=retry_policy, deadlines=SzDeadlines(reads=0.5)
+    )
+    sz_engine = sz_abstract_factory.create_engine()
+    start = time.monotonic()
+    with pytest.raises((grpc.RpcError, SzDeadlineExceededError)):
+        sz_engine.get_active_config_id()
+    assert time.monotonic() - start < 2.0
+    assert retry_policy.stats()["gave_up_max_attempts"] == 0
+
+
+# -----------------------------------------------------------------------------
+# Unique testcases
+# -----------------------------------------------------------------------------
+
+
+def test_timeout_for() -> None:
+    """Test SzDeadlines.timeout_for() by class of method."""
+    sz_deadlines = SzDeadlines(reads=1.0, writes=2.0, exports=3.0, diagnostics=None)
+    assert sz_deadlines.timeout_for("/szengine.SzEngine/GetEntityByEntityId") == 1.0
+    assert sz_deadlines.timeout_for("/szproduct.SzProduct/GetVersion") == 1.0
+    assert sz_deadlines.timeout_for("/szengine.SzEngine/AddRecord") == 2.0
+    assert sz_deadlines.timeout_for("/szconfigmanager.SzConfigManager/SetDefaultConfig") == 2.0
+    assert sz_deadlines.timeout_for("/szengine.SzEngine/FetchNext") == 3.0
+    assert sz_deadlines.timeout_for("/szengine.SzEngine/StreamExportJsonEntityReport") is None
+    assert sz_deadlines.timeout_for("/szdiagnostic.SzDiagnostic/PurgeRepository") is None
+    with deadline(4.0):
+        assert sz_deadlines.timeout_for("/szengine.SzEngine/AddRecord") == 4.0
+
+
+class TimeoutRecorder(grpc.UnaryUnaryClientInterceptor, grpc.UnaryStreamClientInterceptor):  # type: ignore[misc]
+    """Records the timeout of each call."""
+
+    def __init__(self) -> None:
+        self.timeouts: List[Optional[float]] = []
+
+    def intercept_unary_stream(
+        self,
+        continuation: Callable[[grpc.ClientCallDetails, Any], Any],
+        client_call_details: grpc.ClientCallDetails,
+        request: Any,
+    ) -> Any:
+        self.timeouts.append(client_call_details.timeout)
+        return continuation(client_call_details, request)
+
+    def intercept_unary_unary(
+        self,
+        continuation: Callable[[grpc.ClientCallDetails, Any], Any],
+        client_call_details: grpc.ClientCallDetails,
+        request: Any,
+    ) -> Any:
+        self.timeouts.append(client_call_details.timeout)
+        return continuation(client_call_details, request)
+
+
+def test_streams_without_deadline() -> None:
+    """Test a default SzDeadlines sets no timeout on export streams, which may run for hours."""
+    recorder = TimeoutRecorder()
+    grpc_channel = SzDeadlines().intercept(grpc.intercept_channel(grpc.insecure_channel("localhost:1"), recorder))
+    for method in ("StreamExportCsvEntityReport", "StreamExportJsonEntityReport"):
+        stub = grpc_channel.unary_stream(
+            f"/szengine.SzEngine/{method}",
+            request_serializer=lambda request: b"",
+            response_deserializer=lambda response: response,
+        )
+        stub(None).cancel()
+    assert recorder.timeouts == [None, None]
+
+
+@pytest.mark.parametrize("deadlines, expected", [({}, 30.0), ({"deadlines": None}, None)])
+def test_factory_default_deadlines(deadlines: Dict[str, Any], expected: Optional[float]) -> None:
+    """Test SzAbstractFactoryGrpc applies the SzDeadlines defaults unless given None."""
+    recorder = TimeoutRecorder()
+    grpc_channel = grpc.intercept_channel(grpc.insecure_channel("localhost:1"), recorder)
+    sz_product = SzAbstractFactoryGrpc(grpc_channel, **deadlines).create_product()
+    with pytest.raises((grpc.RpcError, SzError)):
+        sz_product.get_version()
+    assert recorder.timeouts == [expected]
+
+
+def test_caller_timeout_wins() -> None:
+    """Test a timeout set by the caller is kept."""
+    sz_deadlines = SzDeadlines(reads=0.0)
+    grpc_channel = sz_deadlines.intercept(get_grpc_channel())
+    stub = grpc_channel.unary_unary(
+        "/szproduct.SzProduct/GetVersion",
+        request_serializer=lambda request: b"",
+        response_deserializer=lambda response: response,
+    )
+    stub(None, timeout=10.0)
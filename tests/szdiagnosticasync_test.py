@@ -0,0 +1,34 @@
+import asyncio
+import json
+
+from senzing_grpc import SzDiagnosticGrpcAsync
+
+from .helpers import get_grpc_channel_async
+
+# -----------------------------------------------------------------------------
+# Test cases
+# -----------------------------------------------------------------------------
+
+
+def test_check_repository_performance() -> None:
+    """Test SzDiagnosticGrpcAsync.check_repository_performance()."""
+
+    async def run() -> str:
+        async with get_grpc_channel_async() as grpc_channel:
+            sz_diagnostic = SzDiagnosticGrpcAsync(grpc_channel)
+            return await sz_diagnostic.check_repository_performance(1)
+
+    actual = asyncio.run(run())
+    assert isinstance(json.loads(actual), dict)
+
+
+def test_get_repository_info() -> None:
+    """Test SzDiagnosticGrpcAsync.get_repository_info()."""
+
+    async def run() -> str:
+        async with get_grpc_channel_async() as grpc_channel:
+            async with SzDiagnosticGrpcAsync(grpc_channel) as sz_diagnostic:
+                return await sz_diagnostic.get_repository_info()
+
+    actual = asyncio.run(run())
+    assert isinstance(json.loads(actual), dict)
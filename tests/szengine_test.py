@@ -3,7 +3,11 @@
 # pylint: disable=C0302
 
 import json
-from typing import Any, Dict, List, Tuple
+import queue
+import threading
+import time
+from concurrent.futures import Future, as_completed
+from typing import Any, Dict, Iterator, List, Tuple
 
 import pytest
 from pytest_schema import Optional, Or, SchemaError, schema
@@ -28,6 +32,7 @@ from senzing_truthset import (
 )
 
 from senzing_grpc import SzAbstractFactoryGrpc, SzEngineGrpc
+from senzing_grpc.szhelpers import pipelined, prefetched
 
 from .helpers import get_grpc_channel
 
@@ -1147,6 +1152,218 @@ def test_constructor() -> None:
     assert isinstance(actual, SzEngine)
 
 
+def test_add_records(sz_engine: SzEngineGrpc) -> None:
+    """Test SzEngineGrpc.add_records()."""
+    records = [("TEST", f"BULK-{i}", RECORD_STR) for i in range(200)]
+    actual = list(sz_engine.add_records(records, SZ_WITHOUT_INFO, max_in_flight=16))
+    assert len(actual) == len(records)
+    assert sorted(result.position for result in actual) == list(range(len(records)))
+    for result in actual:
+        assert result.error is None
+        assert result.result == ""
+        assert records[result.position][1] == result.record_id
+    for _, record_id, _ in records:
+        sz_engine.delete_record("TEST", record_id)
+
+
+def test_add_records_ordered(sz_engine: SzEngineGrpc) -> None:
+    """Test SzEngineGrpc.add_records() yielding in input order."""
+    records = [("TEST", f"BULK-{i}", RECORD_STR) for i in range(50)]
+    actual = list(sz_engine.add_records(records, SzEngineFlags.SZ_WITH_INFO, max_in_flight=8, ordered=True))
+    assert [result.position for result in actual] == list(range(len(records)))
+    for result in actual:
+        assert schema(add_record_with_info_schema) == json.loads(result.result)
+    for _, record_id, _ in records:
+        sz_engine.delete_record("TEST", record_id)
+
+
+def test_add_records_with_errors(sz_engine: SzEngineGrpc) -> None:
+    """Test SzEngineGrpc.add_records() reports per-record errors without stopping."""
+    records = [
+        ("TEST", "BULK-1", RECORD_STR),
+        ("DOESN'T EXIST", "BULK-2", RECORD_STR),
+        ("TEST", 3, RECORD_STR),
+        ("TEST", "BULK-4", RECORD_STR_BAD),
+        ("TEST", "BULK-5", RECORD_STR),
+    ]
+    actual = list(sz_engine.add_records(records, ordered=True))  # type: ignore[arg-type]
+    assert actual[0].error is None
+    assert isinstance(actual[1].error, SzBadInputError)
+    assert isinstance(actual[2].error, SzSdkError)
+    assert isinstance(actual[3].error, SzError)
+    assert actual[4].error is None
+    sz_engine.delete_record("TEST", "BULK-1")
+    sz_engine.delete_record("TEST", "BULK-5")
+
+
+def test_add_records_early_exit(sz_engine: SzEngineGrpc) -> None:
+    """Test leaving SzEngineGrpc.add_records() early does not consume the whole input."""
+    consumed = 0
+
+    def records() -> Iterator[Tuple[str, str, str]]:
+        nonlocal consumed
+        for i in range(10_000):
+            consumed += 1
+            yield ("TEST", f"BULK-{i}", RECORD_STR)
+
+    for result in sz_engine.add_records(records(), max_in_flight=4):
+        assert result.error is None
+        break
+    assert consumed <= 5
+    for i in range(consumed):
+        sz_engine.delete_record("TEST", f"BULK-{i}")
+
+
+def test_pipelined_ordered_stalled_head() -> None:
+    """Test ordered pipelining reads no further ahead than max_in_flight while the first item is stalled."""
+    stalled: "Future[int]" = Future()
+    consumed = 0
+
+    def items() -> Iterator[int]:
+        nonlocal consumed
+        for i in range(10_000):
+            consumed += 1
+            yield i
+
+    def submit(item: int) -> "Future[int]":
+        if item == 0:
+            return stalled
+        result: "Future[int]" = Future()
+        result.set_result(item)
+        return result
+
+    results = pipelined(submit, items(), 4, ordered=True)
+    threading.Timer(0.2, stalled.set_result, (0,)).start()
+    assert next(results)[0] == 0
+    assert consumed == 4
+    assert [position for position, _, _ in results] == list(range(1, 10_000))
+
+
+def test_futures_add_record(sz_engine: SzEngineGrpc) -> None:
+    """Test SzEngineGrpc.futures.add_record()."""
+    record_ids = [f"FUTURE-{i}" for i in range(50)]
+    futures = [sz_engine.futures.add_record("TEST", record_id, RECORD_STR) for record_id in record_ids]
+    assert all(isinstance(future, Future) for future in futures)
+    for future in as_completed(futures):
+        assert future.result() == ""
+    futures = [sz_engine.futures.delete_record("TEST", record_id) for record_id in record_ids]
+    for future in futures:
+        assert future.result() == ""
+
+
+def test_futures_get_entity_by_record_id(sz_engine: SzEngineGrpc) -> None:
+    """Test SzEngineGrpc.futures.get_entity_by_record_id()."""
+    sz_engine.add_record("TEST", "FUTURE-1", RECORD_STR)
+    future = sz_engine.futures.get_entity_by_record_id("TEST", "FUTURE-1")
+    actual = future.result()
+    sz_engine.delete_record("TEST", "FUTURE-1")
+    assert json.loads(actual).get("RESOLVED_ENTITY", {}).get("ENTITY_ID", 0) > 0
+
+
+def test_futures_get_entity_by_record_id_unknown_record_id(sz_engine: SzEngineGrpc) -> None:
+    """Test SzEngineGrpc.futures.get_entity_by_record_id() raises the mapped error from result()."""
+    future = sz_engine.futures.get_entity_by_record_id("TEST", "FUTURE-DOES-NOT-EXIST")
+    with pytest.raises(SzNotFoundError):
+        future.result()
+    assert isinstance(future.exception(), SzNotFoundError)
+
+
+def test_futures_add_record_bad_data_source_code_type(sz_engine: SzEngineGrpc) -> None:
+    """Test SzEngineGrpc.futures.add_record() with bad data_source_code datatype."""
+    with pytest.raises(SzSdkError):
+        sz_engine.futures.add_record(1, "1", RECORD_STR)  # type: ignore[arg-type]
+
+
+def test_futures_count_redo_records(sz_engine: SzEngineGrpc) -> None:
+    """Test SzEngineGrpc.futures.count_redo_records()."""
+    actual = sz_engine.futures.count_redo_records().result()
+    assert actual >= 0
+
+
+def test_add_records_bad_max_in_flight(sz_engine: SzEngineGrpc) -> None:
+    """Test SzEngineGrpc.add_records() with a bad max_in_flight."""
+    with pytest.raises(SzSdkError):
+        list(sz_engine.add_records([("TEST", "BULK-1", RECORD_STR)], max_in_flight=0))
+
+
+def test_export_iterators_prefetch(sz_engine: SzEngineGrpc) -> None:
+    """Test the export iterators yield the same lines with and without prefetching."""
+    records = [("TEST", f"PREFETCH-{i}", RECORD_STR) for i in range(20)]
+    for result in sz_engine.add_records(records, SZ_WITHOUT_INFO):
+        assert result.error is None
+    expected_json = list(sz_engine.export_json_entity_report_iterator())
+    expected_csv = list(sz_engine.export_csv_entity_report_iterator("*"))
+    actual_json = list(sz_engine.export_json_entity_report_iterator(prefetch_lines=2))
+    actual_csv = list(sz_engine.export_csv_entity_report_iterator("*", prefetch_bytes=100))
+    for _, record_id, _ in records:
+        sz_engine.delete_record("TEST", record_id)
+    assert len(expected_json) >= len(records)
+    assert actual_json == expected_json
+    assert actual_csv == expected_csv
+
+
+def test_export_iterator_bad_prefetch(sz_engine: SzEngineGrpc) -> None:
+    """Test SzEngineGrpc.export_json_entity_report_iterator() with a bad prefetch_lines."""
+    with pytest.raises(SzSdkError):
+        list(sz_engine.export_json_entity_report_iterator(prefetch_lines=-1))
+
+
+def test_prefetched_bounds() -> None:
+    """Test prefetched() reads ahead no further than its bounds."""
+    read: "queue.Queue[int]" = queue.Queue()
+    produced = 0
+
+    def items() -> Iterator[str]:
+        nonlocal produced
+        for i in range(100):
+            produced += 1
+            read.put(i)
+            yield str(i) * 10
+
+    lines = prefetched(items(), 5, 0, len, None)
+    assert next(lines) == "0" * 10
+    for _ in range(6):
+        read.get(timeout=5)
+    time.sleep(0.1)
+    assert produced == 7
+    lines = prefetched(items(), 0, 25, len, None)
+    produced = 0
+    assert next(lines) == "0" * 10
+    time.sleep(0.1)
+    assert produced == 4
+    assert list(lines) == [str(i) * 10 for i in range(1, 100)]
+
+
+def test_prefetched_error_and_cancel() -> None:
+    """Test prefetched() raises a read error after the items before it, and cancels the read when abandoned."""
+
+    def failing() -> Iterator[str]:
+        yield "first"
+        raise ValueError("broken stream")
+
+    lines = prefetched(failing(), 10, 0, len, None)
+    assert next(lines) == "first"
+    with pytest.raises(ValueError):
+        next(lines)
+
+    unblock = threading.Event()
+    cancelled = []
+
+    def blocking() -> Iterator[str]:
+        yield "first"
+        unblock.wait(5)
+        yield "second"
+
+    def cancel() -> None:
+        cancelled.append(True)
+        unblock.set()
+
+    lines = prefetched(blocking(), 10, 0, len, cancel)
+    assert next(lines) == "first"
+    lines.close()
+    assert cancelled == [True]
+
+
 # def test_export_csv_entity_report_iterator(sz_engine: SzEngineTest) -> None:
 #     """Test SzEngine().export_csv_entity_report_iterator()."""
 
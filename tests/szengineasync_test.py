@@ -0,0 +1,175 @@
+#! /usr/bin/env python3
+
+import asyncio
+import json
+from typing import Any, Dict, List
+
+import pytest
+from pytest_schema import schema
+from senzing import (
+    SZ_WITHOUT_INFO,
+    SzBadInputError,
+    SzEngineFlags,
+    SzNotFoundError,
+    SzSdkError,
+)
+
+from senzing_grpc import SzEngineGrpcAsync
+
+from .helpers import get_grpc_channel_async
+
+# -----------------------------------------------------------------------------
+# Test cases
+# -----------------------------------------------------------------------------
+
+
+def test_add_record() -> None:
+    """Test SzEngineGrpcAsync.add_record()."""
+
+    async def run() -> str:
+        async with get_grpc_channel_async() as grpc_channel:
+            sz_engine = SzEngineGrpcAsync(grpc_channel)
+            return await sz_engine.add_record("TEST", "1", "{}", SZ_WITHOUT_INFO)
+
+    actual = asyncio.run(run())
+    assert actual == ""
+
+
+def test_add_record_with_info() -> None:
+    """Test SzEngineGrpcAsync.add_record() with info."""
+
+    async def run() -> str:
+        async with get_grpc_channel_async() as grpc_channel:
+            sz_engine = SzEngineGrpcAsync(grpc_channel)
+            return await sz_engine.add_record("TEST", "1", "{}", SzEngineFlags.SZ_WITH_INFO)
+
+    actual = asyncio.run(run())
+    actual_as_dict = json.loads(actual)
+    assert schema(add_record_with_info_schema) == actual_as_dict
+
+
+def test_add_record_bad_data_source_code_type() -> None:
+    """Test SzEngineGrpcAsync.add_record() with bad data_source_code datatype."""
+    bad_data_source_code = 1
+    record_definition: Dict[Any, Any] = {}
+
+    async def run() -> str:
+        async with get_grpc_channel_async() as grpc_channel:
+            sz_engine = SzEngineGrpcAsync(grpc_channel)
+            return await sz_engine.add_record(bad_data_source_code, "1", record_definition)  # type: ignore[arg-type]
+
+    with pytest.raises(SzSdkError):
+        asyncio.run(run())
+
+
+def test_add_record_bad_data_source_code_value() -> None:
+    """Test SzEngineGrpcAsync.add_record() with bad data_source_code value."""
+
+    async def run() -> str:
+        async with get_grpc_channel_async() as grpc_channel:
+            sz_engine = SzEngineGrpcAsync(grpc_channel)
+            return await sz_engine.add_record("DOESN'T EXIST", "1", "{}")
+
+    with pytest.raises(SzBadInputError):
+        asyncio.run(run())
+
+
+def test_add_record_concurrently() -> None:
+    """Test many concurrent SzEngineGrpcAsync.add_record() calls on one channel."""
+    record_ids = [f"ASYNC-{i}" for i in range(100)]
+
+    async def run() -> List[str]:
+        async with get_grpc_channel_async() as grpc_channel:
+            sz_engine = SzEngineGrpcAsync(grpc_channel)
+            results = await asyncio.gather(
+                *[sz_engine.add_record("TEST", record_id, "{}", SZ_WITHOUT_INFO) for record_id in record_ids]
+            )
+            await asyncio.gather(*[sz_engine.delete_record("TEST", record_id) for record_id in record_ids])
+            return results
+
+    actual = asyncio.run(run())
+    assert actual == [""] * len(record_ids)
+
+
+def test_get_entity_by_record_id() -> None:
+    """Test SzEngineGrpcAsync.get_entity_by_record_id()."""
+
+    async def run() -> str:
+        async with get_grpc_channel_async() as grpc_channel:
+            sz_engine = SzEngineGrpcAsync(grpc_channel)
+            await sz_engine.add_record("TEST", "ASYNC-ENTITY", "{}")
+            result = await sz_engine.get_entity_by_record_id("TEST", "ASYNC-ENTITY")
+            await sz_engine.delete_record("TEST", "ASYNC-ENTITY")
+            return result
+
+    actual = asyncio.run(run())
+    actual_as_dict = json.loads(actual)
+    assert actual_as_dict.get("RESOLVED_ENTITY", {}).get("ENTITY_ID", 0) > 0
+
+
+def test_get_entity_by_record_id_unknown_record_id() -> None:
+    """Test SzEngineGrpcAsync.get_entity_by_record_id() with an unknown record."""
+
+    async def run() -> str:
+        async with get_grpc_channel_async() as grpc_channel:
+            sz_engine = SzEngineGrpcAsync(grpc_channel)
+            return await sz_engine.get_entity_by_record_id("TEST", "ASYNC-DOES-NOT-EXIST")
+
+    with pytest.raises(SzNotFoundError):
+        asyncio.run(run())
+
+
+def test_count_redo_records() -> None:
+    """Test SzEngineGrpcAsync.count_redo_records()."""
+
+    async def run() -> int:
+        async with get_grpc_channel_async() as grpc_channel:
+            sz_engine = SzEngineGrpcAsync(grpc_channel)
+            return await sz_engine.count_redo_records()
+
+    actual = asyncio.run(run())
+    assert actual >= 0
+
+
+def test_export_json_entity_report_iterator() -> None:
+    """Test SzEngineGrpcAsync.export_json_entity_report_iterator()."""
+
+    async def run() -> List[str]:
+        async with get_grpc_channel_async() as grpc_channel:
+            sz_engine = SzEngineGrpcAsync(grpc_channel)
+            await sz_engine.add_record("TEST", "ASYNC-EXPORT", "{}")
+            result = [line async for line in sz_engine.export_json_entity_report_iterator()]
+            await sz_engine.delete_record("TEST", "ASYNC-EXPORT")
+            return result
+
+    actual = asyncio.run(run())
+    for line in actual:
+        assert "RESOLVED_ENTITY" in json.loads(line)
+
+
+# -----------------------------------------------------------------------------
+# Unique testcases
+# -----------------------------------------------------------------------------
+
+
+def test_context_management() -> None:
+    """Test the use of SzEngineGrpcAsync in context."""
+
+    async def run() -> int:
+        async with get_grpc_channel_async() as grpc_channel:
+            async with SzEngineGrpcAsync(grpc_channel) as sz_engine:
+                return await sz_engine.get_active_config_id()
+
+    actual = asyncio.run(run())
+    assert actual > 0
+
+
+# -----------------------------------------------------------------------------
+# Schemas
+# -----------------------------------------------------------------------------
+
+add_record_with_info_schema = {
+    "DATA_SOURCE": str,
+    "RECORD_ID": str,
+    "AFFECTED_ENTITIES": [{"ENTITY_ID": int}],
+}
@@ -0,0 +1,168 @@
+#! /usr/bin/env python3
+
+import json
+import time
+
+import pytest
+from senzing import SZ_WITHOUT_INFO, SzEngineFlags
+
+from senzing_grpc import SzAbstractFactoryGrpc, SzEngineGrpc, SzEntityCache
+
+from .helpers import get_grpc_channel
+
+# -----------------------------------------------------------------------------
+# Test cases
+# -----------------------------------------------------------------------------
+
+
+def test_hit_and_miss() -> None:
+    """Test a repeated entity read is answered from the cache, for blocking calls and futures."""
+    entity_cache = SzEntityCache()
+    sz_engine = SzEngineGrpc(get_grpc_channel(), entity_cache=entity_cache)
+    sz_engine.add_record("TEST", "CACHE-1", "{}", SZ_WITHOUT_INFO)
+    first = sz_engine.get_entity_by_record_id("TEST", "CACHE-1")
+    second = sz_engine.get_entity_by_record_id("TEST", "CACHE-1")
+    third = sz_engine.futures.get_entity_by_record_id("TEST", "CACHE-1").result()
+    entity_id = json.loads(first)["RESOLVED_ENTITY"]["ENTITY_ID"]
+    by_entity_id = [sz_engine.get_entity_by_entity_id(entity_id) for _ in range(2)]
+    stats = entity_cache.stats()
+    sz_engine.delete_record("TEST", "CACHE-1")
+    assert first == second == third
+    assert by_entity_id[0] == by_entity_id[1]
+    assert stats["misses"] == 2
+    assert stats["hits"] == 3
+    assert stats["entries"] == 2
+    assert stats["bytes"] > 0
+
+
+def test_flags_are_part_of_key() -> None:
+    """Test reads of the same entity with different flags are cached separately."""
+    entity_cache = SzEntityCache()
+    sz_engine = SzEngineGrpc(get_grpc_channel(), entity_cache=entity_cache)
+    sz_engine.add_record("TEST", "CACHE-2", "{}", SZ_WITHOUT_INFO)
+    sz_engine.get_entity_by_record_id("TEST", "CACHE-2")
+    sz_engine.get_entity_by_record_id("TEST", "CACHE-2", SzEngineFlags.SZ_ENTITY_BRIEF_DEFAULT_FLAGS)
+    stats = entity_cache.stats()
+    sz_engine.delete_record("TEST", "CACHE-2")
+    assert stats["misses"] == 2
+    assert stats["hits"] == 0
+
+
+def test_with_info_invalidates_affected_entities() -> None:
+    """Test a change returned WITH_INFO drops the cached reads of its AFFECTED_ENTITIES."""
+    entity_cache = SzEntityCache()
+    sz_abstract_factory = SzAbstractFactoryGrpc(get_grpc_channel(), entity_cache=entity_cache)
+    sz_engine = sz_abstract_factory.create_engine()
+    sz_engine.add_record("TEST", "CACHE-3", "{}", SZ_WITHOUT_INFO)
+    entity_id = json.loads(sz_engine.get_entity_by_record_id("TEST", "CACHE-3"))["RESOLVED_ENTITY"]["ENTITY_ID"]
+    sz_engine.get_entity_by_entity_id(entity_id)
+    assert entity_cache.stats()["entries"] == 2
+    info = sz_abstract_factory.create_engine().reevaluate_entity(entity_id, SzEngineFlags.SZ_WITH_INFO)
+    stats = entity_cache.stats()
+    sz_engine.delete_record("TEST", "CACHE-3")
+    assert entity_id in [entity["ENTITY_ID"] for entity in json.loads(info)["AFFECTED_ENTITIES"]]
+    assert stats["entries"] == 0
+    assert stats["invalidations"] == 2
+
+
+def test_delete_invalidates_record() -> None:
+    """Test deleting a record, even without info, drops the cached reads by its record id."""
+    entity_cache = SzEntityCache()
+    sz_engine = SzEngineGrpc(get_grpc_channel(), entity_cache=entity_cache)
+    sz_engine.add_record("TEST", "CACHE-4", "{}", SZ_WITHOUT_INFO)
+    sz_engine.get_entity_by_record_id("TEST", "CACHE-4")
+    sz_engine.futures.delete_record("TEST", "CACHE-4", SZ_WITHOUT_INFO).result()
+    assert entity_cache.stats()["entries"] == 0
+
+
+def test_max_bytes() -> None:
+    """Test the least recently used entries are evicted to keep the cache within max_bytes."""
+    probe = SzEntityCache()
+    sz_engine = SzEngineGrpc(get_grpc_channel(), entity_cache=probe)
+    for i in range(10):
+        sz_engine.add_record("TEST", f"CACHE-5-{i}", "{}", SZ_WITHOUT_INFO)
+    sz_engine.get_entity_by_record_id("TEST", "CACHE-5-0")
+    max_bytes = probe.stats()["bytes"] * 7 // 2
+    entity_cache = SzEntityCache(max_bytes=max_bytes)
+    sz_engine = SzEngineGrpc(get_grpc_channel(), entity_cache=entity_cache)
+    for i in range(10):
+        sz_engine.get_entity_by_record_id("TEST", f"CACHE-5-{i}")
+    sz_engine.get_entity_by_record_id("TEST", "CACHE-5-9")
+    sz_engine.get_entity_by_record_id("TEST", "CACHE-5-0")
+    stats = entity_cache.stats()
+    for i in range(10):
+        sz_engine.delete_record("TEST", f"CACHE-5-{i}")
+    assert 0 < stats["bytes"] <= max_bytes
+    assert stats["entries"] == 3
+    assert stats["evictions"] == 8
+    assert stats["hits"] == 1
+    assert stats["misses"] == 11
+
+
+def test_ttl_seconds() -> None:
+    """Test an entry older than ttl_seconds is not used."""
+    entity_cache = SzEntityCache(ttl_seconds=0.05)
+    sz_engine = SzEngineGrpc(get_grpc_channel(), entity_cache=entity_cache)
+    sz_engine.add_record("TEST", "CACHE-6", "{}", SZ_WITHOUT_INFO)
+    sz_engine.get_entity_by_record_id("TEST", "CACHE-6")
+    time.sleep(0.1)
+    sz_engine.get_entity_by_record_id("TEST", "CACHE-6")
+    stats = entity_cache.stats()
+    sz_engine.delete_record("TEST", "CACHE-6")
+    assert stats["expirations"] == 1
+    assert stats["misses"] == 2
+
+
+# -----------------------------------------------------------------------------
+# Unique testcases
+# -----------------------------------------------------------------------------
+
+
+class Response:  # pylint: disable=R0903
+    """Stands in for a get_entity_* response message."""
+
+    def __init__(self, entity_id: int) -> None:
+        self.result = json.dumps({"RESOLVED_ENTITY": {"ENTITY_ID": entity_id}})
+
+
+def test_read_in_flight_during_invalidation_is_not_cached() -> None:
+    """Test a response read before an invalidation finished is not cached."""
+    entity_cache = SzEntityCache()
+    key = ("entity", 1, 0)
+    _, generation = entity_cache.get(key)
+    entity_cache.invalidate_entities([1])
+    entity_cache.put(key, Response(1), 1, generation)
+    assert entity_cache.get(key)[0] is None
+    _, generation = entity_cache.get(key)
+    entity_cache.put(key, Response(1), 1, generation)
+    assert entity_cache.get(key)[0] is not None
+
+
+def test_clear_and_reset_stats() -> None:
+    """Test SzEntityCache.clear() and SzEntityCache.reset_stats()."""
+    entity_cache = SzEntityCache()
+    _, generation = entity_cache.get(("entity", 1, 0))
+    entity_cache.put(("entity", 1, 0), Response(1), 1, generation)
+    entity_cache.clear()
+    entity_cache.reset_stats()
+    assert entity_cache.stats() == {
+        "hits": 0,
+        "misses": 0,
+        "evictions": 0,
+        "expirations": 0,
+        "invalidations": 0,
+        "entries": 0,
+        "bytes": 0,
+    }
+
+
+def test_constructor_bad_max_bytes() -> None:
+    """Test SzEntityCache constructor with a bad max_bytes."""
+    with pytest.raises(ValueError):
+        SzEntityCache(max_bytes=0)
+
+
+def test_constructor_bad_ttl_seconds() -> None:
+    """Test SzEntityCache constructor with a bad ttl_seconds."""
+    with pytest.raises(ValueError):
+        SzEntityCache(ttl_seconds=0)
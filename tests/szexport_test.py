@@ -0,0 +1,329 @@
+#! /usr/bin/env python3
+
+import gc
+import gzip
+import json
+import math
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Tuple
+
+import pytest
+from senzing import SZ_WITHOUT_INFO, SzSdkError
+from senzing_grpc_protobuf import szengine_pb2, szengine_pb2_grpc
+
+from senzing_grpc import SzEngineGrpc, SzExportIterator, SzExportResult
+from senzing_grpc.szexport import parse_export, write_export, write_resumable_export
+
+from .helpers import get_grpc_channel, in_process_engine
+
+# -----------------------------------------------------------------------------
+# Test cases
+# -----------------------------------------------------------------------------
+
+
+def test_export_json_entity_report_to_file(tmp_path: Path) -> None:
+    """Test SzEngineGrpc.export_json_entity_report_to_file() writes what the iterator yields."""
+    sz_engine = SzEngineGrpc(get_grpc_channel())
+    records = [("TEST", f"EXPORT-{i}", "{}") for i in range(10)]
+    for result in sz_engine.add_records(records, SZ_WITHOUT_INFO):
+        assert result.error is None
+    expected = "".join(sz_engine.export_json_entity_report_iterator())
+    progress: List[SzExportResult] = []
+    plain = sz_engine.export_json_entity_report_to_file(
+        str(tmp_path / "export.jsonl"), buffer_bytes=100, progress=progress.append
+    )
+    compressed = sz_engine.export_json_entity_report_to_file(str(tmp_path / "export.jsonl.gz"), compress=True)
+    for _, record_id, _ in records:
+        sz_engine.delete_record("TEST", record_id)
+    assert (tmp_path / "export.jsonl").read_text(encoding="utf-8") == expected
+    assert gzip.decompress((tmp_path / "export.jsonl.gz").read_bytes()).decode("utf-8") == expected
+    assert plain.lines == compressed.lines == expected.count("\n")
+    assert plain.bytes == compressed.bytes == plain.bytes_written == len(expected.encode("utf-8"))
+    assert 0 < compressed.bytes_written < compressed.bytes
+    assert progress and progress[-1].lines <= plain.lines
+    assert plain.lines_per_second > 0
+    assert sorted(os.listdir(tmp_path)) == ["export.jsonl", "export.jsonl.gz"]
+
+
+def test_export_csv_entity_report_to_file(tmp_path: Path) -> None:
+    """Test SzEngineGrpc.export_csv_entity_report_to_file() writes the header and lines."""
+    sz_engine = SzEngineGrpc(get_grpc_channel())
+    expected = "".join(sz_engine.export_csv_entity_report_iterator("*"))
+    result = sz_engine.export_csv_entity_report_to_file(str(tmp_path / "export.csv"), "*")
+    assert (tmp_path / "export.csv").read_text(encoding="utf-8") == expected
+    assert result.path == str(tmp_path / "export.csv")
+    assert result.lines == expected.count("\n") >= 1
+
+
+def test_export_to_file_bad_buffer_bytes(tmp_path: Path) -> None:
+    """Test SzEngineGrpc.export_json_entity_report_to_file() with a bad buffer_bytes."""
+    sz_engine = SzEngineGrpc(get_grpc_channel())
+    with pytest.raises(SzSdkError):
+        sz_engine.export_json_entity_report_to_file(str(tmp_path / "export.jsonl"), buffer_bytes=0)
+
+
+# -----------------------------------------------------------------------------
+# Unique testcases
+# -----------------------------------------------------------------------------
+
+
+def test_failed_export_keeps_previous_file(tmp_path: Path) -> None:
+    """Test an export failing part way leaves the previous file and no temporary file."""
+    path = tmp_path / "export.jsonl"
+    path.write_text("previous\n", encoding="utf-8")
+
+    def failing() -> Iterator[str]:
+        yield "line\n" * 100
+        raise SzSdkError("stream broken")
+
+    with pytest.raises(SzSdkError):
+        write_export(failing(), str(path), buffer_bytes=10)
+    assert path.read_text(encoding="utf-8") == "previous\n"
+    assert os.listdir(tmp_path) == ["export.jsonl"]
+
+
+def test_batches(tmp_path: Path) -> None:
+    """Test fragments are written in batches of about buffer_bytes."""
+    progress: List[SzExportResult] = []
+    result = write_export((f"{i}\n" for i in range(1000)), str(tmp_path / "numbers"), False, 1000, progress.append)
+    assert result.lines == 1000
+    assert len(progress) == math.ceil(result.bytes / 1000)
+    assert progress[-1] == result._replace(seconds=progress[-1].seconds)
+    assert (tmp_path / "numbers").read_text(encoding="utf-8").split() == [str(i) for i in range(1000)]
+
+
+SETTINGS = {"export": "json", "flags": 0}
+
+
+def entity_lines(count: int, fail_after: int = 0) -> Iterator[str]:
+    for i in range(1, count + 1):
+        if i == fail_after:
+            raise SzSdkError("stream broken")
+        yield entity_line(i)
+
+
+def entity_line(entity_id: int) -> str:
+    return json.dumps({"RESOLVED_ENTITY": {"ENTITY_ID": entity_id}}) + "\n"
+
+
+def interrupted_export(path: Path, compress: bool = False) -> None:
+    with pytest.raises(SzSdkError):
+        write_resumable_export(entity_lines(100, 60), str(path), SETTINGS, compress, 200, None, 0)
+    checkpoint = json.loads(Path(str(path) + ".checkpoint").read_text(encoding="utf-8"))
+    assert checkpoint["lines"] > 0
+
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_resume(tmp_path: Path, compress: bool) -> None:
+    """Test an interrupted resumable export carries on from its checkpoint and ends with the whole export."""
+    path = tmp_path / "export.jsonl"
+    interrupted_export(path, compress)
+    with open(str(path) + ".partial", "ab") as partial_file:
+        partial_file.write(b"written after the checkpoint")
+    result = write_resumable_export(entity_lines(100), str(path), SETTINGS, compress, 200, None, 0)
+    expected = "".join(entity_lines(100))
+    actual = gzip.decompress(path.read_bytes()) if compress else path.read_bytes()
+    assert actual.decode("utf-8") == expected
+    assert 0 < result.resumed_lines < 60
+    assert result.resumed_lines + result.lines == 100
+    assert os.listdir(tmp_path) == ["export.jsonl"]
+
+
+def test_resume_other_settings(tmp_path: Path) -> None:
+    """Test a checkpoint of an export with other settings is not resumed."""
+    path = tmp_path / "export.jsonl"
+    interrupted_export(path)
+    with pytest.raises(SzSdkError):
+        write_resumable_export(entity_lines(100), str(path), {"export": "json", "flags": 1}, False, 200, None, 0)
+
+
+def test_resume_corrupt_partial_file(tmp_path: Path) -> None:
+    """Test a partial file that does not match its checkpoint is not resumed."""
+    path = tmp_path / "export.jsonl"
+    interrupted_export(path)
+    with open(str(path) + ".partial", "r+b") as partial_file:
+        partial_file.write(b"[")
+    with pytest.raises(SzSdkError):
+        write_resumable_export(entity_lines(100), str(path), SETTINGS, False, 200, None, 0)
+
+
+def test_resume_changed_export(tmp_path: Path) -> None:
+    """Test an export whose lines moved since the checkpoint is not spliced."""
+    path = tmp_path / "export.jsonl"
+    interrupted_export(path)
+    changed = (line for line in entity_lines(101) if line != entity_line(1))
+    with pytest.raises(SzSdkError):
+        write_resumable_export(changed, str(path), SETTINGS, False, 200, None, 0)
+
+
+def test_export_json_entity_report_to_file_resumable(tmp_path: Path) -> None:
+    """Test SzEngineGrpc.export_json_entity_report_to_file() with checkpoint_seconds."""
+    sz_engine = SzEngineGrpc(get_grpc_channel())
+    expected = "".join(sz_engine.export_json_entity_report_iterator())
+    path = tmp_path / "export.jsonl"
+    result = sz_engine.export_json_entity_report_to_file(str(path), buffer_bytes=100, checkpoint_seconds=0)
+    assert path.read_text(encoding="utf-8") == expected
+    assert result.resumed_lines == 0
+    assert os.listdir(tmp_path) == ["export.jsonl"]
+
+
+def resolved_entity_id(entity: Dict[str, Any]) -> int:
+    """A transform run in the worker processes."""
+    return int(entity["RESOLVED_ENTITY"]["ENTITY_ID"])
+
+
+def test_export_json_entity_report_parsed() -> None:
+    """Test SzEngineGrpc.export_json_entity_report_parsed() parses and transforms in worker processes."""
+    sz_engine = SzEngineGrpc(get_grpc_channel())
+    expected = [json.loads(line) for line in sz_engine.export_json_entity_report_iterator()]
+    parsed = list(sz_engine.export_json_entity_report_parsed(max_workers=2, batch_lines=3))
+    transformed = list(
+        sz_engine.export_json_entity_report_parsed(transform=resolved_entity_id, max_workers=2, batch_lines=3)
+    )
+    assert parsed == expected
+    assert transformed == [entity["RESOLVED_ENTITY"]["ENTITY_ID"] for entity in expected]
+
+
+def test_export_json_entity_report_parsed_bad_batch_lines() -> None:
+    """Test SzEngineGrpc.export_json_entity_report_parsed() with a bad batch_lines."""
+    sz_engine = SzEngineGrpc(get_grpc_channel())
+    with pytest.raises(SzSdkError):
+        list(sz_engine.export_json_entity_report_parsed(batch_lines=0))
+
+
+def test_parse_export_batches() -> None:
+    """Test fragments holding several lines, or part of a line, are batched on line boundaries."""
+    text = "".join(entity_lines(50))
+    fragments = [text[i : i + 7] for i in range(0, len(text), 7)]
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        ordered = list(parse_export(fragments, resolved_entity_id, executor, 4, True, 3))
+        unordered = list(parse_export(fragments, resolved_entity_id, executor, 4, False, 3))
+    assert ordered == list(range(1, 51))
+    assert sorted(unordered) == ordered
+
+
+def test_parse_export_slow_batch() -> None:
+    """Test an ordered parse reads no more than max_in_flight batches ahead of a slow first batch."""
+    first_batch = threading.Event()
+    read = 0
+
+    def fragments() -> Iterator[str]:
+        nonlocal read
+        for line in entity_lines(1000):
+            read += 1
+            yield line
+
+    def slow_first(entity: Dict[str, Any]) -> int:
+        if entity["RESOLVED_ENTITY"]["ENTITY_ID"] == 1:
+            first_batch.wait(5)
+        return resolved_entity_id(entity)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        parsed = parse_export(fragments(), slow_first, executor, 1, True, 4)
+        threading.Timer(0.2, first_batch.set).start()
+        assert next(parsed) == 1
+        assert read <= 5
+        assert list(parsed) == list(range(2, 1001))
+
+
+def test_parse_export_error() -> None:
+    """Test a line that is not JSON raises from the iterator."""
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        with pytest.raises(ValueError):
+            list(parse_export([entity_line(1), "not JSON\n"], None, executor))
+
+
+# -----------------------------------------------------------------------------
+# Cancellation testcases
+# -----------------------------------------------------------------------------
+
+
+class EndlessExport(szengine_pb2_grpc.SzEngineServicer):  # type: ignore[misc] # pylint: disable=R0903
+    """An export that streams lines until the client goes away."""
+
+    def __init__(self) -> None:
+        self.lines = 0
+        self.stopped = threading.Event()
+
+    def StreamExportJsonEntityReport(self, request: Any, context: Any) -> Iterator[Any]:  # pylint: disable=C0103
+        try:
+            while context.is_active():
+                self.lines += 1
+                yield szengine_pb2.StreamExportJsonEntityReportResponse(  # pylint: disable=E1101
+                    result=entity_line(self.lines)
+                )
+                time.sleep(0.001)
+        finally:
+            self.stopped.set()
+
+
+@pytest.fixture(name="endless_export")
+def fixture_endless_export() -> Iterator[Tuple[SzEngineGrpc, EndlessExport]]:
+    """An SzEngineGrpc connected to an in-process server running EndlessExport."""
+    servicer = EndlessExport()
+    with in_process_engine(servicer) as grpc_channel:
+        yield SzEngineGrpc(grpc_channel), servicer
+
+
+def assert_server_stopped(servicer: EndlessExport) -> None:
+    assert servicer.stopped.wait(5)
+    lines = servicer.lines
+    time.sleep(0.1)
+    assert servicer.lines == lines
+
+
+def close(lines: SzExportIterator) -> None:
+    lines.close()
+
+
+def leave_with_block(lines: SzExportIterator) -> None:
+    with lines:
+        pass
+
+
+def collect(lines: SzExportIterator) -> None:
+    del lines
+    gc.collect()
+
+
+@pytest.mark.parametrize("prefetch_lines", [0, 10])
+@pytest.mark.parametrize("stop", [close, leave_with_block, collect])
+def test_export_iterator_cancels_server(
+    endless_export: Tuple[SzEngineGrpc, EndlessExport], stop: Callable[[SzExportIterator], None], prefetch_lines: int
+) -> None:
+    """Test closing, leaving or dropping an export iterator part way stops the server exporting."""
+    sz_engine, servicer = endless_export
+    lines = sz_engine.export_json_entity_report_iterator(prefetch_lines=prefetch_lines)
+    assert [next(lines) for _ in range(3)] == [entity_line(i) for i in (1, 2, 3)]
+    stop(lines)
+    del lines
+    assert_server_stopped(servicer)
+
+
+def test_export_iterator_break(endless_export: Tuple[SzEngineGrpc, EndlessExport]) -> None:
+    """Test breaking out of a loop over an export iterator in a with block, then iterating it again."""
+    sz_engine, servicer = endless_export
+    with sz_engine.export_json_entity_report_iterator() as lines:
+        for line in lines:
+            if line == entity_line(3):
+                break
+    assert_server_stopped(servicer)
+    assert not list(lines)
+
+
+def test_export_to_file_error_cancels_server(
+    endless_export: Tuple[SzEngineGrpc, EndlessExport], tmp_path: Path
+) -> None:
+    """Test an export to file failing part way stops the server exporting."""
+    sz_engine, servicer = endless_export
+
+    def fail(_: SzExportResult) -> None:
+        raise OSError("disk full")
+
+    with pytest.raises(OSError):
+        sz_engine.export_json_entity_report_to_file(str(tmp_path / "export.jsonl"), buffer_bytes=100, progress=fail)
+    assert_server_stopped(servicer)
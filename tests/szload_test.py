@@ -0,0 +1,275 @@
+#! /usr/bin/env python3
+
+import gzip
+import io
+import json
+import os
+import random
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Tuple
+
+import grpc
+import pytest
+from senzing import SzSdkError
+from senzing_grpc_protobuf import szengine_pb2, szengine_pb2_grpc
+
+from senzing_grpc import SzEngineGrpc
+from senzing_grpc.szload import LoadCheckpoint, load_files, main, read_records
+
+from .helpers import in_process_engine_target
+
+# pylint: disable=E1101
+
+# -----------------------------------------------------------------------------
+# In-process engine
+# -----------------------------------------------------------------------------
+
+
+class Records(szengine_pb2_grpc.SzEngineServicer):  # type: ignore[misc] # pylint: disable=R0903
+    """Keeps the records added, failing those whose RECORD_ID starts with BAD and delaying some."""
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.records: Dict[Tuple[str, str], str] = {}
+        self.calls: "Counter[str]" = Counter()
+        self.max_delay = 0.0
+
+    def AddRecord(self, request: Any, context: Any) -> Any:  # pylint: disable=C0103
+        time.sleep(random.uniform(0, self.max_delay))
+        with self.lock:
+            self.calls[request.record_id] += 1
+        if request.record_id.startswith("BAD"):
+            context.abort(grpc.StatusCode.UNKNOWN, json.dumps({"reason": "SENZ0023|Conflicting DATA_SOURCE values"}))
+        with self.lock:
+            self.records[(request.data_source_code, request.record_id)] = request.record_definition
+        return szengine_pb2.AddRecordResponse(result="")
+
+
+@pytest.fixture(name="records")
+def fixture_records() -> Iterator[Tuple[SzEngineGrpc, Records, str]]:
+    """An SzEngineGrpc connected to an in-process server running Records, and the server's address."""
+    servicer = Records()
+    with in_process_engine_target(servicer) as target:
+        with grpc.insecure_channel(target) as grpc_channel:
+            yield SzEngineGrpc(grpc_channel), servicer, target
+
+
+def record_line(record_id: str, data_source: str = "TEST") -> str:
+    return json.dumps({"DATA_SOURCE": data_source, "RECORD_ID": record_id, "NAME_FULL": f"Name {record_id}"}) + "\n"
+
+
+# -----------------------------------------------------------------------------
+# Test cases
+# -----------------------------------------------------------------------------
+
+
+def test_load_files(records: Tuple[SzEngineGrpc, Records, str], tmp_path: Path) -> None:
+    """Test JSON Lines, gzip-compressed JSON Lines and CSV files load through one pipeline."""
+    sz_engine, servicer, _ = records
+    (tmp_path / "a.jsonl").write_text("".join(record_line(f"A-{i}") for i in range(50)), encoding="utf-8")
+    (tmp_path / "b.data").write_bytes(gzip.compress("".join(record_line(f"B-{i}") for i in range(50)).encode()))
+    csv_text = "ID,JSON\n" + "".join(
+        f'{i},"{record_line(f"C-{i}").strip().replace(chr(34), 2 * chr(34))}"\n' for i in range(50)
+    )
+    (tmp_path / "c.csv").write_text(csv_text, encoding="utf-8")
+    output = io.StringIO()
+    stats = load_files(
+        sz_engine,
+        [str(tmp_path / name) for name in ("a.jsonl", "b.data", "c.csv")],
+        max_in_flight=8,
+        progress_seconds=0,
+        output=output,
+    )
+    assert stats.loaded == 150
+    assert stats.error_count() == 0
+    assert len(servicer.records) == 150
+    assert servicer.records[("TEST", "C-7")] == record_line("C-7").strip()
+    assert "records/s, latency p50" in output.getvalue()
+
+
+def test_load_files_errors(records: Tuple[SzEngineGrpc, Records, str], tmp_path: Path) -> None:
+    """Test records that cannot be read or fail to load are reported with their line and counted."""
+    sz_engine, servicer, _ = records
+    lines = [record_line("GOOD-1"), "\n", "not JSON\n", '{"RECORD_ID": "NO-SOURCE"}\n', record_line("BAD-1")]
+    (tmp_path / "mixed.jsonl").write_text("".join(lines), encoding="utf-8")
+    output = io.StringIO()
+    stats = load_files(sz_engine, [str(tmp_path / "mixed.jsonl")], output=output)
+    assert list(servicer.records) == [("TEST", "GOOD-1")]
+    assert stats.loaded == 1
+    assert stats.errors == {"input": 2, "SzBadInputError": 1}
+    reported = output.getvalue()
+    assert "mixed.jsonl:3: not JSON" in reported
+    assert "mixed.jsonl:4: no DATA_SOURCE" in reported
+    assert "mixed.jsonl:5: SzBadInputError: " in reported
+    assert "errors 3 (input 2, SzBadInputError 1)" in stats.summary()
+
+
+def test_read_records_jsonl(tmp_path: Path) -> None:
+    """Test the line numbers, offsets and keys of JSON Lines records and the default data source."""
+    text = record_line("1") + "\n" + '{"RECORD_ID": 2}\n'
+    (tmp_path / "records.jsonl").write_text(text, encoding="utf-8")
+    actual = list(read_records(str(tmp_path / "records.jsonl"), data_source_code="DEFAULT"))
+    assert [(record.line, record.offset) for record in actual] == [(1, len(record_line("1"))), (3, len(text))]
+    assert [(record.data_source_code, record.record_id, record.error) for record in actual] == [
+        ("TEST", "1", None),
+        ("DEFAULT", "2", None),
+    ]
+
+
+def test_read_records_csv(tmp_path: Path) -> None:
+    """Test CSV records whose JSON spans lines, with a DATA_SOURCE column, and a file without the JSON column."""
+    record = json.dumps({"RECORD_ID": "1", "ADDR_FULL": "1 Main St"}, indent=2).replace('"', '""')
+    (tmp_path / "records.csv").write_text(f'DATA_SOURCE,RECORD\nCSV,"{record}"\nCSV,"{{""RECORD_ID"": ""2""}}"\n')
+    actual = list(read_records(str(tmp_path / "records.csv"), json_column="RECORD"))
+    assert [(record.line, record.data_source_code, record.record_id, record.error) for record in actual] == [
+        (2, "CSV", "1", None),
+        (6, "CSV", "2", None),
+    ]
+    assert actual[-1].offset == (tmp_path / "records.csv").stat().st_size
+    (missing,) = read_records(str(tmp_path / "records.csv"), "csv")
+    assert str(missing.error) == "no JSON column"
+
+
+def test_read_records_bad_format() -> None:
+    """Test read_records() with a bad input_format."""
+    with pytest.raises(ValueError):
+        list(read_records("records.xml", "xml"))
+
+
+def test_read_records_streams(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test records are read from standard input as they arrive, not after the whole input."""
+    read_fd, write_fd = os.pipe()
+    with os.fdopen(read_fd, "rb") as read_file, os.fdopen(write_fd, "wb") as write_file:
+        monkeypatch.setattr("sys.stdin", io.TextIOWrapper(read_file))
+        write_file.write(record_line("FIRST").encode())
+        write_file.flush()
+        read: List[str] = []
+        reader = threading.Thread(target=lambda: read.append(next(read_records("-")).record_id), daemon=True)
+        reader.start()
+        reader.join(5)
+        assert read == ["FIRST"]
+
+
+def test_main(records: Tuple[SzEngineGrpc, Records, str], monkeypatch: pytest.MonkeyPatch, capsys: Any) -> None:
+    """Test python -m senzing_grpc load reads standard input and exits 1 if a record failed."""
+    _, servicer, target = records
+    data = gzip.compress(("".join(record_line(f"{i}") for i in range(20)) + record_line("BAD")).encode())
+    monkeypatch.setattr("sys.stdin", io.TextIOWrapper(io.BufferedReader(io.BytesIO(data))))
+    assert main(["load", "--target", target, "--channels", "2", "--max-in-flight", "4"]) == 1
+    assert len(servicer.records) == 20
+    assert "loaded 20 in" in capsys.readouterr().err
+
+
+# -----------------------------------------------------------------------------
+# Checkpoint testcases
+# -----------------------------------------------------------------------------
+
+
+class Crash(Exception):
+    """Stands in for the loader being killed."""
+
+
+class CrashingOutput(io.StringIO):
+    """Progress output that crashes the load at the crash_at'th progress report."""
+
+    def __init__(self, crash_at: int) -> None:
+        super().__init__()
+        self.reports = 0
+        self.crash_at = crash_at
+
+    def write(self, text: str) -> int:
+        if "records/s" in text:
+            self.reports += 1
+            if self.reports == self.crash_at:
+                raise Crash()
+        return super().write(text)
+
+
+def write_input(path: Path, kind: str, count: int) -> None:
+    lines = [record_line(f"{path.stem}-{i}") for i in range(count)]
+    if kind == "csv":
+        escaped = (json.dumps(json.loads(line), indent=1).replace('"', '""') for line in lines)
+        path.write_text("DATA_SOURCE,JSON\n" + "".join(f'TEST,"{record}"\n' for record in escaped))
+    elif kind == "gzip":
+        path.write_bytes(gzip.compress("".join(lines).encode()))
+    else:
+        path.write_text("".join(lines))
+
+
+@pytest.mark.parametrize("kind", ["jsonl", "gzip", "csv"])
+def test_resume(records: Tuple[SzEngineGrpc, Records, str], tmp_path: Path, kind: str) -> None:
+    """Test a load killed part way resumes from its checkpoint, sending only the records not completed before."""
+    sz_engine, servicer, _ = records
+    servicer.max_delay = 0.005
+    paths = [str(tmp_path / f"first.{kind}"), str(tmp_path / f"second.{kind}")]
+    write_input(Path(paths[0]), kind, 20)
+    write_input(Path(paths[1]), kind, 100)
+    checkpoint_path = str(tmp_path / "load.checkpoint")
+    arguments: Dict[str, Any] = {"input_format": "csv" if kind == "csv" else "jsonl", "max_in_flight": 8}
+    arguments.update(progress_seconds=0, checkpoint_path=checkpoint_path, checkpoint_seconds=0)
+    with pytest.raises(Crash):
+        load_files(sz_engine, paths, output=CrashingOutput(60), **arguments)
+    checkpoint = json.loads(Path(checkpoint_path).read_text(encoding="utf-8"))
+    first, second = (checkpoint["files"][path] for path in paths)
+    assert first["complete"] and not second["complete"]
+    committed = sum(
+        1 for record in read_records(paths[1], arguments["input_format"]) if record.offset <= second["offset"]
+    )
+    assert 0 < committed < 100
+
+    output = io.StringIO()
+    stats = load_files(sz_engine, paths, output=output, **arguments)
+    assert f"{paths[0]}: already loaded" in output.getvalue()
+    assert f"{paths[1]}: resuming after line {second['line']}" in output.getvalue()
+    assert stats.loaded == 100 - committed
+    assert len(servicer.records) == 120
+    assert all(servicer.calls[f"second-{i}"] == 1 for i in range(committed))
+    assert not os.path.exists(checkpoint_path)
+
+
+def test_resume_changed_file(records: Tuple[SzEngineGrpc, Records, str], tmp_path: Path) -> None:
+    """Test a file whose size changed since its checkpoint, or other settings, are not resumed."""
+    sz_engine, _, _ = records
+    path = tmp_path / "records.jsonl"
+    write_input(path, "jsonl", 50)
+    checkpoint_path = str(tmp_path / "load.checkpoint")
+    with pytest.raises(Crash):
+        load_files(
+            sz_engine, [str(path)], output=CrashingOutput(10), progress_seconds=0, checkpoint_path=checkpoint_path
+        )
+    with pytest.raises(SzSdkError):
+        load_files(sz_engine, [str(path)], data_source_code="OTHER", checkpoint_path=checkpoint_path)
+    write_input(path, "jsonl", 60)
+    with pytest.raises(SzSdkError):
+        load_files(sz_engine, [str(path)], checkpoint_path=checkpoint_path)
+
+
+def test_checkpoint_standard_input(records: Tuple[SzEngineGrpc, Records, str], tmp_path: Path) -> None:
+    """Test standard input cannot be checkpointed."""
+    sz_engine, _, target = records
+    with pytest.raises(SzSdkError):
+        load_files(sz_engine, ["-"], checkpoint_path=str(tmp_path / "load.checkpoint"))
+    with pytest.raises(SystemExit):
+        main(["load", "--target", target, "--checkpoint", str(tmp_path / "load.checkpoint")])
+
+
+def test_load_checkpoint_out_of_order(tmp_path: Path) -> None:
+    """Test the checkpoint only advances over an unbroken run of completed records."""
+    path = tmp_path / "records.jsonl"
+    write_input(path, "jsonl", 3)
+    checkpoint = LoadCheckpoint(str(tmp_path / "load.checkpoint"), [str(path)], {})
+    tickets = [checkpoint.read(record) for record in read_records(str(path))]
+    progress = checkpoint.files[str(path)]
+    checkpoint.completed(str(path), tickets[1])
+    assert progress["line"] == progress["offset"] == 0
+    checkpoint.completed(str(path), tickets[0])
+    assert progress["line"] == 2
+    assert progress["offset"] == 2 * len(record_line("records-0"))
+    checkpoint.read_all(str(path))
+    assert not checkpoint.complete()
+    checkpoint.completed(str(path), tickets[2])
+    assert checkpoint.complete()
+    assert progress["offset"] == path.stat().st_size
@@ -0,0 +1,34 @@
+import asyncio
+import json
+
+from senzing_grpc import SzProductGrpcAsync
+
+from .helpers import get_grpc_channel_async
+
+# -----------------------------------------------------------------------------
+# Test cases
+# -----------------------------------------------------------------------------
+
+
+def test_get_license() -> None:
+    """Test SzProductGrpcAsync.get_license()."""
+
+    async def run() -> str:
+        async with get_grpc_channel_async() as grpc_channel:
+            sz_product = SzProductGrpcAsync(grpc_channel)
+            return await sz_product.get_license()
+
+    actual = asyncio.run(run())
+    assert isinstance(json.loads(actual), dict)
+
+
+def test_get_version() -> None:
+    """Test SzProductGrpcAsync.get_version()."""
+
+    async def run() -> str:
+        async with get_grpc_channel_async() as grpc_channel:
+            async with SzProductGrpcAsync(grpc_channel) as sz_product:
+                return await sz_product.get_version()
+
+    actual = asyncio.run(run())
+    assert isinstance(json.loads(actual), dict)
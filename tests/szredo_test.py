@@ -0,0 +1,324 @@
+#! /usr/bin/env python3
+
+import json
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Iterator, List, Tuple
+
+import grpc
+import pytest
+from senzing import SzEngineFlags, SzError
+from senzing_grpc_protobuf import szengine_pb2, szengine_pb2_grpc
+
+from senzing_grpc import SzEngineGrpc, SzRedoProcessor
+from senzing_grpc.szredo import redo_keys
+
+from .helpers import in_process_engine
+
+# pylint: disable=E1101
+
+# -----------------------------------------------------------------------------
+# In-process redo queue
+# -----------------------------------------------------------------------------
+
+
+class RedoQueue(szengine_pb2_grpc.SzEngineServicer):  # type: ignore[misc] # pylint: disable=R0902
+    """A redo queue whose records are processed after a delay, tracking how many are processed at once."""
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.redo_records: Deque[str] = deque()
+        self.processed: List[str] = []
+        self.delay = 0.0
+        self.fetch_delay = 0.0
+        self.follow_ups = 0
+        self.running = 0
+        self.most_running = 0
+        self.overlapped_fetches = 0
+
+    def add(self, count: int, prefix: str = "REDO") -> None:
+        with self.lock:
+            self.redo_records.extend(redo_record(f"{prefix}-{i}") for i in range(count))
+
+    def extend(self, redo_records: List[str]) -> None:
+        with self.lock:
+            self.redo_records.extend(redo_records)
+
+    def CountRedoRecords(self, request: Any, context: Any) -> Any:  # pylint: disable=C0103,W0613
+        with self.lock:
+            return szengine_pb2.CountRedoRecordsResponse(result=len(self.redo_records))
+
+    def GetRedoRecord(self, request: Any, context: Any) -> Any:  # pylint: disable=C0103,W0613
+        time.sleep(self.fetch_delay)
+        with self.lock:
+            self.overlapped_fetches += 1 if self.running else 0
+            result = self.redo_records.popleft() if self.redo_records else ""
+        return szengine_pb2.GetRedoRecordResponse(result=result)
+
+    def ProcessRedoRecord(self, request: Any, context: Any) -> Any:  # pylint: disable=C0103
+        with self.lock:
+            self.running += 1
+            self.most_running = max(self.most_running, self.running)
+        try:
+            time.sleep(self.delay)
+            record_id = json.loads(request.redo_record)["RECORD_ID"]
+            if record_id.startswith("BAD"):
+                context.abort(grpc.StatusCode.UNKNOWN, json.dumps({"reason": "SENZ0002|Invalid redo record"}))
+            with self.lock:
+                self.processed.append(record_id)
+                if self.follow_ups:
+                    self.follow_ups -= 1
+                    self.redo_records.append(redo_record(f"FOLLOW-UP-{self.follow_ups}"))
+            result = json.dumps({"RECORD_ID": record_id}) if request.flags & SzEngineFlags.SZ_WITH_INFO else ""
+            return szengine_pb2.ProcessRedoRecordResponse(result=result)
+        finally:
+            with self.lock:
+                self.running -= 1
+
+
+def redo_record(record_id: str, **kwargs: Any) -> str:
+    return json.dumps({"REASON": "test", "DATA_SOURCE": "TEST", "RECORD_ID": record_id, **kwargs})
+
+
+@pytest.fixture(name="redo_queue")
+def fixture_redo_queue() -> Iterator[Tuple[SzEngineGrpc, RedoQueue]]:
+    """An SzEngineGrpc connected to an in-process server running RedoQueue."""
+    servicer = RedoQueue()
+    with in_process_engine(servicer, max_workers=16) as grpc_channel:
+        yield SzEngineGrpc(grpc_channel), servicer
+
+
+# -----------------------------------------------------------------------------
+# Test cases
+# -----------------------------------------------------------------------------
+
+
+def test_run(redo_queue: Tuple[SzEngineGrpc, RedoQueue]) -> None:
+    """Test every redo record is processed once and its WITH_INFO response passed to on_info."""
+    sz_engine, servicer = redo_queue
+    servicer.add(100)
+    infos: List[str] = []
+    stats = SzRedoProcessor(sz_engine, max_workers=4, records_per_worker=10, on_info=infos.append).run()
+    assert sorted(servicer.processed) == sorted(f"REDO-{i}" for i in range(100))
+    assert sorted(json.loads(info)["RECORD_ID"] for info in infos) == sorted(servicer.processed)
+    assert stats["processed"] == 100
+    assert stats["errors"] == 0
+    assert stats["workers"] == 0
+    assert stats["processed_per_second"] > 0
+
+
+def test_run_without_info(redo_queue: Tuple[SzEngineGrpc, RedoQueue]) -> None:
+    """Test records are processed without WITH_INFO when there is no on_info."""
+    sz_engine, servicer = redo_queue
+    servicer.add(10)
+    sz_redo_processor = SzRedoProcessor(sz_engine, flags=0)
+    assert sz_redo_processor.run()["processed"] == 10
+    assert not sz_redo_processor.flags & SzEngineFlags.SZ_WITH_INFO
+
+
+def test_run_empty(redo_queue: Tuple[SzEngineGrpc, RedoQueue]) -> None:
+    """Test an empty queue returns at once without starting a worker."""
+    sz_engine, _ = redo_queue
+    stats = SzRedoProcessor(sz_engine).run()
+    assert stats["processed"] == stats["scaled_up"] == 0
+    assert stats["polls"] == 1
+
+
+def test_run_follow_ups(redo_queue: Tuple[SzEngineGrpc, RedoQueue]) -> None:
+    """Test redo records created while processing are processed before run returns."""
+    sz_engine, servicer = redo_queue
+    servicer.add(20)
+    servicer.follow_ups = 30
+    assert SzRedoProcessor(sz_engine, max_workers=3, records_per_worker=5).run()["processed"] == 50
+    assert not servicer.redo_records
+
+
+def test_scaling(redo_queue: Tuple[SzEngineGrpc, RedoQueue]) -> None:
+    """Test workers are added for a backlog, up to max_workers, and retired as it shrinks."""
+    sz_engine, servicer = redo_queue
+    servicer.add(200)
+    servicer.delay = 0.01
+    stats = SzRedoProcessor(sz_engine, max_workers=4, records_per_worker=20, poll_seconds=0.05).run()
+    assert stats["processed"] == 200
+    assert 1 < servicer.most_running <= 4
+    assert stats["scaled_up"] >= 1
+    assert stats["scaled_down"] >= 1
+    assert stats["backlog_trend"] < 0
+
+
+def test_errors(redo_queue: Tuple[SzEngineGrpc, RedoQueue]) -> None:
+    """Test a failing redo record is counted and passed to on_error without stopping the others."""
+    sz_engine, servicer = redo_queue
+    servicer.add(10)
+    servicer.add(3, "BAD")
+    failed: List[Tuple[str, Exception]] = []
+    stats = SzRedoProcessor(sz_engine, max_workers=2, on_error=lambda *failure: failed.append(failure)).run()
+    assert stats["processed"] == 10
+    assert stats["errors"] == 3
+    assert sorted(json.loads(record)["RECORD_ID"] for record, _ in failed) == ["BAD-0", "BAD-1", "BAD-2"]
+    assert all(isinstance(err, SzError) for _, err in failed)
+
+
+def test_raising_callbacks(redo_queue: Tuple[SzEngineGrpc, RedoQueue]) -> None:
+    """Test exceptions from on_info and on_error are counted as errors and no fetched record is dropped."""
+    sz_engine, servicer = redo_queue
+    servicer.add(20)
+    servicer.add(2, "BAD")
+    failed: List[str] = []
+
+    def on_info(info: str) -> None:
+        raise RuntimeError(info)
+
+    def on_error(record: str, err: Exception) -> None:
+        failed.append(record)
+        raise RuntimeError(err)
+
+    stats = SzRedoProcessor(sz_engine, max_workers=1, lookahead=2, on_info=on_info, on_error=on_error).run()
+    assert sorted(servicer.processed) == sorted(f"REDO-{i}" for i in range(20))
+    assert not servicer.redo_records
+    assert stats["processed"] == 20
+    assert stats["errors"] == 22
+    assert len(failed) == 22
+
+
+def test_lookahead(redo_queue: Tuple[SzEngineGrpc, RedoQueue]) -> None:
+    """Test a worker fetches the next records while it processes one, unless lookahead is 0."""
+    sz_engine, servicer = redo_queue
+    servicer.delay = servicer.fetch_delay = 0.01
+    seconds = {}
+    for lookahead in (0, 2):
+        servicer.add(30, f"LOOKAHEAD-{lookahead}")
+        servicer.overlapped_fetches = 0
+        stats = SzRedoProcessor(sz_engine, max_workers=1, lookahead=lookahead).run()
+        assert stats["processed"] == 30
+        assert (servicer.overlapped_fetches > 0) == (lookahead > 0)
+        seconds[lookahead] = 30 / stats["processed_per_second"]
+    assert seconds[2] < 0.8 * seconds[0]
+
+
+@pytest.mark.parametrize("lookahead", [0, 5])
+def test_stop(redo_queue: Tuple[SzEngineGrpc, RedoQueue], lookahead: int) -> None:
+    """Test stop() from another thread returns run() once the fetched records are processed, losing none."""
+    sz_engine, servicer = redo_queue
+    servicer.add(10000)
+    servicer.delay = 0.001
+    sz_redo_processor = SzRedoProcessor(sz_engine, max_workers=4, records_per_worker=10, lookahead=lookahead)
+    threading.Timer(0.2, sz_redo_processor.stop).start()
+    stats = sz_redo_processor.run()
+    assert 0 < stats["processed"] < 10000
+    assert stats["processed"] + len(servicer.redo_records) == 10000
+    assert stats["workers"] == 0
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"max_workers": 0},
+        {"min_workers": 3, "max_workers": 2},
+        {"records_per_worker": 0},
+        {"lookahead": -1},
+        {"poll_seconds": 0},
+        {"dedupe_window": -1},
+    ],
+)
+def test_bad_arguments(redo_queue: Tuple[SzEngineGrpc, RedoQueue], kwargs: Any) -> None:
+    """Test SzRedoProcessor() with bad arguments."""
+    sz_engine, _ = redo_queue
+    with pytest.raises(ValueError):
+        SzRedoProcessor(sz_engine, **kwargs)
+
+
+# -----------------------------------------------------------------------------
+# Deduplication testcases
+# -----------------------------------------------------------------------------
+
+
+def test_dedupe(redo_queue: Tuple[SzEngineGrpc, RedoQueue]) -> None:
+    """Test redo records identical to a recent one, whatever their key order, are skipped and counted."""
+    sz_engine, servicer = redo_queue
+    servicer.delay = 0.001
+    same = {"REASON": "test", "DATA_SOURCE": "TEST", "RECORD_ID": "SAME"}
+    servicer.extend([json.dumps(same), json.dumps(dict(reversed(same.items())), indent=2), json.dumps(same)])
+    servicer.add(5)
+    stats = SzRedoProcessor(sz_engine, max_workers=1, lookahead=0, dedupe_window=10).run()
+    assert servicer.processed == ["SAME"] + [f"REDO-{i}" for i in range(5)]
+    assert stats["duplicates"] == 2
+    assert stats["collapsed"] == 0
+    assert stats["saved_seconds"] > 0
+    assert stats["process_seconds"] > 0
+
+
+def test_dedupe_off(redo_queue: Tuple[SzEngineGrpc, RedoQueue]) -> None:
+    """Test every redo record is processed without a dedupe_window."""
+    sz_engine, servicer = redo_queue
+    servicer.extend([redo_record("SAME")] * 3)
+    stats = SzRedoProcessor(sz_engine).run()
+    assert servicer.processed == ["SAME"] * 3
+    assert stats["duplicates"] == stats["saved_seconds"] == 0
+
+
+def test_dedupe_window(redo_queue: Tuple[SzEngineGrpc, RedoQueue]) -> None:
+    """Test only the dedupe_window most recent redo records are remembered."""
+    sz_engine, servicer = redo_queue
+    servicer.extend([redo_record("A"), redo_record("B"), redo_record("A"), redo_record("A")])
+    stats = SzRedoProcessor(sz_engine, max_workers=1, lookahead=0, dedupe_window=1).run()
+    assert servicer.processed == ["A", "B", "A"]
+    assert stats["duplicates"] == 1
+
+
+@pytest.mark.parametrize("dedupe_by_entity", [False, True])
+def test_dedupe_by_entity(redo_queue: Tuple[SzEngineGrpc, RedoQueue], dedupe_by_entity: bool) -> None:
+    """Test redo records targeting a recent record's entity are collapsed only with dedupe_by_entity."""
+    sz_engine, servicer = redo_queue
+    umf_proc = {"UMF_PROC": {"NAME": "REPAIR_ENTITY", "PARAMS": [{"PARAM": {"NAME": "ENTITY_ID", "VALUE": 7}}]}}
+    servicer.extend(
+        [
+            redo_record("FIRST", ENTITY_ID=7),
+            redo_record("SECOND", ENTITY_ID=7),
+            redo_record("UMF_PROC", **umf_proc),
+            redo_record("OTHER", ENTITY_ID=8),
+        ]
+    )
+    stats = SzRedoProcessor(
+        sz_engine, max_workers=1, lookahead=0, dedupe_window=10, dedupe_by_entity=dedupe_by_entity
+    ).run()
+    if dedupe_by_entity:
+        assert servicer.processed == ["FIRST", "OTHER"]
+        assert stats["collapsed"] == 2
+    else:
+        assert servicer.processed == ["FIRST", "SECOND", "UMF_PROC", "OTHER"]
+        assert stats["collapsed"] == 0
+
+
+def test_redo_keys() -> None:
+    """Test the keys of canonical, non-JSON and entity-targeting redo records."""
+    assert redo_keys('{"A": 1, "B": 2}', False) == redo_keys('{ "B": 2,\n"A": 1 }', False)
+    assert redo_keys('{"A": 1}', False) != redo_keys('{"A": 2}', False)
+    assert list(redo_keys("not JSON", True)) == ["duplicates"]
+    assert redo_keys('{"ENTITY_ID": 7}', True)["collapsed"] == "7"
+    assert "collapsed" not in redo_keys('{"ENTITY_ID": 7}', False)
+
+
+@pytest.mark.parametrize(
+    "redo",
+    [
+        '{"UMF_PROC": "x"}',
+        '{"UMF_PROC": {"PARAMS": null}}',
+        '{"UMF_PROC": {"PARAMS": ["x", {"PARAM": 1}, {"PARAM": {"NAME": "OTHER"}}]}}',
+        "[1, 2]",
+    ],
+)
+def test_redo_keys_unexpected_shape(redo: str) -> None:
+    """Test a redo record of an unexpected shape targets no entity."""
+    assert "collapsed" not in redo_keys(redo, True)
+
+
+def test_unexpected_shape_with_dedupe(redo_queue: Tuple[SzEngineGrpc, RedoQueue]) -> None:
+    """Test redo records of unexpected shapes are processed when deduplicating by entity."""
+    sz_engine, servicer = redo_queue
+    servicer.extend([redo_record("ODD-1", UMF_PROC="x"), redo_record("ODD-2", UMF_PROC={"PARAMS": None})])
+    servicer.add(5)
+    stats = SzRedoProcessor(sz_engine, max_workers=1, lookahead=2, dedupe_window=10, dedupe_by_entity=True).run()
+    assert sorted(servicer.processed) == sorted(["ODD-1", "ODD-2"] + [f"REDO-{i}" for i in range(5)])
+    assert stats["errors"] == 0
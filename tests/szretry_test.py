@@ -0,0 +1,202 @@
+#! /usr/bin/env python3
+
+import json
+import threading
+import time
+from typing import Any, Callable, List, Optional
+
+import grpc
+import pytest
+from senzing import SzNotFoundError
+
+from senzing_grpc import SzAbstractFactoryGrpc, SzEngineGrpc, SzRetryPolicy
+from senzing_grpc.szretry import RetryingCall
+
+from .helpers import get_grpc_channel, get_grpc_channel_pool, get_grpc_target
+
+UNAVAILABLE_TARGET = "localhost:1"
+
+# -----------------------------------------------------------------------------
+# Test cases
+# -----------------------------------------------------------------------------
+
+
+def test_retry_until_max_attempts() -> None:
+    """Test an idempotent call failing with UNAVAILABLE is attempted max_attempts times."""
+    retry_policy = SzRetryPolicy(max_attempts=3, initial_backoff=0.01)
+    sz_engine = SzEngineGrpc(grpc.insecure_channel(UNAVAILABLE_TARGET), retry_policy=retry_policy)
+    with pytest.raises(grpc.RpcError):
+        sz_engine.get_active_config_id()
+    stats = retry_policy.stats()
+    assert stats["calls"] == 1
+    assert stats["retries"] == 2
+    assert stats["gave_up_max_attempts"] == 1
+    assert stats["retries_by_method"] == {"/szengine.SzEngine/GetActiveConfigId": 2}
+
+
+def test_retry_succeeds_on_other_server() -> None:
+    """Test a retry after UNAVAILABLE is routed to a server that is available."""
+    retry_policy = SzRetryPolicy(initial_backoff=0.01)
+    with get_grpc_channel_pool(size=1, target=[UNAVAILABLE_TARGET, get_grpc_target()]) as grpc_channel:
+        sz_engine = SzAbstractFactoryGrpc(grpc_channel, retry_policy=retry_policy).create_engine()
+        actual = [sz_engine.get_active_config_id() for _ in range(4)]
+    stats = retry_policy.stats()
+    assert all(config_id > 0 for config_id in actual)
+    assert stats["calls"] == 4
+    assert stats["retries"] == 1
+    assert stats["retried_calls_succeeded"] == 1
+
+
+def test_retry_future() -> None:
+    """Test retries of a call started with .future() happen without blocking the caller."""
+    retry_policy = SzRetryPolicy(max_attempts=3, initial_backoff=0.2, multiplier=1.0)
+    sz_engine = SzEngineGrpc(grpc.insecure_channel(UNAVAILABLE_TARGET), retry_policy=retry_policy)
+    start = time.monotonic()
+    future = sz_engine.futures.get_active_config_id()
+    started_in = time.monotonic() - start
+    with pytest.raises(grpc.RpcError):
+        future.result(timeout=10)
+    assert started_in < 0.2
+    assert retry_policy.stats()["retries"] == 2
+
+
+def test_retry_future_cancel() -> None:
+    """Test cancelling a call waiting to be retried."""
+    retry_policy = SzRetryPolicy(max_attempts=3, initial_backoff=10.0, multiplier=1.0)
+    sz_engine = SzEngineGrpc(grpc.insecure_channel(UNAVAILABLE_TARGET), retry_policy=retry_policy)
+    future = sz_engine.futures.get_active_config_id()
+    deadline = time.monotonic() + 5.0
+    while retry_policy.stats()["retries"] == 0 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert future.cancel()
+    assert future.cancelled()
+    assert retry_policy.stats()["retries"] == 1
+
+
+def test_no_retry_for_non_idempotent_method() -> None:
+    """Test a call that is not idempotent is not retried after UNAVAILABLE."""
+    retry_policy = SzRetryPolicy(initial_backoff=0.01)
+    sz_engine = SzEngineGrpc(grpc.insecure_channel(UNAVAILABLE_TARGET), retry_policy=retry_policy)
+    with pytest.raises(grpc.RpcError):
+        sz_engine.get_redo_record()
+    assert retry_policy.stats()["retries"] == 0
+
+
+def test_no_retry_for_bad_input() -> None:
+    """Test a Senzing error that is not retryable is raised at once."""
+    retry_policy = SzRetryPolicy(initial_backoff=0.01)
+    sz_engine = SzEngineGrpc(get_grpc_channel(), retry_policy=retry_policy)
+    with pytest.raises(SzNotFoundError):
+        sz_engine.get_entity_by_record_id("TEST", "RETRY-DOES-NOT-EXIST")
+    stats = retry_policy.stats()
+    assert stats["calls"] == 1
+    assert stats["retries"] == 0
+
+
+def test_retry_budget() -> None:
+    """Test retries stop when the retry budget is spent."""
+    retry_policy = SzRetryPolicy(max_attempts=5, initial_backoff=0.01, budget_max=2.0, budget_ratio=0.0)
+    sz_engine = SzEngineGrpc(grpc.insecure_channel(UNAVAILABLE_TARGET), retry_policy=retry_policy)
+    with pytest.raises(grpc.RpcError):
+        sz_engine.get_active_config_id()
+    stats = retry_policy.stats()
+    assert stats["retries"] == 2
+    assert stats["gave_up_budget"] == 1
+    assert stats["budget"] < 1.0
+
+
+# -----------------------------------------------------------------------------
+# Unique testcases
+# -----------------------------------------------------------------------------
+
+
+class FinishedCall(grpc.RpcError):  # type: ignore[misc]
+    """Stands in for a finished gRPC call."""
+
+    def __init__(self, code: grpc.StatusCode, details: Optional[str] = None) -> None:
+        super().__init__()
+        self.status_code = code
+        self.status_details = details
+
+    def code(self) -> grpc.StatusCode:
+        return self.status_code
+
+    def details(self) -> Optional[str]:
+        return self.status_details
+
+
+class PendingCall:
+    """Stands in for a gRPC call that finishes when cancelled, unless it has already finished."""
+
+    def __init__(self, code: Optional[grpc.StatusCode] = None) -> None:
+        self.status_code = code
+        self.callbacks: List[Callable[[Any], None]] = []
+
+    def add_done_callback(self, callback: Callable[[Any], None]) -> None:
+        if self.status_code is None:
+            self.callbacks.append(callback)
+        else:
+            callback(self)
+
+    def cancel(self) -> bool:
+        if self.status_code is not None:
+            return False
+        self.status_code = grpc.StatusCode.CANCELLED
+        for callback in self.callbacks:
+            callback(self)
+        return True
+
+    def code(self) -> Optional[grpc.StatusCode]:
+        return self.status_code
+
+    def details(self) -> Optional[str]:
+        return None
+
+
+def test_cancel_during_backoff() -> None:
+    """Test a retry started as its call is cancelled is cancelled too."""
+    attempts = [PendingCall(grpc.StatusCode.UNAVAILABLE), PendingCall()]
+    started = threading.Event()
+    started_attempts: List[PendingCall] = []
+
+    def start() -> PendingCall:
+        attempt = attempts[len(started_attempts)]
+        started_attempts.append(attempt)
+        if len(started_attempts) == 2:
+            retrying_call.cancel()
+            started.set()
+        return attempt
+
+    retrying_call = RetryingCall(SzRetryPolicy(initial_backoff=0.01), "/szengine.SzEngine/GetActiveConfigId", start)
+    assert started.wait(5)
+    assert retrying_call.cancelled()
+    assert attempts[1].code() == grpc.StatusCode.CANCELLED
+
+
+def test_is_retryable() -> None:
+    """Test SzRetryPolicy.is_retryable() with status codes and Senzing errors."""
+    retry_policy = SzRetryPolicy()
+    retryable = FinishedCall(grpc.StatusCode.UNKNOWN, json.dumps({"reason": "SENZ0010|Retry timeout exceeded"}))
+    not_found = FinishedCall(grpc.StatusCode.UNKNOWN, json.dumps({"reason": "SENZ0033|Unknown record"}))
+    unavailable = FinishedCall(grpc.StatusCode.UNAVAILABLE)
+    assert retry_policy.is_retryable("/szengine.SzEngine/GetRedoRecord", retryable)
+    assert not retry_policy.is_retryable("/szengine.SzEngine/GetRecord", not_found)
+    assert retry_policy.is_retryable("/szengine.SzEngine/AddRecord", unavailable)
+    assert not retry_policy.is_retryable("/szengine.SzEngine/GetRedoRecord", unavailable)
+    assert not retry_policy.is_retryable("/szengine.SzEngine/AddRecord", FinishedCall(grpc.StatusCode.OK))
+
+
+def test_constructor_bad_max_attempts() -> None:
+    """Test SzRetryPolicy constructor with a bad max_attempts."""
+    with pytest.raises(ValueError):
+        SzRetryPolicy(max_attempts=0)
+
+
+def test_reset_stats() -> None:
+    """Test SzRetryPolicy.reset_stats()."""
+    retry_policy = SzRetryPolicy()
+    sz_engine = SzEngineGrpc(get_grpc_channel(), retry_policy=retry_policy)
+    sz_engine.get_active_config_id()
+    assert retry_policy.stats()["calls"] == 1
+    retry_policy.reset_stats()
+    assert retry_policy.stats()["calls"] == 0
@@ -0,0 +1,168 @@
+#! /usr/bin/env python3
+
+# pylint: disable=E1101
+
+import json
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Any, List
+
+import grpc
+import pytest
+from senzing import SZ_WITHOUT_INFO, SzNotFoundError
+from senzing_grpc_protobuf import szengine_pb2
+
+from senzing_grpc import SzAbstractFactoryGrpc, SzEngineGrpc, SzSingleFlight
+from senzing_grpc.szhelpers import ClientCallDetails
+from senzing_grpc.szsingleflight import canonical_request
+
+from .helpers import get_grpc_channel
+
+# -----------------------------------------------------------------------------
+# Test cases
+# -----------------------------------------------------------------------------
+
+
+def test_concurrent_futures_share_calls() -> None:
+    """Test identical reads started together share calls and all get the same result."""
+    single_flight = SzSingleFlight()
+    sz_engine = SzEngineGrpc(get_grpc_channel(), single_flight=single_flight)
+    sz_engine.add_record("TEST", "FLIGHT-1", "{}", SZ_WITHOUT_INFO)
+    futures = [sz_engine.futures.get_entity_by_record_id("TEST", "FLIGHT-1") for _ in range(100)]
+    wait(futures)
+    sz_engine.delete_record("TEST", "FLIGHT-1")
+    stats = single_flight.stats()
+    assert len({future.result() for future in futures}) == 1
+    assert stats["calls"] == 100
+    assert stats["flights"] + stats["coalesced"] == 100
+    assert stats["coalesced"] > 0
+    assert stats["in_flight"] == 0
+
+
+def test_concurrent_threads() -> None:
+    """Test blocking reads from many threads through a factory."""
+    single_flight = SzSingleFlight()
+    sz_abstract_factory = SzAbstractFactoryGrpc(get_grpc_channel(), single_flight=single_flight)
+    sz_engine = sz_abstract_factory.create_engine()
+    sz_engine.add_record("TEST", "FLIGHT-2", "{}", SZ_WITHOUT_INFO)
+    with ThreadPoolExecutor(max_workers=20) as executor:
+        results = list(executor.map(lambda _: sz_engine.get_entity_by_record_id("TEST", "FLIGHT-2"), range(200)))
+    sz_engine.delete_record("TEST", "FLIGHT-2")
+    stats = single_flight.stats()
+    assert len(set(results)) == 1
+    assert stats["flights"] + stats["coalesced"] == 200
+    assert stats["in_flight"] == 0
+
+
+def test_error_is_shared() -> None:
+    """Test every caller sharing a failed call gets the error."""
+    single_flight = SzSingleFlight()
+    sz_engine = SzEngineGrpc(get_grpc_channel(), single_flight=single_flight)
+    futures = [sz_engine.futures.get_entity_by_record_id("TEST", "FLIGHT-DOES-NOT-EXIST") for _ in range(10)]
+    for future in futures:
+        with pytest.raises(SzNotFoundError):
+            future.result()
+    with pytest.raises(SzNotFoundError):
+        sz_engine.get_entity_by_record_id("TEST", "FLIGHT-DOES-NOT-EXIST")
+
+
+def test_writes_are_not_coalesced() -> None:
+    """Test methods outside COALESCED_METHODS are passed through."""
+    single_flight = SzSingleFlight()
+    sz_engine = SzEngineGrpc(get_grpc_channel(), single_flight=single_flight)
+    sz_engine.add_record("TEST", "FLIGHT-3", "{}", SZ_WITHOUT_INFO)
+    sz_engine.delete_record("TEST", "FLIGHT-3")
+    assert single_flight.stats()["calls"] == 0
+
+
+# -----------------------------------------------------------------------------
+# Unique testcases
+# -----------------------------------------------------------------------------
+
+
+class PendingCall:
+    """Stands in for a gRPC call completed by the test."""
+
+    def __init__(self) -> None:
+        self.callbacks: List[Any] = []
+        self.response: Any = None
+        self.was_cancelled = False
+
+    def add_done_callback(self, fn: Any) -> None:
+        self.callbacks.append(fn)
+
+    def cancel(self) -> bool:
+        self.was_cancelled = True
+        return True
+
+    def code(self) -> grpc.StatusCode:
+        return grpc.StatusCode.OK
+
+    def complete(self, response: Any) -> None:
+        self.response = response
+        for callback in self.callbacks:
+            callback(self)
+
+    def result(self, timeout: Any = None) -> Any:
+        _ = timeout
+        return self.response
+
+
+class Request:  # pylint: disable=R0903
+    """Stands in for a request message."""
+
+    def __init__(self, value: bytes) -> None:
+        self.value = value
+
+    def SerializeToString(self, deterministic: bool = False) -> bytes:  # pylint: disable=C0103
+        _ = deterministic
+        return self.value
+
+
+METHOD = "/szengine.SzEngine/GetEntityByEntityId"
+
+
+def call_details() -> ClientCallDetails:
+    return ClientCallDetails(METHOD, None, None, None, None, None)
+
+
+def test_one_call_for_identical_requests() -> None:
+    """Test identical requests in flight make one call and a later request makes another."""
+    single_flight = SzSingleFlight()
+    calls: List[PendingCall] = []
+
+    def continuation(_: Any, __: Any) -> PendingCall:
+        calls.append(PendingCall())
+        return calls[-1]
+
+    waiters = [single_flight.intercept_unary_unary(continuation, call_details(), Request(b"1")) for _ in range(5)]
+    other = single_flight.intercept_unary_unary(continuation, call_details(), Request(b"2"))
+    assert len(calls) == 2
+    calls[0].complete("response")
+    assert [waiter.result() for waiter in waiters] == ["response"] * 5
+    assert not other.done()
+    single_flight.intercept_unary_unary(continuation, call_details(), Request(b"1"))
+    assert len(calls) == 3
+    assert single_flight.stats() == {"calls": 7, "flights": 3, "coalesced": 4, "in_flight": 2}
+
+
+def test_cancel_waits() -> None:
+    """Test the shared call is cancelled only when every caller cancelled."""
+    single_flight = SzSingleFlight()
+    call = PendingCall()
+    first = single_flight.intercept_unary_unary(lambda *_: call, call_details(), Request(b"1"))
+    second = single_flight.intercept_unary_unary(lambda *_: call, call_details(), Request(b"1"))
+    assert first.cancel()
+    assert first.cancelled()
+    assert not call.was_cancelled
+    assert second.cancel()
+    assert call.was_cancelled
+    assert single_flight.stats()["in_flight"] == 0
+
+
+def test_canonical_request() -> None:
+    """Test JSON attributes differing only in key order give the same key."""
+    first = szengine_pb2.SearchByAttributesRequest(attributes=json.dumps({"NAME": "A", "DOB": "1"}), flags=1)
+    second = szengine_pb2.SearchByAttributesRequest(attributes=json.dumps({"DOB": "1", "NAME": "A"}), flags=1)
+    third = szengine_pb2.SearchByAttributesRequest(attributes=json.dumps({"DOB": "1", "NAME": "A"}), flags=2)
+    assert canonical_request(first) == canonical_request(second)
+    assert canonical_request(first) != canonical_request(third)